@@ -0,0 +1,4 @@
+window.SHT_QR = {
+  "baseUrl": "",
+  "files": {}
+};
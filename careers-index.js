@@ -0,0 +1,44 @@
+window.SHT_CAREERS_INDEX = [
+  {"slug":"3d-animator","title":"3D Animator","category":"design","description":"Bring characters to life for movies, games, and epic adventures!","thumb":"./assets/doc-images/3d-animator-1.jpg"},
+  {"slug":"aerospace-engineer","title":"Aerospace Engineer","category":"engineering","description":"Design rockets, build spacecraft, and launch into the future!","thumb":"./assets/doc-images/aerospace-engineer-1.png"},
+  {"slug":"ai-genomic-engineer","title":"AI Genomic Engineer","category":"data","description":"Sit at the cutting edge of artificial intelligence + genetics, using powerful algorithms to decode DNA, predict disease, and personalize medicine","thumb":"./assets/doc-images/ai-genomic-engineer-1.jpg"},
+  {"slug":"ai-product-manager","title":"AI Product Manager","category":"data","description":"Lead AI products from idea to launch - balancing users, data, and impact!","thumb":"./assets/doc-images/ai-product-manager-1.jpg"},
+  {"slug":"ai-prompt-engineer","title":"AI Prompt Engineer","category":"data","description":"Write prompts that turn AI into a powerful tool for learning and creating!","thumb":"./assets/doc-images/ai-prompt-engineer-1.jpg"},
+  {"slug":"ai-researcher","title":"AI Researcher","category":"data","description":"Teach machines to think, learn, and solve real-world problems!","thumb":"./assets/doc-images/ai-researcher-1.jpg"},
+  {"slug":"ai-security-analyst","title":"AI Security Analyst","category":"data","description":"Secure AI systems and stop new kinds of digital threats!","thumb":"./assets/doc-images/ai-security-analyst-1.jpg"},
+  {"slug":"ai-ml-engineer","title":"AI/ML Engineer","category":"data","description":"Build models that learn from data and power real products!","thumb":"./assets/doc-images/ai-ml-engineer-1.jpg"},
+  {"slug":"architect","title":"Architect","category":"design","description":"Sketch bold buildings and design the spaces where people thrive!","thumb":"./assets/doc-images/architect-1.jpg"},
+  {"slug":"astronaut","title":"Astronaut","category":"technology","description":"Train for space missions and explore beyond Earth!","thumb":"./assets/doc-images/astronaut-1.png"},
+  {"slug":"astronomer","title":"Astronomer","category":"science","description":"Explore galaxies, study stars, and unlock the secrets of space!","thumb":"./assets/doc-images/astronomer-1.jpg"},
+  {"slug":"astrophysicist","title":"Astrophysicist","category":"science","description":"Explore the biggest mysteries of the universe—from black holes and distant galaxies to the origins of space and time","thumb":"./assets/doc-images/astrophysicist-1.jpg"},
+  {"slug":"biomedical-engineer","title":"Biomedical Engineer","category":"engineering","description":"Invent life-saving tech like prosthetics and surgical robots!","thumb":"./assets/doc-images/biomedical-engineer-1.png"},
+  {"slug":"biotech-scientist","title":"Biotech Scientist","category":"science","description":"Use science to cure diseases, grow food, and change the world!","thumb":"./assets/doc-images/biotech-scientist-1.jpg"},
+  {"slug":"chemist","title":"Chemist","category":"science","description":"Mix, test, and invent new materials, medicine, and makeup!","thumb":"./assets/doc-images/chemist-1.jpg"},
+  {"slug":"civil-engineer","title":"Civil Engineer","category":"engineering","description":"Design the roads, bridges, and cities of tomorrow!","thumb":"./assets/doc-images/civil-engineer-1.png"},
+  {"slug":"climate-scientist","title":"Climate Scientist","category":"science","description":"Use science to protect our planet and fight climate change!","thumb":"./assets/doc-images/climate-scientist-1.png"},
+  {"slug":"customer-success-manager","title":"Customer Success Manager","category":"technology","description":"Help customers succeed with technology and build strong relationships!","thumb":"./assets/doc-images/customer-success-manager-1.jpg"},
+  {"slug":"cybersecurity-analyst","title":"Cybersecurity Analyst","category":"technology","description":"Stop hackers, protect secrets, and be a digital hero in tech!","thumb":"./assets/doc-images/cybersecurity-analyst-1.jpg"},
+  {"slug":"data-scientist","title":"Data Scientist","category":"data","description":"Discover hidden trends in data to predict, plan, and innovate!","thumb":"./assets/doc-images/data-scientist-1.png"},
+  {"slug":"digital-marketer","title":"Digital Marketer","category":"design","description":"Create viral content, grow brands, and own the internet!","thumb":"./assets/doc-images/digital-marketer-1.png"},
+  {"slug":"environmental-engineer","title":"Environmental Engineer","category":"engineering","description":"Tackle pollution and build a cleaner, greener world!","thumb":"./assets/doc-images/environmental-engineer-1.jpg"},
+  {"slug":"forensic-scientist","title":"Forensic Scientist","category":"science","description":"Solve mysteries with science and bring truth to light!","thumb":"./assets/doc-images/forensic-scientist-1.jpg"},
+  {"slug":"graphic-designer","title":"Graphic Designer","category":"design","description":"Design logos, posters, and visuals that tell powerful stories!","thumb":"./assets/doc-images/graphic-designer-1.jpg"},
+  {"slug":"health-informatics-specialist","title":"Health Informatics Specialist","category":"technology","description":"Use data to save lives and make healthcare smarter!","thumb":"./assets/doc-images/health-informatics-specialist-1.jpg"},
+  {"slug":"it-support-specialist","title":"IT Support Specialist","category":"technology","description":"Be the tech wizard who solves problems and keeps people connected!","thumb":"./assets/doc-images/it-support-specialist-1.png"},
+  {"slug":"marine-biologist","title":"Marine Biologist","category":"science","description":"Dive into oceans, study sea life, and protect underwater worlds!","thumb":"./assets/doc-images/marine-biologist-1.png"},
+  {"slug":"mechanical-engineer","title":"Mechanical Engineer","category":"engineering","description":"Build robots, engines, and everything that moves or spins!","thumb":"./assets/doc-images/mechanical-engineer-1.jpg"},
+  {"slug":"robotics-engineer","title":"Robotics Engineer","category":"engineering","description":"Design futuristic robots that explore, build, and help humans!","thumb":"./assets/doc-images/robotics-engineer-1.jpg"},
+  {"slug":"social-media-producer","title":"Social Media Producer","category":"design","description":"Create scroll-stopping content and build online communities!","thumb":"./assets/doc-images/social-media-producer-1.jpg"},
+  {"slug":"software-engineer","title":"Software Engineer","category":"engineering","description":"Code cool apps, build tech tools, and shape the digital world!","thumb":"./assets/doc-images/software-engineer-1.png"},
+  {"slug":"sound-engineer","title":"Sound Engineer","category":"engineering","description":"Mix beats, fine-tune audio, and make everything sound amazing!","thumb":"./assets/doc-images/sound-engineer-1.jpg"},
+  {"slug":"stem-educator","title":"STEM Educator","category":"technology","description":"Inspire future innovators and lead STEM learning forward!","thumb":"./assets/doc-images/stem-educator-1.jpg"},
+  {"slug":"sustainability-analyst","title":"Sustainability Analyst","category":"data","description":"Use data to help organizations cut waste and protect the planet!","thumb":"./assets/doc-images/sustainability-analyst-1.png"},
+  {"slug":"tech-choreographer","title":"Tech Choreographer","category":"design","description":"Create high-tech dance shows that light up the stage!","thumb":"./assets/doc-images/tech-choreographer-1.jpg"},
+  {"slug":"tech-entrepreneur","title":"Tech Entrepreneur","category":"design","description":"Turn bold ideas into real-world solutions using technology","thumb":"./assets/doc-images/tech-entrepreneur-1.png"},
+  {"slug":"uav-pilot-drone-operator","title":"UAV Pilot / Drone Operator","category":"engineering","description":"Fly drones for filming, mapping, and search-and-rescue missions!","thumb":"./assets/doc-images/uav-pilot-drone-operator-1.jpg"},
+  {"slug":"ui-ux-designer","title":"UI/UX Designer","category":"design","description":"Design fun, user-friendly apps people love to use every day!","thumb":"./assets/doc-images/ui-ux-designer-1.png"},
+  {"slug":"vibe-coder","title":"Vibe Coder","category":"technology","description":"Prototype ideas fast - mixing code and creativity to build what's next!","thumb":"./assets/doc-images/vibe-coder-1.jpg"},
+  {"slug":"video-game-designer","title":"Video Game Designer","category":"design","description":"Create epic games, design characters, and bring stories to life!","thumb":"./assets/doc-images/video-game-designer-1.jpg"},
+  {"slug":"virtual-production-designer","title":"Virtual Production Designer","category":"design","description":"Create movie magic with virtual sets and XR tech!","thumb":"./assets/doc-images/virtual-production-designer-1.jpg"},
+  {"slug":"web-developer","title":"Web Developer","category":"technology","description":"Build websites that wow the world and power online life!","thumb":"./assets/doc-images/web-developer-1.jpg"}
+];
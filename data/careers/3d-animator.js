@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "3D Animator",
+  "slug": "3d-animator",
+  "category": "design",
+  "description": "Bring characters to life for movies, games, and epic adventures!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,3d,animator",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABQAgCdASoQAAsAA4BaJYwCw7Yul2XLyhB2g4AA/ulMqdcMW6c6d3FbdYIA6wWc3Xslf1QYbbuJ8eP0Rpz37gyVWCvHhca6EVSqTcuXwsTgFjYmi/eLMXNlsGBCwJVzYfYOp+FgAAA=",
+    "heroImageSrc": "./assets/doc-images/3d-animator-1.jpg",
+    "heroImageWidth": 2500
+  }
+};
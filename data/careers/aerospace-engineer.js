@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Aerospace Engineer",
+  "slug": "aerospace-engineer",
+  "category": "engineering",
+  "description": "Design rockets, build spacecraft, and launch into the future!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,aerospace,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 600,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoQAAwAA4BaJYwC7AYubyIahDOEAAD+t/DRfQp9YqWhheB0cQ5yloqIc2YL/NGfZNPHgR0Ipu7FlMnPtMTCa9gQetaNUP7ek1XjDSpljWav7hVGXAyXyAAA",
+    "heroImageSrc": "./assets/doc-images/aerospace-engineer-1.png",
+    "heroImageWidth": 800
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "AI Genomic Engineer",
+  "slug": "ai-genomic-engineer",
+  "category": "data",
+  "description": "Sit at the cutting edge of artificial intelligence + genetics, using powerful algorithms to decode DNA, predict disease, and personalize medicine",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,ai,genomic,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1562,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABQAgCdASoQAAoAA4BaJZQAD48PRfVDNITkXYAA/f0ujOHb1CFgEb5+RPjhHTyl0Duqy5F/RO6TCKxw0Lne6GpNHNPmE6HTpfr8fGKKn/PR7MF4juEJNt738eLbdTgcAAA=",
+    "heroImageSrc": "./assets/doc-images/ai-genomic-engineer-1.jpg",
+    "heroImageWidth": 2500
+  }
+};
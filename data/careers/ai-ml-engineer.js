@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "AI/ML Engineer",
+  "slug": "ai-ml-engineer",
+  "category": "data",
+  "description": "Build models that learn from data and power real products!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,ai,ml,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 629,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAQAgCdASoQAAgAA4BaJZgCdAYvXGC5F+lgAPqfNdqPdP73rY1xV97aqtUlfPcxFz+4De2Dt8sebl/MjCIbIJ+xDC8BjuDEWSASwAID0qRjATPXX4UsAAAA",
+    "heroImageSrc": "./assets/doc-images/ai-ml-engineer-1.jpg",
+    "heroImageWidth": 1200
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "AI Product Manager",
+  "slug": "ai-product-manager",
+  "category": "data",
+  "description": "Lead AI products from idea to launch - balancing users, data, and impact!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,ai,product,manager",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAQAgCdASoQAAsAA4BaJYwCdADwtj6VtxQAAP7wP1okblmVWBeyR9V6eO9v14IGTNdyVok1CYPMmJTaK7CRBCiNA6OBztClbJwVWusgAAA=",
+    "heroImageSrc": "./assets/doc-images/ai-product-manager-1.jpg",
+    "heroImageWidth": 2500
+  }
+};
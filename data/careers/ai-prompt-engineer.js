@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "AI Prompt Engineer",
+  "slug": "ai-prompt-engineer",
+  "category": "data",
+  "description": "Write prompts that turn AI into a powerful tool for learning and creating!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,ai,prompt,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 320,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAACwAQCdASoQAAsAA4BaJQBOgBSZtoskAP5nzMLgeHx4V7hhmxwHlnNINXSyWvwZxf8ZvFS24rAAZ3nCt3r+s7VtNPYgf1xhp1PlcjrZB7yI+QEeAdQh0tyk/WqKR2OY+DgAAA==",
+    "heroImageSrc": "./assets/doc-images/ai-prompt-engineer-1.jpg",
+    "heroImageWidth": 480
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "AI Researcher",
+  "slug": "ai-researcher",
+  "category": "data",
+  "description": "Teach machines to think, learn, and solve real-world problems!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,ai,researcher",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 400,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQAgCdASoQAAsAA4BaJQBdgCHAIRWBgXYAAP70WQSVLUDztlN99l97L9G85yRNsQRn3snmVX4hEfFdY3Srteah/23JwHieascItsWcIC5jSfyDgZ30R7wSydbFQLAA",
+    "heroImageSrc": "./assets/doc-images/ai-researcher-1.jpg",
+    "heroImageWidth": 600
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "AI Security Analyst",
+  "slug": "ai-security-analyst",
+  "category": "data",
+  "description": "Secure AI systems and stop new kinds of digital threats!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,ai,security,analyst",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1080,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAQCdASoQAAkAA4BaJQBOgB7HbQp4AP7tJ5/1a3a4cO4ClOuuNdZvjQu7lDBHmcqNj4yDPQFAU8UAIWpyk0yQAAA=",
+    "heroImageSrc": "./assets/doc-images/ai-security-analyst-1.jpg",
+    "heroImageWidth": 1920
+  }
+};
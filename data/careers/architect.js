@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Architect",
+  "slug": "architect",
+  "category": "design",
+  "description": "Sketch bold buildings and design the spaces where people thrive!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,architect",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 620,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAwAgCdASoQAAwAA4BaJQBdgMWl5ABdAAP0AAD+7mIyBCRQdGAsx1zKkjfK9GlQUTPHAvMbvmXmOH9jIcrFcLT1jjGe8B14y57W6p6c8B1EnTzKJ/qVbFneXD7X9saEobkkAAAA",
+    "heroImageSrc": "./assets/doc-images/architect-1.jpg",
+    "heroImageWidth": 800
+  }
+};
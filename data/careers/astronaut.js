@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Astronaut",
+  "slug": "astronaut",
+  "category": "technology",
+  "description": "Train for space missions and explore beyond Earth!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,astronaut",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 657,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAABQAgCdASoQAAsAA4BaJZQAD5MPADOj9zkBepAA/uX0VQB/LeX5mkYBeu8eHJPgL/9Ab0F08bjD+LIOo2x1uZGHfu/JC+u1CLwG0pnoRcMnpdgUvg+8DhN8TtbvdZVLd3DbyBUQl60dplKAA3AAAA==",
+    "heroImageSrc": "./assets/doc-images/astronaut-1.png",
+    "heroImageWidth": 985
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Astronomer",
+  "slug": "astronomer",
+  "category": "science",
+  "description": "Explore galaxies, study stars, and unlock the secrets of space!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,astronomer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 830,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADQAQCdASoQAA0AA4BaJZQAAup2Vu96gAD+zfv4xD4Yt9tFaIpSy3qAyVPAoNKCB3SCU4Idp5BSdKAhiuVQ0f3nKKKju9DEzRhMhTOG7DCcJRPeC7yDrhsgAAA=",
+    "heroImageSrc": "./assets/doc-images/astronomer-1.jpg",
+    "heroImageWidth": 1024
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Astrophysicist",
+  "slug": "astrophysicist",
+  "category": "science",
+  "description": "Explore the biggest mysteries of the universe—from black holes and distant galaxies to the origins of space and time",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,astrophysicist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 567,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAADQAQCdASoQAAkAA4BaJQBOgMWqjEkgiAD2dTCT2Pn/2RWg3KEFd4pMYfq3SDu8j8Q8C+XQdQXqAKAP197FV5T5KWn0pH8FeyGOF8LWVUQdC5WUqpoLre8BB16IAAAA",
+    "heroImageSrc": "./assets/doc-images/astrophysicist-1.jpg",
+    "heroImageWidth": 996
+  }
+};
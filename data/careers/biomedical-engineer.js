@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Biomedical Engineer",
+  "slug": "biomedical-engineer",
+  "category": "engineering",
+  "description": "Invent life-saving tech like prosthetics and surgical robots!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,biomedical,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 224,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQAgCdASoQAAoAA4BaJQBOgMXIlngU8RsAAP4IHWWZ19+ovIxzUpkCW4yHVRePqkXDQx2kgJGLJXakAS/9pHdWL8McMfSJA+skllmRKzz3rzY7DMvOF69+0DHdAAAA",
+    "heroImageSrc": "./assets/doc-images/biomedical-engineer-1.png",
+    "heroImageWidth": 360
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Biotech Scientist",
+  "slug": "biotech-scientist",
+  "category": "science",
+  "description": "Use science to cure diseases, grow food, and change the world!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,biotech,scientist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 720,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoQAAwAA4BaJbACw7Dcqg1Q02GgAP71ocZCXQjswKmaInBgnRVC3WXxzz0f6hBbglmGi7VtM9gvDyyyFz7B5ZobDaenfEhSUJaD4PARP+Z7Cr9SWgAAAA==",
+    "heroImageSrc": "./assets/doc-images/biotech-scientist-1.jpg",
+    "heroImageWidth": 956
+  }
+};
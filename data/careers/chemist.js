@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Chemist",
+  "slug": "chemist",
+  "category": "science",
+  "description": "Mix, test, and invent new materials, medicine, and makeup!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,chemist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 821,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAQCdASoQAAsAA4BaJQBOgBT79ECYAP6RKw34nlaKYq1FxCGmC8jEn0QVR/9Nceup3uquwHQPnzjtvaU8DCX9J51IjQWj/HCSVIrHLOM7IPaTAXQAAA==",
+    "heroImageSrc": "./assets/doc-images/chemist-1.jpg",
+    "heroImageWidth": 1232
+  }
+};
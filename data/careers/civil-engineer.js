@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Civil Engineer",
+  "slug": "civil-engineer",
+  "category": "engineering",
+  "description": "Design the roads, bridges, and cities of tomorrow!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,civil,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 720,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAkAA4BaJQBOgB6RlZsbgAD+9hPL1doRnAodS4l/MvyIKDasjSeuai8gUysrkpbSggvs49Fi7eT+0gcke10IUIbgAA==",
+    "heroImageSrc": "./assets/doc-images/civil-engineer-1.png",
+    "heroImageWidth": 1280
+  }
+};
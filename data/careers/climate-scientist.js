@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Climate Scientist",
+  "slug": "climate-scientist",
+  "category": "science",
+  "description": "Use science to protect our planet and fight climate change!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,climate,scientist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 422,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoQAAkAA4BaJQAB8Y3F6E3tN5AA/sKbE2evdzcfQKoSvXitWffMFlNEzf57q/OhaZ7bnoeeXjxC59BX8GeaO5PyFIJG+8su1V0emB6v+TGRtrkyuAA=",
+    "heroImageSrc": "./assets/doc-images/climate-scientist-1.png",
+    "heroImageWidth": 750
+  }
+};
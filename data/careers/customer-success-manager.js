@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Customer Success Manager",
+  "slug": "customer-success-manager",
+  "category": "technology",
+  "description": "Help customers succeed with technology and build strong relationships!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,customer,success,manager",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 2048,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAABQAgCdASoQABAAA4BaJZgCdIExgqyZeKeLIgAA/nk/Pp9G+hOTX3uqmWKSHz83iLeYDpuVjNh46lMGIJUYxozLiVOPpxOfRUioi7uXUFtNBVrWj4N4V2OM+ONn4ibpSvfUx7/1cQqa3GiS/fbM6/Tld3wY6sCGFlTznz56BzzFbAAA",
+    "heroImageSrc": "./assets/doc-images/customer-success-manager-1.jpg",
+    "heroImageWidth": 2048
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Cybersecurity Analyst",
+  "slug": "cybersecurity-analyst",
+  "category": "technology",
+  "description": "Stop hackers, protect secrets, and be a digital hero in tech!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,cybersecurity,analyst",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1406,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAACwAQCdASoQAAkAA4BaJagCdADYC+sAAP7aLRrit1f+rFw5hsBwcog4cEw6sF/+4DUnM4vnCqANkTPUHC0kHYhbhBJiUZZ4WBtGnPzfuyOd5i9l6UnjkgAA",
+    "heroImageSrc": "./assets/doc-images/cybersecurity-analyst-1.jpg",
+    "heroImageWidth": 2500
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Data Scientist",
+  "slug": "data-scientist",
+  "category": "data",
+  "description": "Discover hidden trends in data to predict, plan, and innovate!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,data,scientist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 446,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAABwAgCdASoQABAAA4BaJbACdAYtB2rwHa6rbgPAAP59TGft1Wb9Yo0xs2If/+KZimhLs+bayktr1AQxyLWBGTMdP7q8jtHDX2n0LR1ffaD4kC7WoNE2yeE+rfgJXHw7AaWQU7VX/cPQK/4j6c5G4Mpkj/kvTSvnF5r/doAIAAA=",
+    "heroImageSrc": "./assets/doc-images/data-scientist-1.png",
+    "heroImageWidth": 439
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Digital Marketer",
+  "slug": "digital-marketer",
+  "category": "design",
+  "description": "Create viral content, grow brands, and own the internet!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,digital,marketer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 630,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQAAgAA4BaJYgCdIExgoiR4lj0bcQA/f0+bjbiY4EdLzOeDow2jU/tuAH4MwT6MxObu/jsBPXBpMsIoVnec2zWHlk6IwjgRgvExjzRh2hUeXa3KKAAAA==",
+    "heroImageSrc": "./assets/doc-images/digital-marketer-1.png",
+    "heroImageWidth": 1200
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Environmental Engineer",
+  "slug": "environmental-engineer",
+  "category": "engineering",
+  "description": "Tackle pollution and build a cleaner, greener world!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,environmental,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 300,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAQCdASoQAAgAA4BaJbACdGuAATrckLAA/sQB4RyLRdVUqCb2hG1Uwhb2qTsdJysXSl63F2GqjgtSha2bEOu/TK392Arei9dz4pB7cHZCPAAA",
+    "heroImageSrc": "./assets/doc-images/environmental-engineer-1.jpg",
+    "heroImageWidth": 640
+  }
+};
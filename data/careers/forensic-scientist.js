@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Forensic Scientist",
+  "slug": "forensic-scientist",
+  "category": "science",
+  "description": "Solve mysteries with science and bring truth to light!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,forensic,scientist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 933,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAQCdASoQAAsAA4BaJZwAAn1yDYSItrAA/snjxukrfc7mcf6bA4bN518xBqxEu/I1mg/PzJP+hFwYexSk4YafijTRuFEU1C0MseSp0vHJ0UjfZjPM4hNrXVWWLfMt5N+HoAAA",
+    "heroImageSrc": "./assets/doc-images/forensic-scientist-1.jpg",
+    "heroImageWidth": 1400
+  }
+};
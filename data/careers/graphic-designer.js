@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Graphic Designer",
+  "slug": "graphic-designer",
+  "category": "design",
+  "description": "Design logos, posters, and visuals that tell powerful stories!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,graphic,designer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAQAgCdASoQAAsAA4BaJYgCdADvgZ4fU5CAAPwoLIvqBw3N9X+TXVgVFxAttebuA+/Jz6yOv6BCq6HY2/KQrv6uGOrNBqnBwnPXu3sXNAPk/KBszgRXBTSLxNt1JxvSXgEAAA==",
+    "heroImageSrc": "./assets/doc-images/graphic-designer-1.jpg",
+    "heroImageWidth": 2500
+  }
+};
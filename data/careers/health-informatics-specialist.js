@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Health Informatics Specialist",
+  "slug": "health-informatics-specialist",
+  "category": "technology",
+  "description": "Use data to save lives and make healthcare smarter!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,health,informatics,specialist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 529,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAQCdASoQAAkAA4BaJYgC7ADMRxFcAAD+hBj2kmr9DH2bft5y3o2jm/GpvgCFmf98t3nHKDVWLP9Ppi1aNsgk7Y6/zZ+aft1AJOG4P4GKEK2hbIUF02GvbGejduAAAAA=",
+    "heroImageSrc": "./assets/doc-images/health-informatics-specialist-1.jpg",
+    "heroImageWidth": 940
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "IT Support Specialist",
+  "slug": "it-support-specialist",
+  "category": "technology",
+  "description": "Be the tech wizard who solves problems and keeps people connected!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,it,support,specialist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1200,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAABQAgCdASoQAAwAA4BaJQBOgMXX5zeec42PawAA/uCP2T3n8v4KoGJOWzHo/c/hz9zFjOOiyBCvk2qOvQlxus6/MAZx8ydWQzjN260iRTIYZriJOuJwrqSQ8zFif7HWXFA+DbNL+7dpUEMDQl1CDQAA",
+    "heroImageSrc": "./assets/doc-images/it-support-specialist-1.png",
+    "heroImageWidth": 1600
+  }
+};
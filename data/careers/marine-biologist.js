@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Marine Biologist",
+  "slug": "marine-biologist",
+  "category": "science",
+  "description": "Dive into oceans, study sea life, and protect underwater worlds!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,marine,biologist",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 732,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABQAgCdASoQAAsAA4BaJbACdAYvrbTds8eF3AAA/vBzcc0fjNiGXOMYUCoZZMgYTsk3nfO567el9gO4ph2/CMiMDUramfRuGMMIfFK6WxjZThHviU4tFZ432JkCGFF4zJgAAA==",
+    "heroImageSrc": "./assets/doc-images/marine-biologist-1.png",
+    "heroImageWidth": 1100
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Mechanical Engineer",
+  "slug": "mechanical-engineer",
+  "category": "engineering",
+  "description": "Build robots, engines, and everything that moves or spins!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,mechanical,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 800,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAAAQAgCdASoQAAsAA4BaJaACdAYuHWqG7lUkAP7YL5uzODMXJ20ZAfncZpIsUns7wa42RU/LUdZmV7ukbzciRQKtv+8kvumQiWQm8b+E8Md9uc/nTkFxC4+sLhF+05E7UjWXH/kQtYbMAAAA",
+    "heroImageSrc": "./assets/doc-images/mechanical-engineer-1.jpg",
+    "heroImageWidth": 1175
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Robotics Engineer",
+  "slug": "robotics-engineer",
+  "category": "engineering",
+  "description": "Design futuristic robots that explore, build, and help humans!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,robotics,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAABQAgCdASoQAAsAA4BaJbACdH8AFN9sYkDXlAAA/P3uDKaD1b57FHsp/PRKkGS1RNMlRbxoVfHgSvhiucB6QhvrZ21bgaxqk1msLBMKTT05bBZvLk9W6kurE6mVxkGNHajBi1Isx4CIE83f3q6PQAAA",
+    "heroImageSrc": "./assets/doc-images/robotics-engineer-1.jpg",
+    "heroImageWidth": 2500
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Social Media Producer",
+  "slug": "social-media-producer",
+  "category": "design",
+  "description": "Create scroll-stopping content and build online communities!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,social,media,producer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 573,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAAAQAgCdASoQAAwAA4BaJbACdAYrxuKvv7mQAP72RrTi/BHmhIIy3Oy+YlqPux44LI19aIYDc5yv1acuRfNWKBUPTWNldXAyUtQdF+7MSFpGXNMXMIbN6+9ZG17k5G2HFaslfs/NxhPqZCwegazWRZzU5MhGM2ZmiRJIEAAA",
+    "heroImageSrc": "./assets/doc-images/social-media-producer-1.jpg",
+    "heroImageWidth": 780
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Software Engineer",
+  "slug": "software-engineer",
+  "category": "engineering",
+  "description": "Code cool apps, build tech tools, and shape the digital world!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,software,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 864,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwAgCdASoQAAwAA4BaJYwCdAYwTwDatssCAAD+iM7fvgkx82l3UmowsGbpxkDBct3rXak/abXuEwHkLdtqQUUxsZzF+F7OITskc1CHRF2/8NOsRFQfRl0F0SAAAA==",
+    "heroImageSrc": "./assets/doc-images/software-engineer-1.png",
+    "heroImageWidth": 1184
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Sound Engineer",
+  "slug": "sound-engineer",
+  "category": "engineering",
+  "description": "Mix beats, fine-tune audio, and make everything sound amazing!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,sound,engineer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 939,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAABQAgCdASoQAA4AA4BaJYwCdAYtLWOlGCZ9IQAA/vNgvMIF17t/nINYIo891vhtM6/5wGDPO+9Lp4DTe/vX3XXbZaSIn/z6iZpJ07jYGGKT5drQJfJ5QP8VVlLaKXyD9rjL47hORvA+dLMpA5bVUTGUJQDMZv/AAAA=",
+    "heroImageSrc": "./assets/doc-images/sound-engineer-1.jpg",
+    "heroImageWidth": 1080
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "STEM Educator",
+  "slug": "stem-educator",
+  "category": "technology",
+  "description": "Inspire future innovators and lead STEM learning forward!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,stem,educator",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 1200,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABwAgCdASoQAAsAA4BaJbACdAYq/2iVePygM8gAAPqfoD5jVtG6mv57/PgJfuUPOat5XOMqNZgZNp9kngNUlMABDBxEdILtIfK0D89nE+VpnqNYlhZzxR2dA2QG7fUZq8v8wYgUrDHtjW7C+OvkZgyhbYApnIAA",
+    "heroImageSrc": "./assets/doc-images/stem-educator-1.jpg",
+    "heroImageWidth": 1800
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Sustainability Analyst",
+  "slug": "sustainability-analyst",
+  "category": "data",
+  "description": "Use data to help organizations cut waste and protect the planet!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,sustainability,analyst",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 801,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAQCdASoQAAsAA4BaJZwAAn6t8LaAAP7fH747t+0n2Z5jLOEZnzT9jcLKHpZb2UP8KT2CXAZLcTecKDTP+yrrVl3U7HueLhi1Uwt2rHy1bxqWwrAAAA==",
+    "heroImageSrc": "./assets/doc-images/sustainability-analyst-1.png",
+    "heroImageWidth": 1200
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Tech Choreographer",
+  "slug": "tech-choreographer",
+  "category": "design",
+  "description": "Create high-tech dance shows that light up the stage!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,tech,choreographer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 328,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAADwAQCdASoQAAsAA4BaJQBdgBwwuelq/CgA/Sjy/Pgmkt7N/uV7z+OOybAp4Fa38yKQqxLgyr8cAzrztiuCtFbnNkWJLLDhUzRvEcw93BKuTYN1AcnVUFTA22RBcwcAJGsAJ0eb2yUAAA==",
+    "heroImageSrc": "./assets/doc-images/tech-choreographer-1.jpg",
+    "heroImageWidth": 500
+  }
+};
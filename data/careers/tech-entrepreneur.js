@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Tech Entrepreneur",
+  "slug": "tech-entrepreneur",
+  "category": "design",
+  "description": "Turn bold ideas into real-world solutions using technology",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,tech,entrepreneur",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAQAgCdASoQAAsAA4BaJZQAD4lvOp1ddsRgAP5zPRQVrp3HlMnuuO1xiItLyxMgtBDj7glAXTTAppFmIg4DZJwYKBZTTlAZnndaJ/LyJn676etkSw4qA8BpD0cnix4KEllsic5wADQAAA==",
+    "heroImageSrc": "./assets/doc-images/tech-entrepreneur-1.png",
+    "heroImageWidth": 1000
+  }
+};
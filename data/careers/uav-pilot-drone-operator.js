@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "UAV Pilot / Drone Operator",
+  "slug": "uav-pilot-drone-operator",
+  "category": "engineering",
+  "description": "Fly drones for filming, mapping, and search-and-rescue missions!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,uav,pilot,drone,operator",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 813,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAgAA4BaJYgCdAEfPIII0kAA+OXlGG0vxbBFfzx8d+0R1+eaDeMZx5ylrbUVT5vf9ZZRNImaMCU7L9wAAA==",
+    "heroImageSrc": "./assets/doc-images/uav-pilot-drone-operator-1.jpg",
+    "heroImageWidth": 1568
+  }
+};
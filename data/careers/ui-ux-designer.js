@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "UI/UX Designer",
+  "slug": "ui-ux-designer",
+  "category": "design",
+  "description": "Design fun, user-friendly apps people love to use every day!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,ui,ux,designer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 232,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAwAgCdASoQABAAA4BaJQBOgMX1mEATSu+rgADiezGi7rwaB6YA3c9ZykDuG3WXPNN0NK8RYWMZbPZl+QBXIsDzADVK59q1MNlHU3q9wqzxITwg5eWBd4Ix9iXRJ07Ip1Njf3tjDdpvwnWJlVzenx+SSszBcH6AAAA=",
+    "heroImageSrc": "./assets/doc-images/ui-ux-designer-1.png",
+    "heroImageWidth": 232
+  }
+};
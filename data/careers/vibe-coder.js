@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Vibe Coder",
+  "slug": "vibe-coder",
+  "category": "technology",
+  "description": "Prototype ideas fast - mixing code and creativity to build what's next!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,vibe,coder",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 320,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABQAgCdASoQAAsAA4BaJYwCdAYwTuKx3koJDgAA/uKdMQ+RcawkK81AUaJPBc88s8YdUjfGevEcWfY0Kyotj29i/SKofJjMWXtLgS7ruavHOglVHUVPuhR61HGYptaYfGTrBVgq9E+AAAAA",
+    "heroImageSrc": "./assets/doc-images/vibe-coder-1.jpg",
+    "heroImageWidth": 480
+  }
+};
@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Video Game Designer",
+  "slug": "video-game-designer",
+  "category": "design",
+  "description": "Create epic games, design characters, and bring stories to life!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,video,game,designer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 337,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoQAAkAA4BaJQBOgCPn6f7JAADMmgMqj/FrwP+CKs7RFu/ZLJKHtLM6TvN7SEUtNRr1Nnfvd0J2cx62SxaifIT67zS3UaPEAAA=",
+    "heroImageSrc": "./assets/doc-images/video-game-designer-1.jpg",
+    "heroImageWidth": 600
+  }
+};
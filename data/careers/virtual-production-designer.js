@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Virtual Production Designer",
+  "slug": "virtual-production-designer",
+  "category": "design",
+  "description": "Create movie magic with virtual sets and XR tech!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,virtual,production,designer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 645,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQAAcAA4BaJaQAAsfwYh54ZUAA/q3oSGHEfCkUjuUaN00X+C8Fft48h8euBey3Qo4SEmQ+HAk/eZEizUPnthKBHnRQAA==",
+    "heroImageSrc": "./assets/doc-images/virtual-production-designer-1.jpg",
+    "heroImageWidth": 1400
+  }
+};
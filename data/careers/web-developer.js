@@ -0,0 +1,18 @@
+window.SHT_CAREER = {
+  "title": "Web Developer",
+  "slug": "web-developer",
+  "category": "technology",
+  "description": "Build websites that wow the world and power online life!",
+  "highSchool": [],
+  "college": [],
+  "career": [],
+  "imageDescription": "",
+  "imageQuery": "woman,web,developer",
+  "resources": [],
+  "media": {
+    "heroImageHeight": 512,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAwAgCdASoQAAsAA4BaJQBOgB/4oebJhCPiAAD+8Rf9Tn7BZA67tYc6ke3mdcEZ8j0QnnkO889gL5ChakWveVW6FtwZNqkcUn7gdcTsfS4epNt/ET7kQJSm1T1gAmJzgAA=",
+    "heroImageSrc": "./assets/doc-images/web-developer-1.jpg",
+    "heroImageWidth": 768
+  }
+};
@@ -1,211 +1,337 @@
 window.SHT_DOC_MEDIA = {
   "3d-animator": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABQAgCdASoQAAsAA4BaJYwCw7Yul2XLyhB2g4AA/ulMqdcMW6c6d3FbdYIA6wWc3Xslf1QYbbuJ8eP0Rpz37gyVWCvHhca6EVSqTcuXwsTgFjYmi/eLMXNlsGBCwJVzYfYOp+FgAAA=",
     "heroImageSrc": "./assets/doc-images/3d-animator-1.jpg",
+    "heroImageWidth": 2500,
     "docId": "1fiwTcuhNUEsJlK53v_6b0IXtX65R9W40tl2OSP9o4YQ",
     "title": "3D Animator"
   },
   "aerospace-engineer": {
+    "heroImageHeight": 600,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoQAAwAA4BaJYwC7AYubyIahDOEAAD+t/DRfQp9YqWhheB0cQ5yloqIc2YL/NGfZNPHgR0Ipu7FlMnPtMTCa9gQetaNUP7ek1XjDSpljWav7hVGXAyXyAAA",
     "heroImageSrc": "./assets/doc-images/aerospace-engineer-1.png",
+    "heroImageWidth": 800,
     "docId": "1SWCyg8_6DCH7B5NEEtOANRpNo37s2t4z4cnGU8M_XeQ",
     "title": "Aerospace Engineer"
   },
   "ai-genomic-engineer": {
+    "heroImageHeight": 1562,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABQAgCdASoQAAoAA4BaJZQAD48PRfVDNITkXYAA/f0ujOHb1CFgEb5+RPjhHTyl0Duqy5F/RO6TCKxw0Lne6GpNHNPmE6HTpfr8fGKKn/PR7MF4juEJNt738eLbdTgcAAA=",
     "heroImageSrc": "./assets/doc-images/ai-genomic-engineer-1.jpg",
+    "heroImageWidth": 2500,
     "docId": "18v3Jbebq5Hk8y8DYk6faIP1Pe3FaaT3uxw4-tCGP9Hc",
     "title": "AI Genomic Engineer"
   },
   "ai-product-manager": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAQAgCdASoQAAsAA4BaJYwCdADwtj6VtxQAAP7wP1okblmVWBeyR9V6eO9v14IGTNdyVok1CYPMmJTaK7CRBCiNA6OBztClbJwVWusgAAA=",
     "heroImageSrc": "./assets/doc-images/ai-product-manager-1.jpg",
+    "heroImageWidth": 2500,
     "docId": "1I3JPhL92JOCUzvc_y6Q5JvaUgXLER5tT6OAQHrPTsAo",
     "title": "AI Product Manager"
   },
   "ai-prompt-engineer": {
+    "heroImageHeight": 320,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAACwAQCdASoQAAsAA4BaJQBOgBSZtoskAP5nzMLgeHx4V7hhmxwHlnNINXSyWvwZxf8ZvFS24rAAZ3nCt3r+s7VtNPYgf1xhp1PlcjrZB7yI+QEeAdQh0tyk/WqKR2OY+DgAAA==",
     "heroImageSrc": "./assets/doc-images/ai-prompt-engineer-1.jpg",
+    "heroImageWidth": 480,
     "docId": "1JQHkj5vTC2VOAhsiYsvgFr0cnGaE1ZoAqv41Ug4H69I",
     "title": "AI Prompt Engineer"
   },
   "ai-researcher": {
+    "heroImageHeight": 400,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQAgCdASoQAAsAA4BaJQBdgCHAIRWBgXYAAP70WQSVLUDztlN99l97L9G85yRNsQRn3snmVX4hEfFdY3Srteah/23JwHieascItsWcIC5jSfyDgZ30R7wSydbFQLAA",
     "heroImageSrc": "./assets/doc-images/ai-researcher-1.jpg",
+    "heroImageWidth": 600,
     "docId": "1S62bXu7d_FM-vv_8BacA5QJDemDxUVyA6sGkpwkzQo4",
     "title": "AI Researcher"
   },
   "ai-security-analyst": {
+    "heroImageHeight": 1080,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAQCdASoQAAkAA4BaJQBOgB7HbQp4AP7tJ5/1a3a4cO4ClOuuNdZvjQu7lDBHmcqNj4yDPQFAU8UAIWpyk0yQAAA=",
     "heroImageSrc": "./assets/doc-images/ai-security-analyst-1.jpg",
+    "heroImageWidth": 1920,
     "docId": "1eXs1VeHoBaj7cKazr-duMDMb42YeNQcgce46PqlMY-k",
     "title": "AI Security Analyst"
   },
   "ai-ml-engineer": {
+    "heroImageHeight": 629,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAQAgCdASoQAAgAA4BaJZgCdAYvXGC5F+lgAPqfNdqPdP73rY1xV97aqtUlfPcxFz+4De2Dt8sebl/MjCIbIJ+xDC8BjuDEWSASwAID0qRjATPXX4UsAAAA",
     "heroImageSrc": "./assets/doc-images/ai-ml-engineer-1.jpg",
+    "heroImageWidth": 1200,
     "docId": "1non5zubXht_8mm9e1mmcsrzqSnwyrsAxt9EqwRPZY_o",
     "title": "AI/ML Engineer"
   },
   "architect": {
+    "heroImageHeight": 620,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAwAgCdASoQAAwAA4BaJQBdgMWl5ABdAAP0AAD+7mIyBCRQdGAsx1zKkjfK9GlQUTPHAvMbvmXmOH9jIcrFcLT1jjGe8B14y57W6p6c8B1EnTzKJ/qVbFneXD7X9saEobkkAAAA",
     "heroImageSrc": "./assets/doc-images/architect-1.jpg",
+    "heroImageWidth": 800,
     "docId": "1vPoihV8ZGih8thzT2sdoHaizzMV6P7R1Fe8CEuqauck",
     "title": "Architect"
   },
   "astronaut": {
+    "heroImageHeight": 657,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAABQAgCdASoQAAsAA4BaJZQAD5MPADOj9zkBepAA/uX0VQB/LeX5mkYBeu8eHJPgL/9Ab0F08bjD+LIOo2x1uZGHfu/JC+u1CLwG0pnoRcMnpdgUvg+8DhN8TtbvdZVLd3DbyBUQl60dplKAA3AAAA==",
     "heroImageSrc": "./assets/doc-images/astronaut-1.png",
+    "heroImageWidth": 985,
     "docId": "1t4w_csFh4w5XexhkzcxhEXscHQPIb0nWKLjt1Q1eyKc",
     "title": "Astronaut"
   },
   "astronomer": {
+    "heroImageHeight": 830,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADQAQCdASoQAA0AA4BaJZQAAup2Vu96gAD+zfv4xD4Yt9tFaIpSy3qAyVPAoNKCB3SCU4Idp5BSdKAhiuVQ0f3nKKKju9DEzRhMhTOG7DCcJRPeC7yDrhsgAAA=",
     "heroImageSrc": "./assets/doc-images/astronomer-1.jpg",
+    "heroImageWidth": 1024,
     "docId": "1k-_1cYAdoS7ettfShPrMqp0AqR8ve9nsCf6gNkeZ--Y",
     "title": "Astronomer"
   },
   "astrophysicist": {
+    "heroImageHeight": 567,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAADQAQCdASoQAAkAA4BaJQBOgMWqjEkgiAD2dTCT2Pn/2RWg3KEFd4pMYfq3SDu8j8Q8C+XQdQXqAKAP197FV5T5KWn0pH8FeyGOF8LWVUQdC5WUqpoLre8BB16IAAAA",
     "heroImageSrc": "./assets/doc-images/astrophysicist-1.jpg",
+    "heroImageWidth": 996,
     "docId": "1SKzUfrZHhC_ZwC0KfC78hzm0z7TN1q8o4TUbNO3KKIo",
     "title": "Astrophysicist"
   },
   "biomedical-engineer": {
+    "heroImageHeight": 224,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQAgCdASoQAAoAA4BaJQBOgMXIlngU8RsAAP4IHWWZ19+ovIxzUpkCW4yHVRePqkXDQx2kgJGLJXakAS/9pHdWL8McMfSJA+skllmRKzz3rzY7DMvOF69+0DHdAAAA",
     "heroImageSrc": "./assets/doc-images/biomedical-engineer-1.png",
+    "heroImageWidth": 360,
     "docId": "1c3DVZedJUmLtoc-MayUlJUGo0LInV6LrqAK01bbdv4I",
     "title": "Biomedical Engineer"
   },
   "biotech-scientist": {
+    "heroImageHeight": 720,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoQAAwAA4BaJbACw7Dcqg1Q02GgAP71ocZCXQjswKmaInBgnRVC3WXxzz0f6hBbglmGi7VtM9gvDyyyFz7B5ZobDaenfEhSUJaD4PARP+Z7Cr9SWgAAAA==",
     "heroImageSrc": "./assets/doc-images/biotech-scientist-1.jpg",
+    "heroImageWidth": 956,
     "docId": "1_hQybIuWymW7BoOhRnhgLHfrd6Vf_y27wKfE-QhRbNY",
     "title": "Biotech Scientist"
   },
   "chemist": {
+    "heroImageHeight": 821,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAQCdASoQAAsAA4BaJQBOgBT79ECYAP6RKw34nlaKYq1FxCGmC8jEn0QVR/9Nceup3uquwHQPnzjtvaU8DCX9J51IjQWj/HCSVIrHLOM7IPaTAXQAAA==",
     "heroImageSrc": "./assets/doc-images/chemist-1.jpg",
+    "heroImageWidth": 1232,
     "docId": "1g4rMe3bjEfvo1tuuCKTFuZg4U9FY7DmSElPoe24JlkY",
     "title": "Chemist"
   },
   "civil-engineer": {
+    "heroImageHeight": 720,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAkAA4BaJQBOgB6RlZsbgAD+9hPL1doRnAodS4l/MvyIKDasjSeuai8gUysrkpbSggvs49Fi7eT+0gcke10IUIbgAA==",
     "heroImageSrc": "./assets/doc-images/civil-engineer-1.png",
+    "heroImageWidth": 1280,
     "docId": "1v2Cqx1B89PRLQ33hK30QtAlL5akwmvwG_UqaW3PmGBs",
     "title": "Civil Engineer"
   },
   "climate-scientist": {
+    "heroImageHeight": 422,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoQAAkAA4BaJQAB8Y3F6E3tN5AA/sKbE2evdzcfQKoSvXitWffMFlNEzf57q/OhaZ7bnoeeXjxC59BX8GeaO5PyFIJG+8su1V0emB6v+TGRtrkyuAA=",
     "heroImageSrc": "./assets/doc-images/climate-scientist-1.png",
+    "heroImageWidth": 750,
     "docId": "1j-zlM7KQiOP6AqwzemvVcZvI-H8WMWyoWhbD1tnUaYo",
     "title": "Climate Scientist"
   },
   "customer-success-manager": {
+    "heroImageHeight": 2048,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAABQAgCdASoQABAAA4BaJZgCdIExgqyZeKeLIgAA/nk/Pp9G+hOTX3uqmWKSHz83iLeYDpuVjNh46lMGIJUYxozLiVOPpxOfRUioi7uXUFtNBVrWj4N4V2OM+ONn4ibpSvfUx7/1cQqa3GiS/fbM6/Tld3wY6sCGFlTznz56BzzFbAAA",
     "heroImageSrc": "./assets/doc-images/customer-success-manager-1.jpg",
+    "heroImageWidth": 2048,
     "docId": "1EU6QjwGmzsBgVsn61sHP09A9rjSPtlTIGIGfqW2O7yw",
     "title": "Customer Success Manager"
   },
   "cybersecurity-analyst": {
+    "heroImageHeight": 1406,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAACwAQCdASoQAAkAA4BaJagCdADYC+sAAP7aLRrit1f+rFw5hsBwcog4cEw6sF/+4DUnM4vnCqANkTPUHC0kHYhbhBJiUZZ4WBtGnPzfuyOd5i9l6UnjkgAA",
     "heroImageSrc": "./assets/doc-images/cybersecurity-analyst-1.jpg",
+    "heroImageWidth": 2500,
     "docId": "15SjLf5UTK0icEdREbr6gqjEvuJr3i1bOqy9V37W0P8M",
     "title": "Cybersecurity Analyst"
   },
   "data-scientist": {
+    "heroImageHeight": 446,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAABwAgCdASoQABAAA4BaJbACdAYtB2rwHa6rbgPAAP59TGft1Wb9Yo0xs2If/+KZimhLs+bayktr1AQxyLWBGTMdP7q8jtHDX2n0LR1ffaD4kC7WoNE2yeE+rfgJXHw7AaWQU7VX/cPQK/4j6c5G4Mpkj/kvTSvnF5r/doAIAAA=",
     "heroImageSrc": "./assets/doc-images/data-scientist-1.png",
+    "heroImageWidth": 439,
     "docId": "1GefsxOSfRIN7OTC3zqZIJ_nDHkKJ4Fic315DmU-MzhA",
     "title": "Data Scientist"
   },
   "digital-marketer": {
+    "heroImageHeight": 630,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQAAgAA4BaJYgCdIExgoiR4lj0bcQA/f0+bjbiY4EdLzOeDow2jU/tuAH4MwT6MxObu/jsBPXBpMsIoVnec2zWHlk6IwjgRgvExjzRh2hUeXa3KKAAAA==",
     "heroImageSrc": "./assets/doc-images/digital-marketer-1.png",
+    "heroImageWidth": 1200,
     "docId": "1O5ZF8Ens0-pjbu3UGX7_Zy9urp1bUnfDVgpb95iMask",
     "title": "Digital Marketer"
   },
   "environmental-engineer": {
+    "heroImageHeight": 300,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAQCdASoQAAgAA4BaJbACdGuAATrckLAA/sQB4RyLRdVUqCb2hG1Uwhb2qTsdJysXSl63F2GqjgtSha2bEOu/TK392Arei9dz4pB7cHZCPAAA",
     "heroImageSrc": "./assets/doc-images/environmental-engineer-1.jpg",
+    "heroImageWidth": 640,
     "docId": "1b9K6rB__K_YqaPe6iVo8TApaWERU9qSJ8YOszyqAvCo",
     "title": "Environmental Engineer"
   },
   "forensic-scientist": {
+    "heroImageHeight": 933,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAQCdASoQAAsAA4BaJZwAAn1yDYSItrAA/snjxukrfc7mcf6bA4bN518xBqxEu/I1mg/PzJP+hFwYexSk4YafijTRuFEU1C0MseSp0vHJ0UjfZjPM4hNrXVWWLfMt5N+HoAAA",
     "heroImageSrc": "./assets/doc-images/forensic-scientist-1.jpg",
+    "heroImageWidth": 1400,
     "docId": "15W79EQ3-TnqiOid0l41HXcKfqWXzIkpGe4EXWeoQnNg",
     "title": "Forensic Scientist"
   },
   "graphic-designer": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAQAgCdASoQAAsAA4BaJYgCdADvgZ4fU5CAAPwoLIvqBw3N9X+TXVgVFxAttebuA+/Jz6yOv6BCq6HY2/KQrv6uGOrNBqnBwnPXu3sXNAPk/KBszgRXBTSLxNt1JxvSXgEAAA==",
     "heroImageSrc": "./assets/doc-images/graphic-designer-1.jpg",
+    "heroImageWidth": 2500,
     "docId": "1cOt3ykijfhgBraF_W5WAK1l8BAcVQHNqwRQHbnlDoVA",
     "title": "Graphic Designer"
   },
   "health-informatics-specialist": {
+    "heroImageHeight": 529,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAQCdASoQAAkAA4BaJYgC7ADMRxFcAAD+hBj2kmr9DH2bft5y3o2jm/GpvgCFmf98t3nHKDVWLP9Ppi1aNsgk7Y6/zZ+aft1AJOG4P4GKEK2hbIUF02GvbGejduAAAAA=",
     "heroImageSrc": "./assets/doc-images/health-informatics-specialist-1.jpg",
+    "heroImageWidth": 940,
     "docId": "1ZyvwlEzVTyFR_xUo0sVjg-J_sHEPPJspbu3TGwqrYUE",
     "title": "Health Informatics Specialist"
   },
   "it-support-specialist": {
+    "heroImageHeight": 1200,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAABQAgCdASoQAAwAA4BaJQBOgMXX5zeec42PawAA/uCP2T3n8v4KoGJOWzHo/c/hz9zFjOOiyBCvk2qOvQlxus6/MAZx8ydWQzjN260iRTIYZriJOuJwrqSQ8zFif7HWXFA+DbNL+7dpUEMDQl1CDQAA",
     "heroImageSrc": "./assets/doc-images/it-support-specialist-1.png",
+    "heroImageWidth": 1600,
     "docId": "1u0EFnmYnE6UulRFOBJzygG8GXPGoUGk5jI--ilxeRLo",
     "title": "IT Support Specialist"
   },
   "marine-biologist": {
+    "heroImageHeight": 732,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABQAgCdASoQAAsAA4BaJbACdAYvrbTds8eF3AAA/vBzcc0fjNiGXOMYUCoZZMgYTsk3nfO567el9gO4ph2/CMiMDUramfRuGMMIfFK6WxjZThHviU4tFZ432JkCGFF4zJgAAA==",
     "heroImageSrc": "./assets/doc-images/marine-biologist-1.png",
+    "heroImageWidth": 1100,
     "docId": "1Zjf8Dz6E8DxCw6fTjaFi6ITZb9YLwQvHenr_RhQ0fCs",
     "title": "Marine Biologist"
   },
   "mechanical-engineer": {
+    "heroImageHeight": 800,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAAAQAgCdASoQAAsAA4BaJaACdAYuHWqG7lUkAP7YL5uzODMXJ20ZAfncZpIsUns7wa42RU/LUdZmV7ukbzciRQKtv+8kvumQiWQm8b+E8Md9uc/nTkFxC4+sLhF+05E7UjWXH/kQtYbMAAAA",
     "heroImageSrc": "./assets/doc-images/mechanical-engineer-1.jpg",
+    "heroImageWidth": 1175,
     "docId": "1ZmzaBXzR_v3C6qccNaMTTUJKbGJZjGhYFnW5ZAMhZi0",
     "title": "Mechanical Engineer"
   },
   "robotics-engineer": {
+    "heroImageHeight": 1667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAABQAgCdASoQAAsAA4BaJbACdH8AFN9sYkDXlAAA/P3uDKaD1b57FHsp/PRKkGS1RNMlRbxoVfHgSvhiucB6QhvrZ21bgaxqk1msLBMKTT05bBZvLk9W6kurE6mVxkGNHajBi1Isx4CIE83f3q6PQAAA",
     "heroImageSrc": "./assets/doc-images/robotics-engineer-1.jpg",
+    "heroImageWidth": 2500,
     "docId": "1Y5LfVjjkFa5nMo9dncgJpPC83-FrK-De2ICdX_TT0aI",
     "title": "Robotics Engineer"
   },
   "social-media-producer": {
+    "heroImageHeight": 573,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAAAQAgCdASoQAAwAA4BaJbACdAYrxuKvv7mQAP72RrTi/BHmhIIy3Oy+YlqPux44LI19aIYDc5yv1acuRfNWKBUPTWNldXAyUtQdF+7MSFpGXNMXMIbN6+9ZG17k5G2HFaslfs/NxhPqZCwegazWRZzU5MhGM2ZmiRJIEAAA",
     "heroImageSrc": "./assets/doc-images/social-media-producer-1.jpg",
+    "heroImageWidth": 780,
     "docId": "10SvF0XMFeKpVYwXiylITBQHwfwD6-AXzbOuFyYftU7o",
     "title": "Social Media Producer"
   },
   "software-engineer": {
+    "heroImageHeight": 864,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwAgCdASoQAAwAA4BaJYwCdAYwTwDatssCAAD+iM7fvgkx82l3UmowsGbpxkDBct3rXak/abXuEwHkLdtqQUUxsZzF+F7OITskc1CHRF2/8NOsRFQfRl0F0SAAAA==",
     "heroImageSrc": "./assets/doc-images/software-engineer-1.png",
+    "heroImageWidth": 1184,
     "docId": "1Jgki3Mxz2LDF-0_cTDm2Egqkro28aoAyuAVEe62xYW4",
     "title": "Software Engineer"
   },
   "sound-engineer": {
+    "heroImageHeight": 939,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAABQAgCdASoQAA4AA4BaJYwCdAYtLWOlGCZ9IQAA/vNgvMIF17t/nINYIo891vhtM6/5wGDPO+9Lp4DTe/vX3XXbZaSIn/z6iZpJ07jYGGKT5drQJfJ5QP8VVlLaKXyD9rjL47hORvA+dLMpA5bVUTGUJQDMZv/AAAA=",
     "heroImageSrc": "./assets/doc-images/sound-engineer-1.jpg",
+    "heroImageWidth": 1080,
     "docId": "13KeKRHxfRrRCbGLkJiFig8yYyGaQeLK3nmojbO8rDWs",
     "title": "Sound Engineer"
   },
   "stem-educator": {
+    "heroImageHeight": 1200,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABwAgCdASoQAAsAA4BaJbACdAYq/2iVePygM8gAAPqfoD5jVtG6mv57/PgJfuUPOat5XOMqNZgZNp9kngNUlMABDBxEdILtIfK0D89nE+VpnqNYlhZzxR2dA2QG7fUZq8v8wYgUrDHtjW7C+OvkZgyhbYApnIAA",
     "heroImageSrc": "./assets/doc-images/stem-educator-1.jpg",
+    "heroImageWidth": 1800,
     "docId": "1TCH9Zj2fd5HutLwW_I9ibrmJstpZZ_-EblNBtKrffqQ",
     "title": "STEM Educator"
   },
   "sustainability-analyst": {
+    "heroImageHeight": 801,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAQCdASoQAAsAA4BaJZwAAn6t8LaAAP7fH747t+0n2Z5jLOEZnzT9jcLKHpZb2UP8KT2CXAZLcTecKDTP+yrrVl3U7HueLhi1Uwt2rHy1bxqWwrAAAA==",
     "heroImageSrc": "./assets/doc-images/sustainability-analyst-1.png",
+    "heroImageWidth": 1200,
     "docId": "18bC2jUHzYDNz_0pxyRzfNrP-dyKEhDQx4MQ0iHvDIQw",
     "title": "Sustainability Analyst"
   },
   "tech-choreographer": {
+    "heroImageHeight": 328,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAADwAQCdASoQAAsAA4BaJQBdgBwwuelq/CgA/Sjy/Pgmkt7N/uV7z+OOybAp4Fa38yKQqxLgyr8cAzrztiuCtFbnNkWJLLDhUzRvEcw93BKuTYN1AcnVUFTA22RBcwcAJGsAJ0eb2yUAAA==",
     "heroImageSrc": "./assets/doc-images/tech-choreographer-1.jpg",
+    "heroImageWidth": 500,
     "docId": "1ewrGXzeuv09fUHYfp7ulhRUuIRwFIAYjon0DKZqwg1Q",
     "title": "Tech Choreographer"
   },
   "tech-entrepreneur": {
+    "heroImageHeight": 667,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAQAgCdASoQAAsAA4BaJZQAD4lvOp1ddsRgAP5zPRQVrp3HlMnuuO1xiItLyxMgtBDj7glAXTTAppFmIg4DZJwYKBZTTlAZnndaJ/LyJn676etkSw4qA8BpD0cnix4KEllsic5wADQAAA==",
     "heroImageSrc": "./assets/doc-images/tech-entrepreneur-1.png",
+    "heroImageWidth": 1000,
     "docId": "1QOJmeK8gn2T5xTHAuzyKXnyK8E8JMQQis7tD_TpM-7I",
     "title": "Tech Entrepreneur"
   },
   "uav-pilot-drone-operator": {
+    "heroImageHeight": 813,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAgAA4BaJYgCdAEfPIII0kAA+OXlGG0vxbBFfzx8d+0R1+eaDeMZx5ylrbUVT5vf9ZZRNImaMCU7L9wAAA==",
     "heroImageSrc": "./assets/doc-images/uav-pilot-drone-operator-1.jpg",
+    "heroImageWidth": 1568,
     "docId": "18f7XAsTn7kgz11TVMmAc0DIRll_kwmr9-2W90B3eRHA",
     "title": "UAV Pilot / Drone Operator"
   },
   "ui-ux-designer": {
+    "heroImageHeight": 232,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAwAgCdASoQABAAA4BaJQBOgMX1mEATSu+rgADiezGi7rwaB6YA3c9ZykDuG3WXPNN0NK8RYWMZbPZl+QBXIsDzADVK59q1MNlHU3q9wqzxITwg5eWBd4Ix9iXRJ07Ip1Njf3tjDdpvwnWJlVzenx+SSszBcH6AAAA=",
     "heroImageSrc": "./assets/doc-images/ui-ux-designer-1.png",
+    "heroImageWidth": 232,
     "docId": "1eTZlMkTAMj_7bq-jykihHIg6vc9Ux5VXGdZ0kH_8tf8",
     "title": "UI/UX Designer"
   },
   "vibe-coder": {
+    "heroImageHeight": 320,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABQAgCdASoQAAsAA4BaJYwCdAYwTuKx3koJDgAA/uKdMQ+RcawkK81AUaJPBc88s8YdUjfGevEcWfY0Kyotj29i/SKofJjMWXtLgS7ruavHOglVHUVPuhR61HGYptaYfGTrBVgq9E+AAAAA",
     "heroImageSrc": "./assets/doc-images/vibe-coder-1.jpg",
+    "heroImageWidth": 480,
     "docId": "1tFoJNhdcMKt-npVzpCWETOhy8ZLIgj8MT3EuKy54FaY",
     "title": "Vibe Coder"
   },
   "video-game-designer": {
+    "heroImageHeight": 337,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoQAAkAA4BaJQBOgCPn6f7JAADMmgMqj/FrwP+CKs7RFu/ZLJKHtLM6TvN7SEUtNRr1Nnfvd0J2cx62SxaifIT67zS3UaPEAAA=",
     "heroImageSrc": "./assets/doc-images/video-game-designer-1.jpg",
+    "heroImageWidth": 600,
     "docId": "1tl6CV5e3I6Cb1PWVyUMX-Uj46bNxaKcvcwRtSt3-HN4",
     "title": "Video Game Designer"
   },
   "virtual-production-designer": {
+    "heroImageHeight": 645,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQAAcAA4BaJaQAAsfwYh54ZUAA/q3oSGHEfCkUjuUaN00X+C8Fft48h8euBey3Qo4SEmQ+HAk/eZEizUPnthKBHnRQAA==",
     "heroImageSrc": "./assets/doc-images/virtual-production-designer-1.jpg",
+    "heroImageWidth": 1400,
     "docId": "1oui5M9l3pB5W3WnmY4kfet-vH1SP4_pWgGCI7mNB_Tk",
     "title": "Virtual Production Designer"
   },
   "web-developer": {
+    "heroImageHeight": 512,
+    "heroImagePlaceholder": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAwAgCdASoQAAsAA4BaJQBOgB/4oebJhCPiAAD+8Rf9Tn7BZA67tYc6ke3mdcEZ8j0QnnkO889gL5ChakWveVW6FtwZNqkcUn7gdcTsfS4epNt/ET7kQJSm1T1gAmJzgAA=",
     "heroImageSrc": "./assets/doc-images/web-developer-1.jpg",
+    "heroImageWidth": 768,
     "docId": "1J06pti1YyoFc5zomqf-yZoNSApE1DZZA1RopGiTF85E",
     "title": "Web Developer"
   }
@@ -1,11 +1,15 @@
 /* SheTech Pathways: landing + QR utilities */
 
 const STORAGE_KEY = "shetech_pathways_base_url";
+// This script's own URL, for loading siblings; its file name may be
+// content-hashed (tools/build_assets.py), so it is not looked up by name.
+const SCRIPT_SRC = (document.currentScript && document.currentScript.src) || "";
 const LEGACY_QR_HELP_COPY = "Set your public site URL on the landing page to generate scannable QR codes.";
 const UPDATED_QR_HELP_COPY = "Host this site (so QR codes open the correct pages when scanned).";
 
 function getCareersData() {
-  const data = window.SHT_CAREERS;
+  // careers-index.js (compact, one entry per career); full careers-data.js still works.
+  const data = Array.isArray(window.SHT_CAREERS_INDEX) ? window.SHT_CAREERS_INDEX : window.SHT_CAREERS;
   if (!Array.isArray(data)) return [];
   return data.filter((x) => x && typeof x.title === "string" && typeof x.slug === "string");
 }
@@ -98,8 +102,25 @@ function buildAbsoluteUrl(baseUrl, path) {
   }
 }
 
+function localQrSrcFor(targetUrl) {
+  // Build-time codes from tools/build_qr_codes.py (assets/qr/qr-codes.js), only
+  // when they were generated for the base URL we're encoding right now.
+  try {
+    const manifest = window.SHT_QR;
+    if (!manifest || typeof manifest !== "object" || !manifest.files) return "";
+    const base = normalizeBaseUrl(manifest.baseUrl || "");
+    if (!base || !targetUrl.startsWith(base + "/")) return "";
+    const file = manifest.files[targetUrl.slice(base.length + 1)];
+    const script = document.querySelector('script[src$="assets/qr/qr-codes.js"]');
+    if (typeof file !== "string" || !script) return "";
+    return new URL(file, script.src).toString();
+  } catch {
+    return "";
+  }
+}
+
 function qrImageUrlFor(targetUrl) {
-  // Uses a public QR image generator. If you need offline QR generation, we can swap this.
+  // Fallback: public QR image generator, for URLs without a build-time code.
   const encoded = encodeURIComponent(targetUrl);
   return `https://api.qrserver.com/v1/create-qr-code/?size=180x180&margin=12&data=${encoded}`;
 }
@@ -111,13 +132,26 @@ function unsplashSourceUrl(query) {
   return `https://source.unsplash.com/1200x800/?${safe}`;
 }
 
-function getDocHeroImageSrc(slug) {
+function getDocMediaEntry(slug) {
+  // Career pages load their own shard (data/careers/<slug>.js); the landing page
+  // has the index thumbnails; doc-media.js is the older all-careers map.
+  const page = window.SHT_CAREER;
+  if (page && page.slug === slug && page.media) return page.media;
+  const map = window.SHT_DOC_MEDIA;
+  if (map && typeof map === "object" && map[slug]) return map[slug];
+  const index = window.SHT_CAREERS_INDEX;
+  const item = Array.isArray(index) ? index.find((x) => x && x.slug === slug) : null;
+  return item && item.thumb ? { heroImageSrc: item.thumb } : null;
+}
+
+function getDocHeroImageSrc(slug, size) {
+  // "large" prefers the career-page variant; otherwise the small landing thumbnail.
   try {
-    const map = window.SHT_DOC_MEDIA;
-    if (!map || typeof map !== "object") return "";
-    const entry = map[slug];
-    const src = entry && typeof entry.heroImageSrc === "string" ? entry.heroImageSrc : "";
-    return src || "";
+    const entry = getDocMediaEntry(slug);
+    if (!entry) return "";
+    const large = size === "large" && typeof entry.heroImageLargeSrc === "string" ? entry.heroImageLargeSrc : "";
+    const src = typeof entry.heroImageSrc === "string" ? entry.heroImageSrc : "";
+    return large || src || "";
   } catch {
     return "";
   }
@@ -130,9 +164,22 @@ function wireCareerHeroImages() {
   const img = heroWrap.querySelector("img");
   if (!slug || !img) return;
 
-  const src = getDocHeroImageSrc(slug);
+  const src = getDocHeroImageSrc(slug, "large");
   if (!src) return;
 
+  // Intrinsic size and a tiny blurred preview (tools/image_meta.py), so the hero
+  // has its shape and a picture before the full image arrives.
+  const entry = getDocMediaEntry(slug) || {};
+  if (entry.heroImageWidth > 0 && entry.heroImageHeight > 0) {
+    img.width = entry.heroImageWidth;
+    img.height = entry.heroImageHeight;
+  }
+  const placeholder = typeof entry.heroImagePlaceholder === "string" ? entry.heroImagePlaceholder : "";
+  if (placeholder.startsWith("data:image/")) {
+    heroWrap.style.backgroundImage = `url("${placeholder}")`;
+    heroWrap.classList.add("has-placeholder");
+  }
+
   // On detail pages we're typically in /careers/, so prefix root-relative "./" paths.
   const resolved = src.startsWith("./") ? `../${src.slice(2)}` : src;
   img.src = resolved;
@@ -154,6 +201,7 @@ function getOneLineDescription(career) {
 }
 
 function renderCareersGrid() {
+  // Only for pages not pre-rendered by the build (data-render-careers="prerendered").
   const grid = document.getElementById("careerGrid");
   if (!grid || grid.getAttribute("data-render-careers") !== "true") return;
 
@@ -174,11 +222,11 @@ function renderCareersGrid() {
       const imgAlt = `Photo representing a woman in the ${title} career`;
       const desc = getOneLineDescription(c);
       const article = chooseIndefiniteArticle(title);
-      const docHero = getDocHeroImageSrc(slug);
+      const docHero = c.thumb || getDocHeroImageSrc(slug);
       const imgSrc = docHero || unsplashSourceUrl(imgQuery);
 
       return `
-<article class="poster-card" data-career data-category="${escapeHtml(c.category || "technology")}" data-title="${escapeHtml(title)}">
+<article class="poster-card" data-career data-slug="${escapeHtml(slug)}" data-category="${escapeHtml(c.category || "technology")}" data-title="${escapeHtml(title)}">
   <div class="poster-head">
     <div class="poster-head-small">Launch Your Future as ${article === "an" ? "an" : "a"}</div>
     <h3 class="poster-head-title">${escapeHtml(title)}</h3>
@@ -237,6 +285,13 @@ function updateQrImages() {
     const path = img.getAttribute("data-path") || "";
     const target = buildAbsoluteUrl(baseUrl, path);
     if (!target) {
+      // A build-time code (pre-rendered src) is still scannable, e.g. from file://.
+      const prerendered = img.getAttribute("data-qr-src");
+      if (prerendered) {
+        img.onerror = null;
+        img.src = prerendered;
+        return;
+      }
       img.removeAttribute("src");
       img.setAttribute(
         "alt",
@@ -250,7 +305,14 @@ function updateQrImages() {
 
     img.style.background = "white";
     img.style.padding = "10px";
-    img.src = qrImageUrlFor(target);
+    const local = localQrSrcFor(target);
+    img.onerror = local
+      ? () => {
+          img.onerror = null;
+          img.src = qrImageUrlFor(target);
+        }
+      : null;
+    img.src = local || qrImageUrlFor(target);
   });
 }
 
@@ -290,33 +352,110 @@ function wireCopyLinks() {
   });
 }
 
+function searchTokens(text) {
+  // Must match search_tokens() in tools/site_data.py.
+  return (
+    String(text || "")
+      .normalize("NFKD")
+      .replace(/[\u0300-\u036f]/g, "")
+      .toLowerCase()
+      .match(/[a-z0-9]+/g) || []
+  );
+}
+
+// Must match STOPWORDS in tools/site_data.py: the index leaves these (and
+// one-character words) out, so a query word among them can match nothing.
+const SEARCH_STOPWORDS = new Set(
+  "an and are as at be by can do for from has have how in is it its of on or that the this to you your with".split(" ")
+);
+
+function indexedSearchTokens(text) {
+  return searchTokens(text).filter((t) => t.length > 1 && !SEARCH_STOPWORDS.has(t));
+}
+
+function lowerBound(sorted, value) {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sorted[mid] < value) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+function searchIndexMatches(index, q) {
+  // Slugs whose indexed text has a word starting with every query word the index can hold.
+  let result = null;
+  for (const token of indexedSearchTokens(q)) {
+    const docs = new Set();
+    for (let i = lowerBound(index.terms, token); i < index.terms.length && index.terms[i].startsWith(token); i++) {
+      index.postings[i].forEach((d) => docs.add(d));
+    }
+    result = result ? new Set([...result].filter((d) => docs.has(d))) : docs;
+    if (result.size === 0) break;
+  }
+  return new Set([...(result || [])].map((d) => index.slugs[d]));
+}
+
+function loadSearchIndex(onReady) {
+  // search-index.js is only needed once someone searches; load it on demand
+  // (a script tag, so it also works from file://).
+  if (window.SHT_SEARCH) return onReady();
+  if (!SCRIPT_SRC || document.getElementById("searchIndexScript")) return;
+  const script = document.createElement("script");
+  script.id = "searchIndexScript";
+  script.src = new URL("search-index.js", SCRIPT_SRC).toString();
+  script.onload = onReady;
+  document.head.appendChild(script);
+}
+
 function wireFilters() {
   const search = document.getElementById("careerSearch");
   const category = document.getElementById("careerCategory");
   const noResults = document.getElementById("noResults");
-  const items = Array.from(document.querySelectorAll("[data-career]"));
+  const items = Array.from(document.querySelectorAll("[data-career]")).map((el) => ({
+    el,
+    slug: el.getAttribute("data-slug") || "",
+    title: (el.getAttribute("data-title") || "").toLowerCase(),
+    category: (el.getAttribute("data-category") || "").toLowerCase(),
+    visible: el.style.display !== "none",
+  }));
 
   if (!search || !category || items.length === 0) return;
 
   function apply() {
     const q = (search.value || "").trim().toLowerCase();
     const cat = category.value || "all";
+    const index = window.SHT_SEARCH;
+    const hits = q && index && Array.isArray(index.terms) ? searchIndexMatches(index, q) : null;
     let shown = 0;
 
-    items.forEach((el) => {
-      const title = (el.getAttribute("data-title") || "").toLowerCase();
-      const elCat = (el.getAttribute("data-category") || "").toLowerCase();
-      const matchesQ = !q || title.includes(q);
-      const matchesC = cat === "all" || elCat === cat;
-      const visible = matchesQ && matchesC;
-      el.style.display = visible ? "" : "none";
+    items.forEach((item) => {
+      // Title substring match is kept as-is (and is the whole search until the index loads).
+      const matchesQ = !q || item.title.includes(q) || (hits !== null && hits.has(item.slug));
+      const visible = matchesQ && (cat === "all" || item.category === cat);
+      if (visible !== item.visible) {
+        item.el.style.display = visible ? "" : "none";
+        item.visible = visible;
+      }
       if (visible) shown += 1;
     });
 
     if (noResults) noResults.hidden = shown !== 0;
   }
 
-  search.addEventListener("input", apply);
+  let timer = 0;
+  function scheduleApply() {
+    clearTimeout(timer);
+    timer = setTimeout(apply, 120);
+  }
+
+  search.addEventListener("focus", () => window.SHT_SEARCH || loadSearchIndex(apply), { once: true });
+  search.addEventListener("input", () => {
+    if (!window.SHT_SEARCH) loadSearchIndex(apply);
+    scheduleApply();
+  });
   category.addEventListener("change", apply);
   apply();
 }
@@ -362,6 +501,15 @@ function wireBaseUrlConfig() {
   renderStatus();
 }
 
+function registerServiceWorker() {
+  // Deployed builds (tools/build_assets.py) put sw.js next to this script; it
+  // precaches the site so repeat visits and moving between careers need no
+  // network. Service workers need http(s); elsewhere (and without a built
+  // sw.js) registration just fails quietly.
+  if (!("serviceWorker" in navigator) || !SCRIPT_SRC || !/^https?:$/.test(location.protocol)) return;
+  navigator.serviceWorker.register(new URL("sw.js", SCRIPT_SRC).toString()).catch(() => {});
+}
+
 function init() {
   // Render Excel-driven UI (only if the page opts in via data-render-* attributes).
   renderCareersGrid();
@@ -377,4 +525,6 @@ function init() {
 }
 
 document.addEventListener("DOMContentLoaded", init);
+// After the page's own resources, so precaching never competes with them.
+window.addEventListener("load", registerServiceWorker);
 
@@ -0,0 +1 @@
+window.SHT_SEARCH = {"slugs":["3d-animator","aerospace-engineer","ai-genomic-engineer","ai-product-manager","ai-prompt-engineer","ai-researcher","ai-security-analyst","ai-ml-engineer","architect","astronaut","astronomer","astrophysicist","biomedical-engineer","biotech-scientist","chemist","civil-engineer","climate-scientist","customer-success-manager","cybersecurity-analyst","data-scientist","digital-marketer","environmental-engineer","forensic-scientist","graphic-designer","health-informatics-specialist","it-support-specialist","marine-biologist","mechanical-engineer","robotics-engineer","social-media-producer","software-engineer","sound-engineer","stem-educator","sustainability-analyst","tech-choreographer","tech-entrepreneur","uav-pilot-drone-operator","ui-ux-designer","vibe-coder","video-game-designer","virtual-production-designer","web-developer"],"terms":["10","100th","1978","2018","2021","2022","2024","2025","30","360","3d","4d","aafs","aauw","abet","aboard","about","academic","academies","academy","accelerated","access","accessibility","accessible","account","accountable","accredited","accrediting","accuracy","achievement","across","acs","act","acted","action","actionable","activism","activity","actor","actually","adam","add","adding","administration","adobe","adrien","ads","advance","advanced","advances","advancing","adventure","adventures","advisor","advocacy","advocate","aerial","aerospace","aesthetics","affect","after","again","ahrefs","ai","ai4all","aia","aip","air","aircraft","airplane","al","albums","algebra","algorithmic","algorithms","aligning","all","allison","along","already","also","alumni","amanda","amandaskell","amazing","american","amounts","amplifies","amplifying","amy","analysis","analyst","analysts","analytical","analytics","analyze","analyzing","angles","angular","animate","animated","animation","animations","animator","animators","anitab","ann","anna","annotation","answer","ansys","anthropic","anticipating","antivirus","ap","aparna","apis","app","applications","applied","apply","appointment","approaches","apps","arch","arches","architect","architects","architectural","architecture","area","areas","arms","around","art","artemis","artificial","artist","artistic","artistry","artists","arts","arxiv","asana","asce","ask","askell","asking","assemble","assembly","assessment","assets","assistant","assistants","assisted","associate","astronaut","astronomer","astronomy","astrophysicist","astrophysics","ation","atmospheric","attacked","attacks","attend","audience","audiences","audio","autel","author","autocad","automation","automotive","autonomous","available","aviation","avionics","avoid","awards","awareness","aws","azure","back","baking","balance","balances","balancing","bandlab","bao","bardainne","based","bases","basic","beakers","beams","beats","beautiful","became","because","become","becoming","been","before","beginner","beginning","behave","behavior","being","belong","belongs","beloved","benefit","benefits","berkeley","berklee","bertozzi","best","better","between","beyond","bi","bias","biases","big","bigfuture","bigger","biggest","billionaire","billions","bim","bio","biochemist","biochemistry","bioengineering","bioinformatics","biological","biologist","biologists","biology","biomechanics","biomedical","bioorthogonal","biotech","biotechnologist","biotechnology","bit","black","blend","blender","blending","block","blood","blue","bluebeam","board","body","bold","bone","bonus","book","bootcamps","born","both","bottle","bountiful","brain","brains","brainstorm","brand","branding","brands","bravery","break","breakthroughs","bridge","bridges","bridging","briefing","bring","bringing","brings","broad","brookings","brooklyn","bugs","build","builder","building","buildings","buildyourfuture","built","bumble","buolamwini","bureau","business","businesses","but","buttons","cad","calandrelli","calc","calculus","call","camera","cameras","camp","campaign","campaigns","camps","canadian","cancer","canva","capcut","caption","captions","capture","carbon","card","cardboard","care","career","careerfoundry","careers","caring","carolyn","cartilage","cas9","cast","catia","cats","cause","cdc","cells","center","centered","centers","central","ceo","cgi","cgspectrum","chair","challenge","challenges","championed","change","changed","changemakers","changes","changing","character","characters","chart","chat","chemical","chemist","chemistry","chemists","chennapragada","chicago","chief","chinese","choices","choose","choreographer","choreography","chou","chromatography","chrome","cinema","cinematic","cinematographers","cis","cities","city","civil","claire","clapping","clarity","claude","clay","clean","cleaner","clear","clearer","clearly","clicks","client","clients","climate","clinical","clip","cloud","club","clubs","cnc","co","coach","code","coded","codepen","coder","coders","coding","cognitive","colab","collaborate","collaborating","collaboration","collaborations","collect","college","collegeboard","colleges","color","colors","columbia","com","combat","combine","combines","combining","come","comes","commercial","commons","communicate","communication","communications","communicator","communities","community","companies","company","compare","completely","complex","compliant","components","compositing","composition","computation","computational","computer","computers","computerscience","computing","concepts","conduct","conducts","conferencing","confidence","confluence","congrats","connected","connection","connects","conservancy","conservation","consoles","constellation","constellations","construction","consultant","consumer","contaminants","content","contributes","contributions","control","controls","conversational","conversations","cool","coordinator","coral","corporate","corporation","cosmic","cosmology","cosmos","could","council","courses","court","crack","cracking","craft","crasar","create","creating","creative","creativity","creator","creators","credit","cresp","crew","crime","criminal","crispr","critical","crm","cs","csail","csm","css","culture","cure","cures","curiosity","curious","currently","curriculum","customer","customers","cut","cutting","cyber","cybercorps","cyberpatriot","cybersecurity","cycle","daily","dance","dancer","dancers","daniela","dashboard","dashboards","data","database","databases","dataset","datasets","dating","day","dean","debug","decide","decisions","decks","decode","deep","deeply","deepness","defender","defense","define","defining","degree","degrees","demos","department","departments","deputy","describing","description","deserve","design","designer","designers","designing","designs","desk","desktop","detect","detective","developed","developer","developers","developing","development","develops","device","devices","devtools","dhs","diagnostics","dialogue","did","diego","difference","different","digital","digitally","directing","directly","director","directorial","directories","directors","directs","disaster","discover","discovered","discoveries","discovering","disease","diseases","distant","dive","diverse","diversity","dji","dna","docs","doctors","document","does","dogs","doing","domain","domee","don","done","donna","doors","doudna","download","dr","drafting","drawing","dream","dreaming","driven","driving","drone","droneresponders","drones","drug","each","earle","earth","easier","eco","ecological","ecologist","economics","ecosystems","ed","edge","edit","editing","editor","edits","educates","education","educational","educator","educators","effective","effects","efficiency","efficient","efforts","ehr","electives","electrical","electronic","elements","elham","email","embodies","emergency","emerging","emily","emissions","emotion","emotional","empathy","empowering","empowers","enabling","end","enemies","energy","enforcement","engagement","engages","engaging","engine","engineer","engineering","engineeringforkids","engineers","engines","english","enhance","enjoy","ensembl","ensure","ensuring","entertainment","entrepreneur","entrepreneurship","environment","environmental","environments","epa","epibone","epic","eq","equipment","equitable","equity","ernest","esg","especially","esports","establish","establishing","estimate","etc","ethical","ethics","evaluating","even","events","every","everybody","everyday","everyone","everything","evidence","evolution","exactly","examine","example","excel","excellence","exciting","execute","executive","expand","expanding","experience","experiences","experiment","experimenting","experiments","expert","expertise","explain","explaining","explanations","exploration","explore","explorer","explores","exploring","exposing","expressions","expressive","eyes","facebook","facial","fact","fairness","family","fantasy","far","fashion","fast","faster","fastweb","fate","favorite","feature","features","feedback","feel","feels","fei","fellowships","female","few","fi","field","fields","fight","fighting","figjam","figma","figure","figuring","file","film","filming","final","find","finder","findings","fine","finger","fingerprint","fingerprints","firewalls","first","fisheries","fit","fix","fixing","flasks","flies","flight","flights","floor","fly","flying","focus","focused","focuses","folds","follow","fonts","food","footprint","forensic","forensicscolleges","forest","forgotten","form","former","formerly","forward","foundation","foundations","founded","founder","founding","founds","framework","frameworks","franchise","franchises","francisco","free","freedom","freezes","french","friend","friendly","friends","front","frontiers","full","fun","fund","fundamentals","fusion","future","futuremakers","futuristic","gained","gal","galaxies","game","gameplay","games","gaming","gang","gaps","garage","garageband","gas","gazebo","gcms","gcp","gender","gene","general","generalassemb","generated","generation","generative","genetic","geneticist","genetics","genomic","genomics","genre","gently","geographic","geography","geologist","geometry","geophysics","geospatial","gestures","girls","girlswhocode","gis","git","github","gives","glassware","glider","global","globally","go","goal","goals","good","google","gov","governance","gps","grants","graphic","graphics","grasshopper","gravity","great","green","greener","grenoble","groundbreaking","grow","growth","guardian","gwynne","hack","hacker","hackers","had","hand","handley","hands","hannah","happen","happens","harassment","harvard","hashtags","hawking","hayhoe","hci","headline","headphones","headquartered","heal","health","healthcare","healthier","hear","heart","heat","help","helped","helpfully","helping","helps","hennig","her","herd","here","hero","hidden","high","highlights","hilary","himss","hipaa","history","hold","holes","hollings","home","honors","hoodie","hook","hootsuite","hospital","host","household","howard","html","https","hubble","hubspot","huggins","human","humanity","humans","huntsville","icmp","iconic","id","idea","ideas","identify","ids","idtech","if","ii","illustration","illustrator","ilm","image","imagery","images","imagination","imagine","imaging","imagining","imdb","immersion","immersive","impact","impacts","important","improve","improvements","improving","incident","incidents","include","including","inclusion","inclusive","incredibly","indesign","indie","industrial","industry","influence","influenced","influencing","influential","informatics","information","infrastructure","initial","initiative","innovate","innovation","innovators","ins","inside","insight","insights","inspire","inspires","inspiring","instagram","install","instantly","institute","institution","instructional","instructions","instrument","instruments","integrate","integrates","intelligence","intelligently","intensives","interact","interaction","interactive","interacts","interdisciplinary","interested","interfaces","interior","international","internet","internship","internships","interpret","intersection","into","intro","invent","inventor","investigate","investigators","investors","invision","ips","isn","issue","issues","items","iterate","iterating","itself","jackson","james","java","javascript","jeanne","jennifer","jessica","jira","johnson","jones","journalism","journals","journey","joy","js","julie","jump","jumps","jupyter","just","justice","kain","kali","karten","kate","katharine","katherine","katie","katsanis","keeping","keeps","kimberly","kind","kinds","kit","kitchen","kits","klossy","knowledge","known","kode","kodewithklossy","lab","label","laboratory","labs","land","landing","langley","language","laptops","large","latex","launch","launchx","laureate","law","layouts","lca","lead","leader","leaders","leadership","leading","leads","league","learn","learned","learning","learns","lectures","led","legacy","legal","lego","lehman","length","lesson","lessons","let","lets","letters","level","levels","li","libraries","library","licensed","lidar","life","lifelong","lift","lifts","light","lighter","lighting","like","likes","limit","limits","lims","line","link","links","linux","live","lives","living","ll","llm","llms","local","log","logic","logo","logos","long","longtime","look","loops","love","loved","loving","lucila","lumen","ly","machado","machine","machines","mack","macos","made","magazine","magic","magnifier","maintain","major","majors","make","makes","makeup","making","management","manager","managers","manufacturing","map","mapping","maps","maria","marine","marinecareers","marketer","marketers","marketing","marketingprofs","marking","mars","martin","mary","mason","materials","math","mathematics","matlab","matter","matters","maya","me","mean","measure","measurement","mechanical","mechanics","mechatronics","media","medical","medicinal","medicine","medicines","medium","meet","member","mental","mentor","merge","message","meta","meteorology","metrics","micro","microcontrollers","microgravity","microphones","microscopes","microsoft","middle","might","millions","mind","mini","minute","miro","mirror","missing","mission","missions","misuse","misused","mit","mix","mixing","ml","mobile","mock","model","modeler","modeling","models","modern","molecular","molecule","moment","moments","mondot","monitor","monitors","mood","moon","more","most","motion","motors","mouse","move","movement","moves","movie","movies","much","multimedia","murphy","museum","music","must","my","mysteries","naab","name","narrative","narratives","nasa","nation","national","nationally","natural","nature","navigation","navigator","ncbi","ncwit","need","needed","needs","net","network","networking","neuroscience","never","new","newsletter","next","niche","nicknamed","night","nih","nina","nist","nlp","no","noaa","nobel","norms","north","northwestern","not","notebook","notebooks","noted","notice","notion","now","nsa","nsf","nslcleaders","numbers","numpy","ny","nyu","observatory","observe","observing","obstacles","ocean","oceanic","oceanographer","oceanography","oceans","off","offering","officer","offices","official","ohno","onboard","onboarding","once","one","onetonline","online","onto","open","openai","opening","opens","operate","operated","operating","operations","operator","opportunities","optimize","optional","orbit","org","organizations","origin","originally","origins","oscar","other","others","our","out","outbreaks","outcomes","outdoor","outlook","outputs","outreach","outside","over","overseen","own","oxford","p5","pa","page","pages","pandas","panels","paper","papers","paragraph","pardis","paris","parisa","parrish","partner","parts","party","password","patch","patches","path","paths","pathway","pathways","patient","pattern","patterns","pen","pencil","pencils","people","perception","perfect","perform","performance","performances","perimeter","permission","personal","personalize","personalized","persons","perspective","ph","pharmaceutical","philosophy","phishing","phone","photo","photography","photos","photoshop","physical","physics","pick","piece","pill","pilot","piloting","pioneer","pioneering","pipettes","pitch","pivotal","pixar","place","plan","planet","planetary","planets","planners","planning","plans","platform","platforms","play","played","player","players","playful","playground","playtest","plot","plug","poetic","poetry","policies","policy","policymakers","pollution","popular","populations","possibilities","possible","post","posters","posts","potential","power","powered","powerful","practice","practices","pre","precise","precision","predict","predicting","premiere","prepare","present","presentation","presentations","presenting","president","press","pressing","prince","princess","printers","privacy","privately","prize","pro","problem","problems","processors","produced","producer","producers","producing","product","productboard","production","productions","productivity","products","professionals","professor","profile","program","programme","programmer","programmers","programming","programs","progress","project","projection","projects","promotes","promoting","prompt","prompting","prompts","propulsion","pros","prosthetics","protect","protected","protecting","proteins","protocols","prototype","prototyper","prototypes","prototyping","prove","proves","proving","psychology","public","publishing","purple","push","pushing","puzzle","puzzles","python","pytorch","qradar","quality","quanta","question","questioning","questions","quickly","quote","rachel","racial","racing","rain","raises","raytheon","re","reach","reaching","react","reaction","reactions","read","readers","reading","real","reality","recognition","recognize","recognized","recognizes","recommendation","record","records","recreate","red","redesign","reduce","reef","refine","refining","reflects","regenerative","regulations","rehabilitation","rehearsing","related","relations","relationships","remember","reminds","remix","remixing","remote","render","rendering","repair","repeating","replit","report","reports","representation","represents","reputation","required","requirements","rescue","research","researcher","researchers","residence","resilience","resilient","resistant","resources","respond","response","responses","responsibility","responsible","responsibly","results","reusable","reveal","reverb","review","reviewing","revise","revit","revolutionary","rewards","rewrite","rhino","rich","right","rights","rigorous","risk","risks","ritchie","roads","roadtrip","roadtripn","roadtripnation","robin","roblox","robot","robotic","roboticist","robotics","robots","rocket","rockets","rocks","rogers","role","roles","roof","room","rooms","ros","rovs","rub","rule","run","rus","rush","saas","sabeti","safe","safegraph","safely","safer","safety","salesforce","saliva","same","sample","samples","san","sara","satellite","satellites","satisfaction","save","saving","scale","scaled","scary","scenario","scene","scenes","scenography","schedule","scholar","scholars","scholarship","scholarships","school","schools","schwarzman","sci","science","sciences","scientific","scientist","scientists","scottish","scratch","screen","screenwriter","script","scripts","scroll","scuba","sculptural","sea","search","searches","second","seconds","secrets","secure","security","see","seen","self","sem","semrush","senior","sensing","sensors","seo","sequence","sequencers","sequencing","series","serves","service","servicenow","services","serving","set","sets","shade","shape","shaped","shapes","shaping","share","shared","shares","she","sheets","shepard","shi","short","shotwell","showing","shows","sibling","siem","significantly","similarities","simple","simulation","simulations","simulator","simulators","single","sit","sites","size","skeletal","sketch","sketching","sketchup","skill","skills","sky","skydance","skydio","slack","slow","small","smart","smarter","smoother","smoothly","snapshot","social","society","soda","soft","software","soil","solar","sole","solidworks","solution","solutions","solve","solved","solvers","solves","solving","someone","something","song","sort","sorting","sound","source","space","spacecraft","spaceflight","spaces","spacex","spark","speaker","speakers","specialist","species","specific","spectrometers","speed","spike","spins","splunk","sports","spreading","spreadsheet","spreadsheets","sprout","sql","stack","staff","stage","stages","standards","stanford","star","stars","start","starter","starts","startup","state","station","statistics","stats","stay","stellarium","stem","step","stereotype","sticks","stop","stopping","stored","stories","story","storylines","storytelling","strategies","strategist","strategy","straws","stream","strength","strengthen","string","strong","stronger","structural","student","students","studies","studio","studios","study","studying","style","styluses","subject","submersibles","succeed","success","such","sugar","suggest","suite","summer","summerengineers","sundial","supercomputers","superpower","supervisor","support","supporting","surgery","surgical","surprised","survey","surveying","surveys","susan","suspicious","sustainability","sustainable","swe","sylvia","symbols","syncing","system","systems","tabassi","tableau","tablets","tabriz","tackle","take","takeoff","taking","tandon","tap","tape","tasks","teach","teachable","teacher","teaching","teams","teamviewer","teamwork","tech","techcrunch","techmakers","technical","technician","technologies","technologist","technology","teen","teens","telecommunications","telescope","telescopes","television","tell","temperature","temperatures","templates","tensorflow","test","tester","testify","testing","texas","text","theatre","their","them","themselves","then","theoretical","therapies","there","these","they","things","think","thinkers","thinking","threat","threats","three","thrive","through","ticketing","tiktok","time","times","tips","tisch","tissue","title","today","together","tomorrow","tool","tools","topic","touchdesigner","toxicologist","trace","track","tracks","tracy","traffic","trafficking","trailblazer","trailblazing","train","trained","training","trainings","transfer","transform","transformed","transforms","translate","translating","transparency","transport","transportation","treating","trend","trending","trends","triangles","trick","trig","troubleshoot","troubleshooting","truly","trust","trustworthy","truth","try","tune","tunnels","turbidity","turn","turning","tv","tweaking","uav","uavs","uc","ucar","ui","ultimate","un","uncharted","underrepresented","underserved","understand","understanding","understands","underwater","uniqueness","unity","universe","universities","university","unknown","unlock","unreal","up","update","updated","updates","upload","ups","urban","us","usability","usage","use","used","user","users","using","usnews","utah","ux","vaccines","valle","value","values","variable","ve","vehicles","version","vertical","vessels","vex","vfx","via","vibe","vice","victims","video","videos","vinegar","viral","virtual","virus","visible","vision","visit","visiting","visual","visualization","visualizations","visuals","vocals","voice","voices","volume","vp","vr","vs","vue","vulnerabilities","vulnerable","wait","walk","walsh","want","was","washington","waste","water","watkins","wave","way","ways","wcag","we","wearable","wearetdc","weather","web","webb","weber","webpage","website","websites","week","weight","well","were","west","what","when","where","which","while","whisperer","white","whitney","who","whorls","whose","why","wi","wicys","widely","wikimedia","wild","will","win","wind","windows","wing","winning","wireframes","wireshark","wisely","withgoogle","without","wizard","wolfe","woman","women","womeninaviation","womeninfilm","wonder","word","words","work","worked","working","workplaces","works","workshops","workstations","world","worlds","worldwide","would","wow","write","writer","writes","writing","wrong","wtp","www","xd","xp","xr","yes","york","young","youngest","yours","yourself","youth","youtube","zendesk","zephyr","zhuo","zoology","zoom"],"postings":[[32],[32],[34],[0],[35],[0,14],[32],[6],[9,29],[28],[0,8,12,15,27,39],[0],[22],[2,10,11,32],[1,12,15,21,27,30],[9,32],[1,3,5,6,8,10,14,15,16,17,18,19,20,21,22,25,28,29,37,39],[18],[1,15,21],[11],[13],[21],[37,39,41],[10,11,18,33],[17],[7],[12,15,21,30],[8],[4,7,14,24],[0,20],[15],[14],[4,16],[20],[4,19,33,37],[16],[41],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[40],[25],[11],[6,8,29,30,38,40,41],[41],[17,25,26,35],[0,8,20,23,29,37,39],[34],[20],[2,31],[4,9,11],[13],[6,9,12,14,24,27,30],[9,26,39],[0],[16,26],[23,26],[5,7,19,30,41],[36],[1,9,10,11,27,32,36],[38],[14,15,26],[0,35],[1],[20],[2,3,4,5,6,7,13,19,24,28,38],[2,3,7,19],[8],[11],[21],[1],[1],[9],[31],[1,4,5,6,7,8,10,11,12,13,14,15,18,19,21,24,25,27,28,30,32,36,38,39,41],[7],[2,5],[4],[5,7,9,10,17,18,36,37,40,41],[38],[1],[3,6,24,29,34,35],[1,2],[6],[4],[4],[31],[5,6,8,11,12,15,26,30,32,35,36,37,41],[14],[7],[28],[39],[9,13,15,22,26,33],[6,13,16,18,19,22,24,25,33],[18],[14],[17,19,20,24,29,35,39],[1,2,4,6,7,9,11,12,13,14,16,20,21,22,24,26,27,29,33,35,36],[5,10],[40],[41],[0],[0],[0,39,40],[0],[0],[0],[41],[20],[40],[4],[13,19],[27],[4],[18],[25],[1,2,3,4,5,6,7,11,12,13,14,16,18,19,28,30,33,35,38,39],[3],[4,30,38],[10,17,23,30,31,35,37,38],[25],[5,7,11,19],[7],[24],[5,33],[6,7,23,30,36,37],[8],[15,22],[8],[15],[8],[8,15],[32],[8,26],[9],[8],[0,7,8,20,23,29,34,37,38,39,40,41],[9],[2,4,5,6,7,28],[0,7,34,39,40],[34],[40],[0,31,39],[0,23,34,38,39,40],[5],[17],[15],[3,4,14,19,25,35,37,38],[4],[3,5,10,14,19],[28],[20],[33],[40],[22,38],[6],[36],[3],[9],[10],[9,10,11],[10,11],[9,10,11],[4],[16,26],[6],[18],[32],[29],[32],[31],[36],[17,20,32,37],[8,12,15,27],[13,28],[27],[28],[9],[36],[1],[28],[0,6,20,24],[8],[2,6,7],[6],[30,41],[14],[31,39],[22],[3],[31],[0],[34],[4,23,34,39],[17],[22],[14],[15],[31],[10,11],[6,14,32,35],[1,6,30],[11,13],[0,9],[1,5,6,27],[1,18,27,40],[5],[36],[4],[4,5,6],[0,32],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[41],[39],[5],[6],[13],[31],[14],[0,1,5,12,18,30,31,35,37,39,41],[5,7,8,12,15,16,19,29,37],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,26,27,28,29,30,31,32,33,34,36,37,38,39,40,41],[9],[19,24,33],[6,7],[7],[10,11,35],[1,7,11,13,17,19,23,28,29,30,31,35,38,41],[10],[11,33],[35],[3,18,37],[15],[29],[13],[13,14,22],[12],[2,13],[12],[26],[2],[2,5,9,12,13,14,16,19,21,22,24,26,32,33],[12],[2,9,12,13,24],[14],[2,13],[13],[12,13],[28],[1,9,11],[39],[0,40],[8,34,38],[30,41],[13],[26,32],[15],[6,8,17,19,30],[12],[8,10,14,23,29,35],[12],[8,9,11,18,28,32,34,38,39,41],[27],[0,2,3,4,5,6,7,13,17,18,19,20,23,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[0,34],[0,1,2,8,10,12,13,16,19,20,21,22,23,24,26,27,31,33,37,38,39],[33],[38],[5],[9],[35,39],[23,29],[23],[20,29],[9],[18],[13],[15],[4,15,16,32,37],[7],[9],[0,5,22,39],[8],[30],[2],[6],[38],[30,39,41],[0,1,2,3,7,10,11,12,16,17,19,20,21,27,28,29,30,35,37,38,40,41],[38],[0,1,5,7,8,15,17,21,27,28,30,39,41],[8,15],[38],[7,25],[35],[7],[37],[3,17,19,20,29,33,35],[25],[2],[30],[1,8,12,15,21,27,28],[32],[5,30],[1,5,7,9,10,11,12,14,15,19,21,24,27,28,30,32],[25],[40],[34,36,40],[9,11,26],[20],[20],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[0],[14],[20,23,29,34,35],[29],[20],[29],[34,36,40],[33],[10],[12,27],[3,8,21,24,29],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[37],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[16,21],[14],[12],[13],[12],[1],[7],[20],[13],[12,13,14],[1,8,9,12,19,36],[5,17,18,19],[18,25,33],[6],[12,25,30,35,41],[40],[40],[10,11],[1,9,13,14,17,23,25,27,28,32,35,38],[0,1,15,17],[15],[1,4,5,8,13,14,16,23,26,28,30,31,33],[16],[14],[2,4,5,23,31],[1,14,28,41],[0,4],[0,39],[19],[4],[12,14,21],[14],[2,9,10,12,13,14,16,21,22,26,32],[14],[3],[8],[3,24,26,27],[0,5,37],[15],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,26,27,28,29,30,31,32,33,34,36,37,38,39,40,41],[34],[34],[30,41],[14],[18,41],[0],[39],[40],[25],[15],[15,21,40],[8,15,21,22],[34],[31],[4],[4],[12],[19,21],[21],[16,22],[4],[4,25],[20],[17],[8,23],[3,7,16,21,26,33],[2,12,24],[0,31],[2,6,7,20,30,33],[20,28],[39],[27],[5,12,13,19,23,34,37],[4,32],[0,2,3,4,6,7,12,17,18,19,20,25,28,30,35,38,39,41],[38],[41],[38],[34,38],[0,2,5,7,9,11,19,24,25,28,32,34,37,38,39],[3,4,5],[19],[0,1,2,3,4,7,11,12,13,14,16,17,18,19,20,21,22,23,24,26,27,28,29,30,31,32,33,39],[5,8,10,15,34,37,38,40,41],[32],[22],[6,13,21,26,36],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[0,1,7,11,13,20,23,28,29,31,35,38,40,41],[6,9,37,38],[1,41],[23,30,38,41],[12],[1,4,11,22,23,26,27,28,29,31,32,35,36,37,38,40,41],[30,41],[24],[31],[2,11],[40],[13],[27],[3,7,8,10,13,14,15,18,20,30,39],[4,16],[4,9,10,11,17,23],[17,20,25,29],[10,11,16,32],[8,15,16,21,29],[6,25,35],[17],[12,13,25,30,34,37,41],[21,22],[4,31],[10,11,16,33],[24],[1,27],[40],[4],[2],[2],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[38],[4],[28],[8,23],[9,16,26],[9],[17],[25],[3],[17,20,38],[10,25],[29],[8,14,20],[16],[26],[31],[11],[10],[8,15],[29],[41],[21],[20,29],[22],[40],[14,21,36,39],[9],[4],[7,23],[30],[24],[26],[33],[16],[11],[10,11],[11],[1,2,3,6,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,35,36,38,40,41],[14,17],[0,1,2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[22],[18],[18],[15],[36],[0,1,8,14,19,20,23,29,30,32,33,34,38,39,40,41],[4,8,17,18,20,31,34,37],[0,4,8,18,20,23,32,34,38,39,40],[0,1,3,4,5,7,8,11,14,15,19,20,23,27,28,29,30,31,34,35,37,38,39,40,41],[29,35],[29,38,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[21],[9],[22],[22],[13],[25],[17],[3],[28],[17],[30,41],[23],[13],[13],[1,5,13,14,18,22,25],[2,18,23],[38],[32],[17,25],[17],[33],[2,9,19,40],[18],[18],[6,18],[6,18,25,30],[0,33],[0,1,2,4,5,6,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,36,37,38,39,40,41],[34],[34],[34],[28],[24],[3,17,18,21,29,33],[1,2,3,4,5,6,7,9,10,11,12,13,14,15,16,17,19,20,21,22,24,26,28,30,33,35,36,37],[26],[2,11,22,24,26,33],[19],[2,7,16],[35],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[28],[28],[9,20,24,39],[24],[35],[2],[26,31],[3,38],[26],[18],[33],[3,39],[35],[0,1,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[4,6,25],[17],[6],[24],[28,33],[11],[39],[23],[0,1,3,4,7,8,9,12,13,14,15,20,21,23,24,27,28,29,32,34,35,37,38,39,40,41],[4,8,23,34,37,39,40],[0,4,20,23,27,28,29,30,34,35,38,39,41],[3,5,15,34,38,40,41],[8,23,27,37,39],[25],[25],[13],[6,16,19,21,22,26],[13],[30,32,38,39,41],[0,18,20,23,30,35,37,41],[4,13,41],[14,27,33,39,41],[30],[12,27],[3,12,13,25],[41],[18],[9,14],[31],[0,17],[24],[16,22,24,26],[1,15,23,27],[0,4,6,8,13,18,20,22,23,25,29,30,31,32,34,35,37,38,39,40,41],[8,23,39],[0,5],[2,24],[0,5,6,23,28,32,34,39],[0],[9],[31,40],[34,36],[15,36],[14,19],[19],[2,10,11,13],[10,11],[2],[13],[11],[26],[18],[15,30,41],[36],[2,13,22],[29],[2,12,13,24],[12,22],[6,17],[7],[22,40],[1],[0],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[27],[17],[1,9,39],[13],[0,40],[2,10,11,12,15,21,24,28,31,33,36],[8,15,27],[23],[8],[35],[2,19,24,27,33,34],[28],[36],[36],[15,36],[14],[34],[26],[9,10,16],[12],[8],[8],[26],[33],[26],[32],[2,9,19,40],[29,31],[13],[33,38,41],[13],[29],[16,19,32],[32],[10,15,32],[32],[4],[0,31,40],[1,27],[1],[6,10,15,22,26],[24],[18,39],[1,5,7,9,12,28],[24],[34],[6],[20],[40],[36],[6],[32],[33],[23,39],[31],[3,5,20],[28,32],[29],[13],[30,38,41],[39],[33],[22],[10,20,29],[20],[10],[0,34,39,40],[1,2,4,6,7,9,12,13,15,19,21,27,28,30,31,32,41],[1,2,4,5,6,7,8,9,11,12,13,14,15,17,18,21,25,27,28,30,31,32,33,35,36,38,39,41],[27],[1,2,3,4,5,6,7,8,9,10,11,12,13,15,19,21,27,28,30],[27],[4,20],[38],[2,15,21,25],[2],[3,4,6,14,21,24,39],[41],[32,40],[12,30,35,37,41],[35],[8,21,40],[14,15,16,21,26,33,36],[0,40],[21],[12],[0,39],[31],[9,12,14,15,26,27,31],[7],[21,41],[16],[33],[32],[39],[6],[39],[33],[13],[3,4,5,6,18,22],[3,6,7,19,22],[5],[35],[11,31],[0,6,14,24,33,37],[20],[3,27],[5,6,11,16,41],[27,31],[22],[11],[18,28],[22],[7],[21,33],[18],[11],[36],[35,41],[26],[13],[17,34,37],[3,14,25,31,38,39,41],[9,31],[4,5,14,27,32,34,38],[5,9,13,14],[25],[27,31],[25,26],[17,29,32,35,39],[10,11],[1,4,9,23,24,26,27,36],[0,1,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[26],[10,11],[5,9],[7],[0],[38],[11],[37],[0,6,7],[10],[7],[25],[39],[1],[29],[19,38],[13,28],[31],[10,11],[17,20],[0,8],[3,30,39],[23,34,35,39],[0],[4,31,34],[5],[11,32],[1,35],[14],[25,40],[16,18,36],[10],[16],[1],[37],[3,23,35,37,38,39],[37],[18,27],[0],[0,29,40],[36,40],[40],[19],[0,1,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[9,13,16,21,22,26,36],[31],[22],[22],[22],[18],[0,1,4,7,9,12,17,28,29,30,35,41],[26],[25,35],[6,25,30,39],[41],[14],[1],[1,9,36],[36],[8],[1,32,36],[36],[6,22],[18,24,25],[21],[1],[28],[23,41],[13],[33],[14,22],[22],[40],[25],[8,29],[15,37],[3,18],[9,19,32],[8,9,13,14,16,24,33],[15,39],[7,12,23],[7,8,12,19,23,26,30,34,35,36,37,41],[8],[37],[6],[3,6],[39],[39],[8],[0,10,11,18,30,31,34,36,37,40,41],[14],[34],[34],[0,25,32,35,37,41],[5,6,37,41],[29],[30,38,41],[12],[30,41],[32,37],[33],[18,25],[28,34],[0,1,2,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,23,24,26,27,28,29,30,31,32,33,34,35,36,38,39,40,41],[35],[28],[0],[32],[10,11],[0,17,18,30,38,39,40],[39],[0,23,30,38,39,40],[29],[8],[6],[20],[31],[14],[28],[16],[6],[7],[13],[20],[29],[38],[23,29,38],[38],[2,13,22],[2,13],[2,22],[2],[2],[39],[22],[26],[33,36],[9],[0,8,10,28,39],[16],[36],[7],[0,2,3,6,7,10,12,17,18,19,20,25,28,30,31,32,35,38,39],[4,23,29,32,35,37,38,40,41],[16,21,26,36],[2,28,30,41],[5,7,19,30,35,38,39,41],[16],[14],[1],[2,7,11,16,24,25,26,27,28,29,33],[17,23],[6,10,25,36],[9,32,39],[8,17],[33],[2,3,5,7,18,19,20,29,33,35],[32],[3,22],[36],[25,32],[0,20,23,29,37,38,39,40,41],[0,23,39,40],[8],[11],[3,25],[8],[21],[34],[14,28,31],[12,13,20],[17,20],[6],[27],[18],[18],[18],[1,25],[7],[20],[25,32,36],[33],[18],[34],[30,41],[2],[20],[10,11],[16],[23,37,38,41],[41],[31],[8],[12],[2,3,7,9,13,14,24],[2,12,24],[21],[31],[26],[27],[3,4,13,16,17,19,25,26,28,30,33,37,38,41],[14,15,17,19,20,27,39],[4],[1,12,13,17,18,21,22,24,25,29,31,32],[3,12,20,21,29,31],[39],[0,1,4,7,10,13,17,22,25,26,27,28,29,31,33,36,38,39,40,41],[35],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[18],[19],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[25],[19],[24],[24],[9,27,32],[15],[11],[16],[8,12,27],[14],[33],[29],[20],[24],[32],[12],[21],[30,36,41],[1,4,11,22,23,26,27,28,29,31,32,35,36,37,38,40,41],[10],[17,20],[11],[4,5,7,9,12,14,18,19,22,23,28,34,37,38,41],[5,9],[11,28,38],[9],[22],[31],[0,7],[3,13,20,33],[3,5,8,11,12,13,20,23,29,30,32,34,35,37,38,39,41],[10,16,22,26,35],[18],[23],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[1,5,7,11,12,13,14,15,19,27],[39],[23],[40],[20,41],[26],[5,7],[0,1,7,11,27,40],[24,34,40],[12,22],[5,8,28],[40],[2,6,7,19,20,30,35,38],[31,34,39],[2,3,7,13,14,15,19,22,24,26,33,35,36],[5,16,26],[16],[2,4,7,12,14,24,27,28,30,39,41],[21],[28,37,41],[18],[18],[30,32],[25],[30,41],[4,5,32,39],[12],[23],[39],[40],[30,35,39,41],[17],[39],[37],[39],[24],[3,6,17,18,19,20,22,24,25,30,35,41],[15,21],[35],[6],[17,19,32],[6,8,12,22,27,40],[14,32],[31],[14,40],[19],[16,19,24,33],[32],[23,38],[32],[20,29],[25],[40],[2,5,6,10,11],[6],[32],[4,25],[31],[13,31],[40],[3],[2,4,5,6,7,18,19,28,37],[4],[34],[28],[4,23,34,37,38,41],[0,30,34,38,39,40],[34],[22],[4],[3,31],[8],[0,6,8,9],[18,20],[16],[5,9,10,13,16],[2,13,14,22],[22],[0,1,2,3,4,16,19,21,22,24,26,27,30,31,33,35],[20,24,29],[12,14,28],[13],[18],[22],[35],[37],[18],[1,36],[16,25],[25,28],[12],[39],[38,40],[12,13],[1],[10,26],[30],[0,30,34,38,41],[8],[13],[9,23],[1,3,17,30],[9,25],[21],[29],[11],[25],[7],[38],[37],[0],[34],[2,5,7,19],[0,1,2,4,5,7,12,14,15,17,18,20,25,27,29,36,38,40],[7,21,22],[39],[18],[29],[25],[16],[10,11],[10,11],[22],[25],[25],[21],[4,14],[6],[28],[14],[32],[30,38],[17],[0,4,5,6,7,9,11,12,16,17,18,23,28,30,31,32,33,35,37,41],[30,38],[4,32,41],[7,12,13,14,16,22,26,32,38],[8],[28],[5,14,19,32,34],[34],[36],[1],[4,38],[25,32],[4,7,25,37],[11],[1,3,35],[35],[14],[22],[23,41],[33],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[6,17,19,22,24,27,28,37],[3,14],[9,17,22,25,27,35,37,39],[3,5,16,26,29,40,41],[3,18,37],[7],[5,7,10,14,28,30],[5],[2,4,5,6,7,9,19,25,28,32,36,38],[20],[11],[3,15,40],[1,39],[22],[28],[15],[18],[32],[32],[1],[0,1,2,6,7,12,13,16,21,22,23,24,27,30,33,37,40],[23],[39],[16,31,39],[5],[2,4],[8],[8],[34],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[26],[27],[27],[8,22,34,40],[12],[40],[1,2,3,4,5,6,9,10,11,12,13,14,15,18,19,20,24,25,26,27,29,30,31,32,34,35,36,37,38,40,41],[20],[36],[40],[22],[28],[29,41],[9],[18],[9,15,31,34],[2,8,12,13,24,36,38],[12,14],[4,23,24,25,27,31,39],[4],[4],[13,15,18,21,25,31,33,39],[11],[3,5,7,19,31],[23],[23],[18],[6],[14,16,24],[22],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,16,17,18,19,20,22,23,24,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[1],[16],[24],[25],[29],[24],[2,5,6,7,16,19,27,28,38],[5,27],[10,11],[25],[9,33,35,41],[11],[34,40],[7],[9,36],[2,6,15,32],[0,1,2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[0,5,10,15,19,21,24,28,31,35,41],[7,19,27],[14],[8,12,13,16,18,22,26,37,41],[3,6,8,15,22,24,27,28,32,36],[3,15,17,20,29],[3],[27],[10],[21,26,34,36],[26],[15],[26],[26],[20],[23],[3,17,20,23,29,35],[20],[35],[9],[33],[1],[19],[8,14,27,32,33],[0,1,2,3,4,5,6,7,8,9,11,16,18,25,30,34,35,36,37,38,39,40,41],[5,9,10,11,19,32],[1,10,11,12,16,21,27,28],[3,5,8,15,20,29,35],[5,9,19,20,24,35],[0,40],[0,1,6,12,21,24,30],[21],[20],[33],[1,9,12,27,28],[39],[27,28],[0,4,7,11,18,20,23,25,29,31,32,34,35,37,38,39,40,41],[12,13,24],[14],[2,12,13,14],[13],[38,39],[17,35,37],[25],[3],[32],[34],[23],[20,29],[16],[3,17,33],[28],[28],[9],[31],[13,22],[3,39],[32],[0,3,4,5,7,9,10,13,14,23,24,25,26,27,31,34,39],[30,37],[4],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[32],[3,35],[7],[22],[1,9,13,26,32,36],[9,36],[6,22],[6],[3,7,11,28,35,38],[14,31],[14,31,38],[3,5,7,19],[30,41],[34],[3,5,7,11],[16],[1,6,10,21,39],[2,4,5,6,7,8,16,19],[14,20,22,39],[13],[14],[34,35],[34],[34],[6,9,18,21],[31],[31],[9],[0,1,2,3,4,5,7,9,10,11,12,13,14,15,16,17,18,19,21,25,26,30,32,33,34,35,36,37,38,39],[11,15,16,24,27,39],[0,23,34,38,40],[28],[38],[15,27,31,34,35,38,40],[0,34],[27],[40],[0,40],[10],[34],[36],[27],[19,29,31,38],[26],[0],[11,18,22],[8],[41],[39],[39],[1,9,10,11,16],[0,1,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,41],[6,8,16,18,19,22,26,27],[15,21],[8],[16],[36],[19],[2],[3,17,30],[13,18,25],[9,32],[3,7,10,11,18,28,38,41],[0,1,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,41],[25],[18,25,35],[31],[1,27],[4,6,8,13,14,17,18,23,27,30,31,32,34,35,38,39],[29],[29,38],[20,38],[26],[10],[12,13],[12],[6],[5],[7,13,35],[16,26],[14],[23],[17],[22],[5,9,18,39],[2],[1,2,5,7,13,14,19],[10,11],[4,26,31],[29,35],[3,37],[18],[16],[22],[19],[19],[38],[38],[10,11],[11,14],[10],[28,39],[26],[26],[26],[26],[26],[1],[35],[3,24,27],[8],[25,29],[24],[17],[17],[17,18,40],[1,4,5,8,9,10,11,14,16,19,25,26,27,32,33,35,37,39,40],[1,4,11,22,23,26,27,28,29,31,32,35,36,37,38,40,41],[2,5,6,7,9,10,13,14,17,18,19,20,29,30,39,41],[22],[0,1,38,41],[38],[27,39],[9],[9],[26],[27],[18,25],[36],[7,17,31,32],[20],[14,26],[9],[1,4,11,22,23,27,28,29,30,31,32,35,36,37,38,40,41],[13,14,17,19,25,33],[32],[38],[10,11],[0],[32,34],[1,18,25,32],[7,16,26,33],[18,27,37],[2],[3,5,12,19,24],[8],[24,33],[4],[5],[10],[11,16,41],[25],[10,11,12,20,29,37,38,39],[33],[38],[31],[41],[7,9,13,17],[19],[8],[1,8,12,15,22,37,39],[5,10,11],[35],[2],[8],[18],[38],[8,23],[27,28],[30,41],[18,25],[9],[25],[2,7,11,13,14,15,16,17,19,21,22,24,27,28,32,36,40],[20,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[7,9,14],[12,24],[2,22],[2,5,7,19,22],[18],[22],[27],[0,1,3,6,8,9,12,13,15,17,18,20,21,24,25,28,29,31,32,36,37,41],[31],[25],[40],[1,3,28,29,34,41],[34],[10,11],[35],[23],[2],[12],[22],[11,34],[21],[14],[4],[18],[33],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[23,25],[36],[23],[13,40],[1,5,8,9,10,11,12,13,14,15,16,19,21,22,26,27,28,30,32,34,36,40],[3,17,20,29,32,33,39],[22],[12],[9,36],[36],[2,13,20,38],[5,12,26,40],[13],[9,35],[27],[0],[2,17,40,41],[8,19,29,36],[11,16,21,26,33],[10,16],[10],[15,21],[15],[15,32],[29,30,35],[2,4,6,7,18,24,29,30,32,33],[0,25],[27],[39],[39],[38],[5],[39],[39],[31],[34],[38],[15,22],[6,16,26],[16,26],[21],[19,32],[22],[27],[1,9,27],[20],[23],[4],[28],[0,7,13,16,19,23,24,33,39,41],[3,6],[2,4,12,19,23,31,40],[8,36],[18],[1,5,7,8,9,10,11,12,14,15,19,24,28,30],[13],[2,12],[2,19],[5],[29],[16,22],[13,23,26],[32],[11,16],[10],[15,25,27,37,39],[22,29],[16],[31],[18],[12,25,27],[22,24,30,41],[29],[14],[29,31],[1,3,4,6,7,9,10,11,12,13,17,18,19,21,25,30,33,35,37,41],[1,3,5,7,15,24,25,33,36],[31],[14],[29],[31],[29],[3,7,17,20,27,33,35,37,38],[3],[29,31,40],[40],[3],[3,7,19,27,37],[24,25],[2,5,13,14,15,21,22,24,31,36,38],[9,15,21,40],[0,1,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[33],[39],[39],[5,38],[1,2,3,5,6,8,9,10,11,12,13,14,15,16,17,18,19,21,22,24,25,26,27,30,31,32,33,34,36,38,39],[33],[8,15,17,27,28,30],[34],[32],[22],[41],[4],[4],[4],[1],[40],[12],[6,16,18,22,26,33],[26],[6,18,22,33],[13],[14],[12,23,27,38],[38],[1,12,27,28,35,37],[38],[12],[1],[18],[4,17,37],[1,10,11,16,19,24,26,29,35,36],[5],[31],[9],[23],[39],[5,6,14,17,22,25,27,28],[0,1,2,3,4,5,6,7,10,11,12,16,19,21,26,28,30,32,33,34,38,39],[2,5,7],[18],[14,21],[11],[19,32],[10],[10,11,14,19],[13],[24],[29],[7],[39],[31],[11],[36],[2,3,6,10,22,24,29,34,35,40],[30,41],[10],[30,34,38,41],[14],[14],[11,29],[41],[5],[0,2,5,7,8,9,12,14,15,16,17,19,22,24,26,27,28,33,35,36,40],[30],[0,6,7],[5],[8,10,15,17,21,23,26,34,36,39,40],[7],[6],[14,31],[24],[23],[0],[37],[16,33],[26],[0,4,39],[8,34],[7],[12],[21],[12],[34],[10,15],[29],[17],[0],[10],[38],[38],[25,26,36],[0],[40],[9],[2],[30,38,41],[36],[13,16,22,26,33],[9],[23],[40],[7],[9,15],[36],[1,2,5,7,9,10,11,13,14,16,19,21,22,24,25,26,28,31,33,36],[5,6,7,9,11,13,16,33,37],[5,12,13],[26],[15,21],[21],[15],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[18,34],[18],[4],[13],[3,6,19],[3,4,22],[2,4,5,9,13],[27],[2],[31],[0,1,3,6,30],[8,15],[23],[8],[13,14],[39],[4],[8],[39],[13],[7,22],[11],[2,6],[6],[33],[15],[0,1,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,41],[4],[1,11,22,23,26,27,28,29,31,32,35,36,37,38,40,41],[36],[39],[28,36],[9],[36],[1,5,7,9,15,27,28,30,32,36,39],[12,27,28,36],[27],[1],[9],[31],[3,25,27],[0,1,2,3,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[8],[40],[8],[28],[26],[22],[6],[1,13,14],[28],[29],[17],[2],[21],[19],[4,28],[1,15],[1,6,9,12,14,15,27,36],[17],[13],[14,22,32],[13,21],[14,21,22,26],[8,24],[22],[10,26],[11,16],[24],[2,24,36],[12],[17,25,37],[14],[35],[13],[0,40],[0,22,40],[34],[29],[5],[7,11],[7,16,17,18,31,32],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[24],[28],[40],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[14,24],[9,11,22,26],[2,5,6,7,9,10,11,13,16,19,22,26,33,36],[1,3,10,13,14,16,21,22,26],[33],[11,30,32,34,39],[37,41],[0],[2],[29],[29],[26],[8],[16,26],[4,6,10,13,14,15,26,36,39],[2],[0,29],[9,29],[10,18],[6,25],[6,18,25],[0,5,9,15,18,23,27,30,32,38,40],[0,23],[28,35],[20],[20],[6,33],[36],[9,12,13,16,21,26,27,28,34,36],[20],[2],[22],[13],[39],[33],[18,25],[25],[17,25],[15],[25,31,40],[40],[22],[2,4,5,6,7,8,12,15,16,20,30,31,37,40],[7],[1,15,22,23,28,38],[0,3,15,17,37,39],[0,9,11,17,19,29,35,41],[24],[20],[0,3,5,6,7,8,9,10,11,12,14,15,16,18,19,22,23,26,29,30,31,32,33,34,35,36,37,38,39,40,41],[33],[32],[0],[0,4,11,29,31,39],[27],[2,4,9,14,20,24],[34],[32],[6,18],[22],[2],[0,2,11,12,19,24,25,27,30,36,38,40,41],[1,10,11,15,18,27,28],[1,11,16,32],[36],[9],[13,24],[2],[8,15,41],[1],[12],[3,8,9,12,13,23,24,34,35,36,39],[8,37],[8],[15],[1,4,9,24,29,30,33,39],[36],[39],[36],[1,3,5,11,29,35,39],[25],[2,4,27,31],[24],[17,24,28],[28],[1],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,40,41],[3,8,11,20,23,29,35],[2,7,9,10,11,12,15,19,21,26,30],[14],[28],[1,7,9,10,12,13,14,15,18,21,22,24,25,26,27,28,30,34,36,38,39,41],[21],[8],[0],[1,12,27,28],[12,25,35],[3,7,15,21,25,35],[0,1,3,5,17,22],[1],[18],[25,33],[1,3,4,5,6,7,9,10,11,12,13,14,15,17,18,19,21,22,24,25,27,28,30,33,35,36,37,41],[6],[0,10,31,32],[19,34],[19],[5],[31,39],[40],[1,8,9,10,11,27,32,38,40],[1,9],[9,27],[8],[27],[23],[17],[37],[4,9,17,20,24,25,36,41],[26],[4],[14],[13],[28],[27,34],[18],[19,29],[13],[19],[14],[29],[19,24,33],[30,41],[31],[34],[40],[6,21],[5],[10],[10,11],[3,23,25],[0],[5,13,20,24],[35],[9],[9],[2,3,4,5,6,7,11,13,16,17,18,19,22,24,26,33,35,39],[19],[18],[10,11],[1,2,4,5,9,10,11,12,13,14,15,16,18,24,25,28,29,32,33,34,39],[25],[18,35],[15],[6,18],[29],[24],[0,3,5,6,9,10,12,13,15,17,19,21,23,24,25,29,33,39,40],[39],[39],[0,4,11,19,20,23,29,31,34,37,38,39,40,41],[4,17,33],[17,20,29],[3,29],[15],[21],[15],[15],[27],[14,17,18],[15],[8,15],[6],[4,5,22,32,40],[3,8,20,33],[8,23,31,39],[0,8,40],[3,10,14,26,36],[9,10],[38,41],[23],[32],[26],[17,18],[17,20],[5,19],[26],[21],[8,29],[0,1,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[27],[37],[10,11,16],[18],[40],[24,25,32,33],[22],[12],[12],[5],[36],[15],[26],[31],[6,18],[8,15,16,21,33],[8,15],[1,2,7,9,10,11,12,15,19,21,28,30],[26],[18],[40],[6],[1,3,4,5,6,7,9,13,17,18,19,20,21,22,24,25,27,28,31,32,34,35,40],[6],[16,19,24,33],[23,32],[18],[21],[9,12,18],[36],[1],[12],[21],[22],[0,1,2,5,6,8,9,10,12,13,14,15,16,17,18,19,20,21,22,26,29,30,33,34,36,37,38,40,41],[5,32],[7],[32],[4,10],[3,7,9,11,17,19,22,23,24,25,33,37,39,41],[25],[15],[0,1,2,3,4,6,7,9,12,14,17,18,20,23,24,25,29,30,31,32,33,34,35,38,39,40,41],[35],[7],[0,3,15,17,18,25,31,39,40],[25,36],[0,1,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[34,38],[0,1,2,3,4,5,6,7,9,11,12,13,16,17,18,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41],[8],[3],[38],[10],[10,11],[32,40],[23,29,40],[26],[16],[4],[2,5,7,38],[1,2,4,5,6,7,9,12,13,14,15,18,20,21,25,27,28,30,31,32,35,37],[18],[22],[14,27,28,34,37,38,39,40,41],[36],[38],[34],[17],[3,6,19,20],[9],[4,14,19,21,22,36],[10,11],[13],[2,13,17,40],[9],[9,18,25,32,34,37],[1,6,11,15,18,27,28,30,37,41],[1,5,6,13,16,18],[18],[3,6,10,24,34,35],[6,18],[6,18],[36],[8],[8,9,14,19,22,23,29,32,34],[25],[29],[9,11,14,16,40],[24],[17],[38],[12],[29],[31],[5,8,20,34,38],[15,34],[4,5,34,37,38],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[29,32],[34],[22],[22],[2,11,17,20,29,33],[0,31],[30,41],[20],[22],[1],[39],[2,5,7,9,17],[9,27],[5,9,36],[32],[22],[27,31],[13,36],[3],[3],[16,33],[41],[33],[15],[13],[16,26,29],[29],[19,20,24,29],[15],[6],[36],[25,36],[40],[3,20,21,29],[6,20],[6],[22],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[31],[1],[21],[0,2,4,19,21,22,24,31,35],[0,27],[32],[28],[36],[36],[13,24],[16],[23,37,39,41],[10],[33],[39],[5],[21],[13,17,25,29,31],[3,5,11,16,20],[4,33],[26],[18],[0,34,39],[10,11],[1,2,6,10,12,14,34],[2,3,5,7,9,10,13,16,17,21,22,24,25,33,36],[9,10],[10],[0,34,39,40],[13,14,25,31,34],[39],[18],[25],[7],[39],[8,15],[2,10,16,29],[37],[17],[1,2,3,4,5,6,7,8,9,10,11,12,13,14,16,19,20,22,23,24,25,27,28,29,30,31,32,33,34,36,37,39],[0,3,5,6,8,10,14,15,17,19,20,26,29,33,34,36,40],[3,17,35,37],[3,18,25,37],[1,2,11,15,16,18,19,22,23,27,28,35,41],[37],[38],[3,4,17,23,37,39],[13],[40],[17],[3,7,35],[1,5],[25],[26],[39],[29],[26],[28],[0,40],[24],[38],[37],[22],[17,29,36,39,40],[29],[14],[20],[32,40],[13],[11],[3,5,35,39],[7,18],[8,15,26],[0,23,34,38,40],[5,10,11,16,24,36],[19],[23,34],[31],[3,4,6,7,19,20,26,29,31,35,38,41],[11,18],[31,40],[18,37],[9],[7,30,38],[41],[6,18],[22],[24,35],[0],[23],[21,32],[1],[37],[33],[15,21,33],[9],[0],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[25,31],[41],[10,11,26,31],[9,34],[36],[16],[25,37,38,41],[10],[17],[30,41],[20,29,35,37],[23,30,41],[11,17],[1,15,27],[7],[9],[38],[0,1,3,4,5,6,7,11,13,14,17,19,21,23,24,25,27,28,31,32,33,34,35,36,38,39],[9,31,34,35],[8,29,33,34,36,37,41],[27],[0,1,17,22,28,32],[4],[22],[35],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[22],[10,11,14,21],[1,3,5,14,19,24,35,36],[25],[6],[10,29],[3,7,8,10,13,14,15,18,20,30,39],[10,11],[0],[14,39],[1],[8,25],[1],[0],[37],[18],[13],[38],[37,40],[25],[35],[0,9,32],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41],[36],[40],[10],[23],[29],[0,3,4,5,6,7,9,11,13,14,17,18,20,22,27,28,31,33,37,38,39,40],[1],[4,6,17,24,25,27,41],[41],[11,28,34],[32],[31],[0,4,5,7,8,13,14,15,20,21,22,28,30,31,33,35,36,40,41],[0,26,34,37,40],[10,18,24,26,36],[6,13,17,18,21,25,36,40],[41],[2,4,10,11,13,17,25,26,28,29,30,33,35,39,41],[33,39],[20],[4,10,39,41],[6],[11],[1,4,11,22,23,26,27,28,29,31,32,35,36,37,38,40,41],[37,39],[34],[40],[2,17,32],[8],[32],[35],[35],[17],[6,22,36,38],[29],[25],[36],[37],[26],[11,17,25,35,39]]};
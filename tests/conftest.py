@@ -0,0 +1,48 @@
+"""
+Shared pytest setup: the tools are scripts in tools/ that import each other
+by module name, so tests import them the same way. drive_fixtures/standin
+serve a small Drive folder through tools/drive_standin.py on a free port.
+
+Run from the repo root:
+  python -m pytest tests
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import base64
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from drive_standin import DriveStandIn  # noqa: E402
+
+# A 2x2 PNG, served as a linked image and pasted inline.
+PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAIAAAACCAIAAAD91JpzAAAAFklEQVR4nGM8IRfFwMDAxMDAwMDAAAAPmAFE4knAJgAAAABJRU5ErkJggg=="
+
+
+@pytest.fixture
+def drive_fixtures(tmp_path: Path) -> Path:
+    """A drive_standin.py fixture tree: two Docs (one in a subfolder) and an image."""
+    root = tmp_path / "drive"
+    (root / "docs" / "Archive").mkdir(parents=True)
+    (root / "images").mkdir()
+    (root / "images" / "photo.png").write_bytes(base64.b64decode(PNG_B64))
+    (root / "docs" / "Astronaut.html").write_text(
+        '<html><body><div><p>Astronaut</p><img src="{{BASE}}/images/photo.png">'
+        f'<img src="data:image/png;base64,{PNG_B64}"></div></body></html>',
+        encoding="utf-8",
+    )
+    (root / "docs" / "Archive" / "Chemist.html").write_text(
+        "<html><body><div><p>Chemist</p></div></body></html>", encoding="utf-8"
+    )
+    return root
+
+
+@pytest.fixture
+def standin(drive_fixtures: Path):
+    with DriveStandIn(drive_fixtures) as server:
+        yield server
@@ -0,0 +1,28 @@
+"""Tests for the `node --check` guard on minified JavaScript (tools/build_assets.py)."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+import build_assets
+from build_assets import MinifyError, checked_minify_js, js_syntax_error
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+
+def test_minified_script_that_still_parses_passes():
+    src = "// total\nconst half = total / 2 / count;\nconst re = /a\\/b/g.test(s);\n"
+    assert checked_minify_js(src, "x.js") == "const half=total/2/count;const re=/a\\/b/g.test(s);\n"
+
+
+def test_minifier_breaking_a_script_fails_the_build(monkeypatch):
+    monkeypatch.setattr(build_assets, "minify_js", lambda src: src.replace("/ 2 /", "/2/g"))
+    with pytest.raises(MinifyError, match="x.js"):
+        checked_minify_js("const a = b / 2 / c;\n", "x.js")
+
+
+def test_a_script_that_was_already_broken_is_not_blamed_on_the_minifier():
+    assert js_syntax_error("const = ;") is not None
+    checked_minify_js("const = ;", "x.js")
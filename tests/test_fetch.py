@@ -0,0 +1,96 @@
+"""Tests for the importer's fetch stage (tools/import_drive_docs.py) against tools/drive_standin.py."""
+
+from __future__ import annotations
+
+import base64
+import time
+
+import pytest
+
+from drive_standin import DriveStandIn, doc_id_for_title
+from http_client import HttpError
+from image_store import SPOOLED_PREFIX, ImageStore
+from import_drive_docs import FetchPool, export_doc_url, fetch, fetch_export, fetch_zip_export, list_drive_folder
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ImageStore(tmp_path / "images", tmp_path / "image-store.json")
+
+
+def spooled_names(body: bytes) -> list[str]:
+    text = body.decode("utf-8")
+    return [part.split('"', 1)[0] for part in text.split(SPOOLED_PREFIX)[1:]]
+
+
+def test_list_drive_folder_walks_subfolders_and_pages(drive_fixtures):
+    with DriveStandIn(drive_fixtures, page_size=1) as server, FetchPool(4, 2) as pool:
+        docs = list_drive_folder(server.folder_url, pool)
+    assert docs == {"Astronaut": doc_id_for_title("Astronaut"), "Chemist": doc_id_for_title("Chemist")}
+
+
+def test_fetch_export_spools_inline_images(standin, drive_fixtures, store):
+    resp = fetch_export(export_doc_url(doc_id_for_title("Astronaut"), standin.base_url), None, store)
+    assert resp.status == 200
+    assert f"{standin.base_url}/images/photo.png".encode() in resp.body
+    assert b"data:image" not in resp.body
+    [name] = spooled_names(resp.body)
+    assert (store.root / name).read_bytes() == (drive_fixtures / "images" / "photo.png").read_bytes()
+
+
+def test_fetch_zip_export_reads_page_and_images_from_one_response(standin, drive_fixtures, store):
+    url = export_doc_url(doc_id_for_title("Astronaut"), standin.base_url, "zip")
+    resp = fetch_zip_export(url, None, store)
+    assert standin.requests == 1
+    names = spooled_names(resp.body)
+    assert len(names) == 2  # the linked photo and the pasted image
+    png = (drive_fixtures / "images" / "photo.png").read_bytes()
+    assert all((store.root / n).read_bytes() == png for n in names)
+    # The digest covers names, CRCs and sizes only, so a re-export digests the same.
+    assert fetch_zip_export(url, None, store).digest() == resp.digest()
+
+
+def test_image_store_keeps_one_file_per_content(standin, drive_fixtures, store):
+    png = (drive_fixtures / "images" / "photo.png").read_bytes()
+    linked = store.save(f"{standin.base_url}/images/photo.png")
+    inline = store.save(f"data:image/png;base64,{base64.b64encode(png).decode()}")
+    assert linked == inline
+    assert (store.root / linked).read_bytes() == png
+    # A known URL is answered from the store's manifest without a request.
+    assert store.save(f"{standin.base_url}/images/photo.png") == linked
+    assert (standin.requests, store.downloads, store.hits) == (1, 1, 1)
+
+
+def test_missing_image_is_reported_not_saved(standin, store):
+    assert store.save(f"{standin.base_url}/images/missing.png") is None
+    assert not any(store.root.iterdir())  # the partial download is cleaned up
+
+
+def test_missing_doc_raises_without_retrying(standin, store):
+    with pytest.raises(HttpError) as err:
+        fetch_export(export_doc_url("no-such-doc", standin.base_url), None, store)
+    assert err.value.status == 404
+    assert standin.requests == 1
+
+
+def test_fetch_pool_caps_concurrency_per_host(drive_fixtures):
+    with DriveStandIn(drive_fixtures, delay=0.05) as a, DriveStandIn(drive_fixtures, delay=0.05) as b:
+        with FetchPool(workers=8, per_host=2) as pool:
+            futures = [pool.submit(s.folder_url, fetch, s.folder_url) for s in (a, b) for _ in range(6)]
+            assert all(f.result().status == 200 for f in futures)
+    # Two at a time per host, and the hosts were served side by side.
+    assert (a.max_in_flight, b.max_in_flight) == (2, 2)
+
+
+def test_fetch_pool_keeps_results_in_submission_order_and_reports_errors():
+    def job(i: int) -> int:
+        time.sleep(0.01 * (5 - i))  # later jobs finish first
+        if i == 3:
+            raise ValueError(i)
+        return i
+
+    with FetchPool(workers=4, per_host=4) as pool:
+        futures = [pool.submit("http://example.test/", job, i) for i in range(5)]
+        assert [f.result() for f in futures[:3]] == [0, 1, 2]
+        assert isinstance(futures[3].exception(), ValueError)
+        assert futures[4].result() == 4
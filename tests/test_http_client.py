@@ -0,0 +1,97 @@
+"""Tests for the shared HTTP client (tools/http_client.py) against tools/drive_standin.py."""
+
+from __future__ import annotations
+
+import errno
+import random
+import time
+
+import pytest
+
+from drive_standin import DriveStandIn
+from http_client import CHUNK_SIZE, MAX_REDIRECTS, HttpClient, HttpError
+
+
+class ListSink:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.resets = 0
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    def reset(self) -> None:
+        self.chunks.clear()
+        self.resets += 1
+
+
+class FullDiskSink(ListSink):
+    def write(self, data: bytes) -> None:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+@pytest.fixture
+def client():
+    c = HttpClient(retries=3, backoff=0)
+    yield c
+    c.close()
+
+
+def test_retries_429_and_503_honouring_retry_after(standin, client):
+    standin.fail_next(429, 503, retry_after="0.2")
+    start = time.monotonic()
+    resp = client.get(standin.folder_url)
+    assert resp.status == 200
+    assert standin.requests == 3
+    assert time.monotonic() - start >= 0.4
+
+
+def test_gives_up_when_retries_run_out(standin, client):
+    standin.fail_next(503, 503, 503, 503, retry_after=None)
+    with pytest.raises(HttpError) as err:
+        client.get(standin.folder_url)
+    assert err.value.status == 503
+    assert standin.requests == 4  # the first attempt and three retries
+
+
+def test_client_errors_are_not_retried(standin, client):
+    with pytest.raises(HttpError) as err:
+        client.get(f"{standin.base_url}/images/missing.png")
+    assert err.value.status == 404
+    assert standin.requests == 1
+
+
+def test_follows_redirects_up_to_the_limit(standin, client):
+    resp = client.get(f"{standin.base_url}/redirect/{MAX_REDIRECTS}/images/photo.png")
+    assert resp.status == 200
+    assert resp.url == f"{standin.base_url}/images/photo.png"
+    with pytest.raises(HttpError, match="too many redirects"):
+        client.get(f"{standin.base_url}/redirect/{MAX_REDIRECTS + 1}/images/photo.png")
+
+
+def test_gzip_bodies_are_decoded(drive_fixtures, client):
+    with DriveStandIn(drive_fixtures, gzip=True) as server:
+        resp = client.get(server.folder_url)
+    assert resp.header("Content-Encoding") == "gzip"
+    assert resp.body.startswith(b"<!doctype html>")
+
+
+def test_streams_a_gzipped_body_into_the_sink_in_chunks(drive_fixtures, client):
+    big = random.Random(0).randbytes(3 * CHUNK_SIZE)  # incompressible, so gzip keeps it multi-chunk
+    (drive_fixtures / "images" / "big.bin").write_bytes(big)
+    sink = ListSink()
+    with DriveStandIn(drive_fixtures, gzip=True) as server:
+        server.fail_next(503)
+        resp = client.get(f"{server.base_url}/images/big.bin", sink=sink)
+    assert resp.body == b""
+    assert resp.streamed == len(big)
+    assert b"".join(sink.chunks) == big
+    assert len(sink.chunks) > 1
+    assert sink.resets == 1  # the 503 body never reached the sink
+
+
+def test_sink_write_errors_are_not_retried(standin, client):
+    with pytest.raises(OSError) as err:
+        client.get(f"{standin.base_url}/images/photo.png", sink=FullDiskSink())
+    assert err.value.errno == errno.ENOSPC
+    assert standin.requests == 1
@@ -0,0 +1,34 @@
+"""Tests for turning a Doc export into career page markup (tools/import_drive_docs.py)."""
+
+from __future__ import annotations
+
+from import_drive_docs import render_career_page
+from site_output import doc_sections_inner_html
+
+EXPORT = (
+    '<html><body><div><p class="c1"><span class="c0">Intro text</span></p>'
+    '<h2 class="c1"><span class="c2">Day in the Life</span></h2>'
+    '<p class="c1"><span class="c0">Morning </span><span class="c2">meeting</span></p>'
+    '<h2 class="c1"><span class="c2">You Belong Here</span></h2>'
+    '<p class="c1"><span class="c0">Welcome</span></p><p class="c1"><span class="c0"></span></p>'
+    "</div></body></html>"
+)
+
+
+def test_page_with_doc_sections_gets_one_panel_per_section():
+    page, _, _ = render_career_page('<main><div id="docSections"></div></main>', EXPORT, slug="t")
+    panels = doc_sections_inner_html(page)
+    assert 'data-doc-section="day-in-the-life"' in panels
+    assert "<p>Morning meeting</p>" in panels
+    assert 'data-doc-section="you-belong-here"' in panels
+    assert "<p>Welcome</p>" in panels
+
+
+def test_page_without_doc_sections_keeps_every_section_body():
+    page, _, saved = render_career_page("<html><body><main></main></body></html>", EXPORT, slug="t")
+    assert 'id="careerDetails"' in page
+    for text in ("Intro text", "Day in the Life", "Morning meeting", "You Belong Here", "Welcome"):
+        assert text in page
+    # The fallback panel is slimmed too.
+    assert "<span" not in page
+    assert saved > 0
@@ -0,0 +1,51 @@
+"""Tests for OutputReport staging (tools/site_output.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+import site_output
+from site_output import OutputReport
+
+
+def test_rewrite_does_not_clobber_a_same_named_file(tmp_path):
+    (tmp_path / "x").mkdir()
+    (tmp_path / "y").mkdir()
+    report = OutputReport(staging_dir=tmp_path / "staging")
+    report.write_text(tmp_path / "x" / "a.js", "x1")
+    report.write_text(tmp_path / "y" / "a.js", "y")
+    report.write_text(tmp_path / "x" / "a.js", "x2")
+    report.commit()
+    assert (tmp_path / "x" / "a.js").read_text() == "x2"
+    assert (tmp_path / "y" / "a.js").read_text() == "y"
+    assert sorted(report.created) == [tmp_path / "x" / "a.js", tmp_path / "y" / "a.js"]
+
+
+def test_remove_after_write_leaves_no_file(tmp_path):
+    report = OutputReport(staging_dir=tmp_path / "staging")
+    report.write_text(tmp_path / "a.js", "a")
+    report.remove(tmp_path / "a.js")
+    report.commit()
+    assert not (tmp_path / "a.js").exists()
+
+
+def test_interrupted_commit_replays_after_the_checkout_moves(tmp_path, monkeypatch):
+    old, new = tmp_path / "old", tmp_path / "new"
+    (old / "careers").mkdir(parents=True)
+    (old / "careers" / "stale.html").write_text("stale")
+    report = OutputReport(staging_dir=old / ".build-cache" / "staging", root=old)
+    report.write_text(old / "careers" / "a.html", "a")
+    report.remove(old / "careers" / "stale.html")
+
+    def crash(run_dir, root):
+        raise KeyboardInterrupt  # killed after the journal was written
+
+    monkeypatch.setattr(site_output, "_apply_journal", crash)
+    with pytest.raises(KeyboardInterrupt):
+        report.commit()
+    monkeypatch.undo()
+
+    old.rename(new)
+    assert site_output.recover_staged(new / ".build-cache" / "staging", root=new) == 1
+    assert (new / "careers" / "a.html").read_text() == "a"
+    assert not (new / "careers" / "stale.html").exists()
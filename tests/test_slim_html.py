@@ -0,0 +1,71 @@
+"""
+Golden tests for the Doc markup slimming (tools/slim_html.py).
+
+fixtures/slim/doc-export.html is a small Google Doc HTML export; doc-panels.html
+is the <div id="docSections"> content import_drive_docs.py writes for it, and
+doc-text.txt the text those panels show (slim_html.visible_text()). After an
+intended change to the importer or slim_html.py, inspect the new output and
+update the golden files by hand.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bs4 import BeautifulSoup
+
+import slim_html
+from import_drive_docs import render_career_page
+from site_output import HTML_PARSER, doc_sections_inner_html
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "slim"
+PAGE_SHELL = '<main><div id="docSections"></div></main>'
+
+
+def golden(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8").removesuffix("\n")
+
+
+def imported_panels(*, slim: bool) -> str:
+    page, _, _ = render_career_page(PAGE_SHELL, golden("doc-export.html"), slug="marine-biologist", slim=slim)
+    panels = doc_sections_inner_html(page)
+    assert panels is not None
+    return panels
+
+
+def text_of(panels_html: str) -> str:
+    return slim_html.visible_text(BeautifulSoup(f"<div>{panels_html}</div>", HTML_PARSER).div)
+
+
+def test_import_writes_golden_panels():
+    assert imported_panels(slim=True) == golden("doc-panels.html")
+
+
+def test_panels_show_golden_text():
+    assert text_of(golden("doc-panels.html")) == golden("doc-text.txt")
+
+
+def test_slimming_keeps_the_visible_text():
+    assert text_of(imported_panels(slim=False)) == golden("doc-text.txt")
+
+
+def test_slim_html_on_existing_pages_matches_import():
+    # slim_html.py run over a --no-slim import gives the same markup as slimming during the import.
+    assert slim_html.slim_panels_html(imported_panels(slim=False)) == golden("doc-panels.html")
+
+
+def test_slimming_is_idempotent():
+    assert slim_html.slim_panels_html(golden("doc-panels.html")) == golden("doc-panels.html")
+
+
+def test_slim_checked_refuses_a_text_change(monkeypatch):
+    def lossy(root):
+        root.find("p").decompose()
+        return 0
+
+    monkeypatch.setattr(slim_html, "slim_doc", lossy)
+    root = BeautifulSoup("<div><p>kept</p><p>dropped</p></div>", HTML_PARSER).div
+    with pytest.raises(slim_html.SlimError):
+        slim_html.slim_checked(root, "the fixture")
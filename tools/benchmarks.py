@@ -0,0 +1,436 @@
+"""
+Benchmarks for the site build tools, on synthetic inputs only (no Google, no
+real workbook).
+
+  python tools/benchmarks.py parse [--docs 20] [--paragraphs 120]
+  python tools/benchmarks.py xlsx [--rows 1000 10000 50000] [--sheets 4]
+  python tools/benchmarks.py folder [--docs 10 100 1000 10000]
+  python tools/benchmarks.py clean [--docs 20] [--paragraphs 120] [--images 4] [--inline 2]
+  python tools/benchmarks.py sync [--rows 10 100 1000 10000]
+  python tools/benchmarks.py full [--rows 200] [--docs 50] [--images 3] [--inline 1]
+
+parse: per-doc parse/serialize time of the import pipeline, comparing the
+string round-trip chain (clean_google_doc_html -> split_doc_into_sections ->
+build_doc_panels_html -> page re-parse) with render_career_page(), which keeps
+one tree per document.
+
+xlsx: time and peak Python memory of reading a generated multi-sheet workbook
+with the old full-load/ws.cell() access versus sync_from_xlsx.read_careers().
+
+folder: extract_doc_ids_from_folder() on generated Drive folder pages.
+
+clean: clean_google_doc_html() (cold: images fetched from the local stand-in;
+warm: served by the image store) and split_doc_into_sections() per generated
+Doc export, with remote images and inline data:image base64 blobs.
+
+sync / full: sync_from_xlsx.main() and import_drive_docs.main() timed in a
+scratch copy of the site (so the repo is never touched), against generated
+workbooks and Doc fixtures served by drive_standin.DriveStandIn; each is run
+cold (empty outputs/caches) and warm (re-run with nothing changed).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import base64
+import json
+import random
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+
+from openpyxl import Workbook, load_workbook
+
+import import_drive_docs as idd
+import sync_from_xlsx
+from drive_standin import DriveStandIn, folder_html_for
+from image_store import ImageStore
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_PAGE = ROOT / "careers" / "software-engineer.html"
+
+
+def synthetic_png(width: int, height: int, *, seed: int = 0) -> bytes:
+    """A valid RGB PNG of noisy gradients (stdlib only), so hashing/variants see real bytes."""
+    rnd = random.Random(seed)
+    rows = []
+    for y in range(height):
+        row = bytearray([0])
+        for x in range(width):
+            row += bytes(((x * 255 // width + rnd.randint(0, 40)) % 256, (y * 255 // height) % 256, rnd.randint(0, 255)))
+        rows.append(bytes(row))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(b"".join(rows))) + chunk(b"IEND", b"")
+
+
+def synthetic_doc_html(
+    paragraphs: int,
+    *,
+    seed: int = 0,
+    images: list[str] | None = None,
+    inline_images: list[bytes] | None = None,
+) -> str:
+    """
+    A Google-Docs-shaped export: inline styles, span soup, h2 sections and
+    tables, plus <img> tags for `images` (URLs) and `inline_images` (embedded
+    as data:image/png;base64 URIs) spread through the sections.
+    """
+    rnd = random.Random(seed)
+    words = "students design build code data robots space climate health art music games lab team".split()
+
+    def sentence() -> str:
+        return " ".join(rnd.choice(words) for _ in range(rnd.randint(6, 18))).capitalize() + "."
+
+    def para() -> str:
+        spans = "".join(
+            f'<span class="c{rnd.randint(1, 40)}" style="font-weight:400">{sentence()} </span>'
+            for _ in range(rnd.randint(1, 4))
+        )
+        return f'<p class="c{rnd.randint(1, 9)}" style="margin:0">{spans}</p>'
+
+    def table(rows: int) -> str:
+        body = "".join(
+            "<tr>" + "".join(f'<td class="c3"><p class="c2"><span class="c1">{sentence()}</span></p></td>' for _ in range(3)) + "</tr>"
+            for _ in range(rows)
+        )
+        return f'<table class="c9" style="border:0">{body}</table>'
+
+    def img(src: str) -> str:
+        return (
+            f'<p class="c2"><span style="overflow: hidden; display: inline-block; width: 624px; height: 351px;">'
+            f'<img alt="" src="{src}" style="width: 624px; height: 351px; margin-left: 0px;" title=""></span></p>'
+        )
+
+    srcs = list(images or []) + [
+        "data:image/png;base64," + base64.b64encode(data).decode("ascii") for data in inline_images or []
+    ]
+    per = max(1, paragraphs // len(idd.SECTION_ORDER))
+    parts = []
+    for i, key in enumerate(idd.SECTION_ORDER):
+        parts.append(f'<h2 class="c5" id="h.{rnd.randint(1000, 9999)}"><span class="c7">{idd.SECTION_TITLES[key]}</span></h2>')
+        if key in idd.SECTION_TABLE_CLASSES:
+            parts.append(table(6))
+        parts.extend(para() for _ in range(per))
+        parts.extend(img(src) for src in srcs[i :: len(idd.SECTION_ORDER)])
+        parts.append('<p class="c2"><span class="c1"></span></p>')
+    style = "".join(f".c{i}{{color:#000;font-size:{i}pt}}" for i in range(1, 200))
+    return (
+        f'<html><head><meta content="text/html; charset=UTF-8"><style>{style}</style></head>'
+        f'<body class="c4 doc-content"><div>{"".join(parts)}</div></body></html>'
+    )
+
+
+def _string_chain(page: str, exported: str, store: ImageStore) -> str:
+    """The pre-single-tree pipeline: every stage re-serializes and re-parses."""
+    cleaned, _ = idd.clean_google_doc_html(exported, slug="bench", store=store)
+    panels_html = idd.build_doc_panels_html(idd.split_doc_into_sections(cleaned))
+    soup = idd.parse_html(page)
+    container = soup.find(id="docSections")
+    container.clear()
+    container.append(idd.parse_html(panels_html))
+    return str(soup)
+
+
+def _single_tree(page: str, exported: str, store: ImageStore) -> str:
+    html, _, _ = idd.render_career_page(page, exported, slug="bench", store=store)
+    return html or ""
+
+
+def _time_per_doc(fn, page: str, docs: list[str], store: ImageStore, repeat: int) -> list[float]:
+    out = []
+    for doc in docs:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(page, doc, store)
+            best = min(best, time.perf_counter() - t0)
+        out.append(best)
+    return out
+
+
+def bench_parse(args: argparse.Namespace) -> None:
+    page = SAMPLE_PAGE.read_text(encoding="utf-8")
+    docs = [synthetic_doc_html(args.paragraphs, seed=i) for i in range(args.docs)]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ImageStore(Path(tmp), Path(tmp) / "store.json")
+        print(f"parser: {idd.HTML_PARSER}; {args.docs} docs x ~{args.paragraphs} paragraphs")
+        print(f"{'pipeline':<14}{'median ms':>12}{'p90 ms':>10}{'total s':>10}")
+        results = {}
+        for name, fn in (("string chain", _string_chain), ("single tree", _single_tree)):
+            times = _time_per_doc(fn, page, docs, store, args.repeat)
+            results[name] = times
+            p90 = sorted(times)[int(0.9 * (len(times) - 1))]
+            print(f"{name:<14}{statistics.median(times) * 1e3:>12.2f}{p90 * 1e3:>10.2f}{sum(times):>10.2f}")
+        speedup = statistics.median(results["string chain"]) / statistics.median(results["single tree"])
+        print(f"speedup (median): {speedup:.2f}x")
+
+
+def synthetic_workbook(path: Path, rows: int, *, sheets: int = 1, seed: int = 0) -> None:
+    """Write a career map with `rows` careers spread over `sheets` region sheets."""
+    rnd = random.Random(seed)
+    roles = "Engineer Scientist Designer Analyst Developer Producer Specialist Researcher".split()
+    fields = "Data Climate Robotics Game Space Health Sound Web Cloud Marine Forensic Product".split()
+    wb = Workbook(write_only=True)
+    per = -(-rows // sheets)
+    n = 0
+    for s in range(sheets):
+        ws = wb.create_sheet(f"Region {s + 1}")
+        ws.append(["Poster Title", "Description", "Notes"])
+        for _ in range(min(per, rows - n)):
+            n += 1
+            title = f"{rnd.choice(fields)} {rnd.choice(roles)} {n}"
+            ws.append([title, f"Explore what a {title} does and how to get there.", "x" * rnd.randint(0, 40)])
+    wb.save(path)
+
+
+def _read_full_load(path: Path) -> int:
+    """The pre-streaming reader: full workbook load, header via ws.cell(), cell-by-cell rows."""
+    wb = load_workbook(path, data_only=True)
+    ws = wb[wb.sheetnames[0]]
+    header = [ws.cell(1, c).value for c in range(1, ws.max_column + 1)]
+    col = {str(x).strip(): i + 1 for i, x in enumerate(header) if x}
+    items = []
+    for sheet in wb.worksheets:
+        for r in range(2, sheet.max_row + 1):
+            title = sheet.cell(r, col["Poster Title"]).value
+            if not title or not str(title).strip():
+                continue
+            desc = str(sheet.cell(r, col["Description"]).value or "").strip()
+            items.append(sync_from_xlsx.career_from_row(str(title).strip(), desc))
+    return len(items)
+
+
+def _read_streaming(path: Path) -> int:
+    return len(sync_from_xlsx.read_careers(path))
+
+
+def _measure(fn, path: Path) -> tuple[float, float, int]:
+    # Time and memory are taken in separate runs; tracemalloc distorts timings.
+    t0 = time.perf_counter()
+    n = fn(path)
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, n
+
+
+def bench_xlsx(args: argparse.Namespace) -> None:
+    print(f"{'rows':>8}{'reader':>12}{'time s':>10}{'peak MB':>10}{'careers':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f"map-{rows}.xlsx"
+            synthetic_workbook(path, rows, sheets=args.sheets)
+            for name, fn in (("full load", _read_full_load), ("streaming", _read_streaming)):
+                elapsed, peak, n = _measure(fn, path)
+                print(f"{rows:>8}{name:>12}{elapsed:>10.2f}{peak:>10.1f}{n:>10}")
+
+
+def write_doc_fixtures(
+    root: Path, titles: list[str], *, paragraphs: int, images: int, inline: int, image_px: int = 320
+) -> None:
+    """
+    drive_standin fixtures: docs/<title>.html with `images` remote images
+    (served from images/) and `inline` base64 images each.
+    """
+    (root / "docs").mkdir(parents=True, exist_ok=True)
+    (root / "images").mkdir(parents=True, exist_ok=True)
+    for n, title in enumerate(titles):
+        remote = []
+        for k in range(images):
+            name = f"doc{n}-img{k}.png"
+            (root / "images" / name).write_bytes(synthetic_png(image_px, image_px * 9 // 16, seed=n * 100 + k))
+            remote.append(f"{{{{BASE}}}}/images/{name}")
+        embedded = [synthetic_png(image_px // 2, image_px // 4, seed=-(n * 100 + k + 1)) for k in range(inline)]
+        html = synthetic_doc_html(paragraphs, seed=n, images=remote, inline_images=embedded)
+        (root / "docs" / f"{title}.html").write_text(html, encoding="utf-8")
+
+
+def _stats_row(name: str, times: list[float]) -> str:
+    p90 = sorted(times)[int(0.9 * (len(times) - 1))]
+    return f"{name:<16}{statistics.median(times) * 1e3:>12.2f}{p90 * 1e3:>10.2f}{sum(times):>10.2f}"
+
+
+def bench_folder(args: argparse.Namespace) -> None:
+    print(f"{'docs':>8}{'page KB':>10}{'best ms':>10}{'found':>8}")
+    for n in args.docs:
+        html = folder_html_for([f"Career Doc {i}" for i in range(n)])
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            found = idd.extract_doc_ids_from_folder(html)
+            best = min(best, time.perf_counter() - t0)
+        print(f"{n:>8}{len(html) / 1024:>10.0f}{best * 1e3:>10.2f}{len(found):>8}")
+
+
+def bench_clean(args: argparse.Namespace) -> None:
+    titles = [f"Career Doc {i}" for i in range(args.docs)]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_doc_fixtures(
+            root / "fixtures", titles, paragraphs=args.paragraphs, images=args.images, inline=args.inline
+        )
+        store = ImageStore(root / "store", root / "store.json")
+        with DriveStandIn(root / "fixtures") as standin:
+            exports = [
+                idd.read_text(idd.export_doc_url(doc_id, standin.base_url)) for doc_id in standin.docs
+            ]
+            results: dict[str, list[float]] = {"clean (cold)": [], "clean (warm)": [], "split": []}
+            for i, html in enumerate(exports):
+                for label in ("clean (cold)", "clean (warm)"):
+                    t0 = time.perf_counter()
+                    cleaned, _ = idd.clean_google_doc_html(html, slug=f"doc-{i}", store=store)
+                    results[label].append(time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                idd.split_doc_into_sections(cleaned)
+                results["split"].append(time.perf_counter() - t0)
+        kb = statistics.median(len(h) for h in exports) / 1024
+        print(
+            f"{args.docs} docs, median export {kb:.0f} KB, {args.images} remote + {args.inline} inline images each; "
+            f"parser: {idd.HTML_PARSER}"
+        )
+        print(f"{'stage':<16}{'median ms':>12}{'p90 ms':>10}{'total s':>10}")
+        for name, times in results.items():
+            print(_stats_row(name, times))
+
+
+_TIMED_MAIN = (
+    "import json, sys, time\n"
+    "sys.path.insert(0, sys.argv[1])\n"
+    "mod = __import__(sys.argv[2])\n"
+    "t0 = time.perf_counter()\n"
+    "rc = mod.main(sys.argv[3:])\n"
+    "print(json.dumps({'seconds': time.perf_counter() - t0, 'rc': rc}))\n"
+)
+
+
+def scratch_site(dest: Path) -> Path:
+    """Copy the site (without git history, caches or design sources) so tools can run against it."""
+    shutil.copytree(
+        ROOT, dest, ignore=shutil.ignore_patterns(".git", ".build-cache", "design", "__pycache__", "*.xlsx")
+    )
+    return dest
+
+
+def timed_main(site: Path, module: str, *args: str) -> float:
+    """Seconds spent in `module`.main(args), run inside the scratch copy `site`."""
+    proc = subprocess.run(
+        [sys.executable, "-c", _TIMED_MAIN, str(site / "tools"), module, *args],
+        cwd=site,
+        capture_output=True,
+        text=True,
+    )
+    try:
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        raise SystemExit(f"{module} failed:\n{proc.stdout}\n{proc.stderr}")
+    if result["rc"] != 0:
+        raise SystemExit(f"{module} exited {result['rc']}:\n{proc.stdout}")
+    return result["seconds"]
+
+
+def bench_sync(args: argparse.Namespace) -> None:
+    print(f"{'rows':>8}{'cold s':>10}{'warm s':>10}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            site = scratch_site(Path(tmp) / "site")
+            xlsx = Path(tmp) / "map.xlsx"
+            synthetic_workbook(xlsx, rows, sheets=args.sheets)
+            cold = timed_main(site, "sync_from_xlsx", "--xlsx", str(xlsx))
+            warm = timed_main(site, "sync_from_xlsx", "--xlsx", str(xlsx))
+            print(f"{rows:>8}{cold:>10.2f}{warm:>10.2f}")
+
+
+def bench_full(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        site = scratch_site(Path(tmp) / "site")
+        xlsx = Path(tmp) / "map.xlsx"
+        synthetic_workbook(xlsx, args.rows, sheets=1)
+        sync_s = timed_main(site, "sync_from_xlsx", "--xlsx", str(xlsx))
+        titles = [c["title"] for c in sync_from_xlsx.read_careers(xlsx)[: args.docs]]
+        write_doc_fixtures(
+            Path(tmp) / "fixtures", titles, paragraphs=args.paragraphs, images=args.images, inline=args.inline
+        )
+        with DriveStandIn(Path(tmp) / "fixtures", delay=args.latency, flaky=args.flaky) as standin:
+            flags = ["--folder-url", standin.folder_url, "--docs-url", standin.base_url, "--export", args.export]
+            if args.no_optimize:
+                flags.append("--no-optimize")
+            cold = timed_main(site, "import_drive_docs", *flags)
+            requests_cold = standin.requests
+            warm = timed_main(site, "import_drive_docs", *flags)
+            requests_warm = standin.requests - requests_cold
+        print(
+            f"{args.rows} careers, {args.docs} docs x ({args.images} remote + {args.inline} inline images), "
+            f"{args.latency * 1e3:.0f} ms simulated latency, {args.flaky:.0%} throttled/failed requests, "
+            f"{args.export} exports"
+        )
+        print(f"{'run':<20}{'seconds':>10}{'requests':>10}")
+        print(f"{'sync':<20}{sync_s:>10.2f}{'-':>10}")
+        print(f"{'import (cold)':<20}{cold:>10.2f}{requests_cold:>10}")
+        print(f"{'import (warm)':<20}{warm:>10.2f}{requests_warm:>10}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmarks for the SheTech Pathways build tools.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("parse", help="import pipeline parse/serialize time per doc")
+    p.add_argument("--docs", type=int, default=20)
+    p.add_argument("--paragraphs", type=int, default=120)
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_parse)
+
+    p = sub.add_parser("xlsx", help="workbook ingestion time/memory vs. row count")
+    p.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    p.add_argument("--sheets", type=int, default=4)
+    p.set_defaults(func=bench_xlsx)
+
+    p = sub.add_parser("folder", help="Drive folder scraping vs. number of docs")
+    p.add_argument("--docs", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_folder)
+
+    p = sub.add_parser("clean", help="clean/split time per Doc export with images")
+    p.add_argument("--docs", type=int, default=20)
+    p.add_argument("--paragraphs", type=int, default=120)
+    p.add_argument("--images", type=int, default=4, help="remote images per doc")
+    p.add_argument("--inline", type=int, default=2, help="inline base64 images per doc")
+    p.set_defaults(func=bench_clean)
+
+    p = sub.add_parser("sync", help="sync_from_xlsx.main() vs. workbook rows")
+    p.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    p.add_argument("--sheets", type=int, default=1)
+    p.set_defaults(func=bench_sync)
+
+    p = sub.add_parser("full", help="sync + import end to end against the local stand-in")
+    p.add_argument("--rows", type=int, default=200, help="careers in the generated workbook")
+    p.add_argument("--docs", type=int, default=50, help="careers that get a Doc")
+    p.add_argument("--paragraphs", type=int, default=120)
+    p.add_argument("--images", type=int, default=3)
+    p.add_argument("--inline", type=int, default=1)
+    p.add_argument("--latency", type=float, default=0.02, help="simulated per-request latency (seconds)")
+    p.add_argument("--flaky", type=float, default=0.0, help="fraction of requests the stand-in answers 429/503")
+    p.add_argument("--no-optimize", action="store_true", help="skip WebP/AVIF variants")
+    p.add_argument("--export", choices=["html", "zip"], default="html", help="import_drive_docs.py --export mode")
+    p.set_defaults(func=bench_full)
+
+    args = ap.parse_args()
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
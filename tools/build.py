@@ -0,0 +1,553 @@
+"""
+Build the whole site with one command, rebuilding only what changed.
+
+The steps that used to be run by hand, in order and each as a full pass
+(sync_from_xlsx.py, import_drive_docs.py, build_qr_codes.py,
+build_assets.py), are nodes of one dependency graph:
+
+  workbook   SheTech_Career_Map.xlsx -> the career rows (cached in .build-cache/)
+  pages      each row -> its careers-data.js entry and careers/<slug>.html shell
+  docs       each Drive Doc -> the panels in its page and assets/doc-images/
+  qr         each career page URL -> assets/qr/ (only with a base URL)
+  media      the hero images -> doc-media.js (with sizes and placeholders)
+  site-data  rows, heroes and page text -> careers-index.js, data/careers/*.js,
+             search-index.js and the grids in index.html / qr-sheet.html
+  dist       the site -> dist/ (see build_assets.py)
+
+.build-cache/build-state.json records, for each node, a fingerprint (sha256)
+of every input it read and of every file it wrote. Inputs are keyed per
+career where a node works per career. A node runs only if one of them
+changed since the last build, and then only for the careers whose inputs
+changed: an edited workbook row re-renders that one page, QR code and shard.
+A change to a node's tool (its .py file), its options, or one of its shared
+files (careers-data.js, index.html, ...) reruns all of it. File digests are
+reused while a file's size and mtime are unchanged, so an up-to-date build
+hashes almost nothing.
+
+Without the workbook, the careers come from careers-data.js and the pages
+node leaves the page shells as they are (sync_from_xlsx.py cannot run either).
+
+The docs node's inputs live in Drive, so it runs on every build (--offline
+skips it); import_drive_docs.py's own manifest (ETag / export hash per Doc)
+then skips the Docs that have not changed. Its import options are passed on
+as import_drive_docs.py flags, so it imports exactly as that tool would.
+
+Nodes run on a thread pool as soon as their dependencies are done, so the
+Drive import and the QR codes build side by side. Every site change is staged
+into one OutputReport and committed together (see site_output.py), then dist/
+is built from the result. A failed build leaves the site and the recorded
+state as they were.
+
+Run:
+  python tools/build.py [--offline] [--base-url https://example.org/pathways] [--no-dist]
+                        [--force] [--changes changes.json] [--metrics-json build.json]
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+
+import build_metrics
+import image_variants
+import import_drive_docs
+from build_assets import DIST_DIR, MinifyError, site_files, write_dist
+from build_metrics import active as metrics
+from http_client import configure as configure_http
+from image_meta import sized_hero
+from image_variants import ImageOptimizer
+from import_drive_docs import DocImport, FetchPool, careers_from_data, finish_import, import_docs
+from site_data import (
+    CAREERS_INDEX_JS,
+    DOC_MEDIA_JS,
+    INDEX_HTML,
+    QR_MANIFEST_JS,
+    QR_SHEET_HTML,
+    SEARCH_INDEX_JS,
+    SHARDS_DIR,
+    read_doc_media,
+    render_doc_media,
+    write_site_data,
+)
+from site_output import CAREERS_DIR, OutputReport, output_lock, read_window_json
+from sync_from_xlsx import CAREERS_DATA_JS, XLSX, WorkbookError, read_careers, write_careers
+
+try:
+    import build_qr_codes
+except ImportError:  # segno is optional; without it the qr node is left out.
+    build_qr_codes = None
+
+
+ROOT = Path(__file__).resolve().parents[1]
+TOOLS_DIR = ROOT / "tools"
+ASSETS_DIR = ROOT / "assets" / "doc-images"
+BUILD_STATE = ROOT / ".build-cache" / "build-state.json"
+# The rows of the last workbook read, so an up-to-date build need not re-read the workbook.
+WORKBOOK_ROWS = ROOT / ".build-cache" / "workbook-rows.json"
+DEFAULT_JOBS = 4
+
+# Keys starting with this cover a whole node (tool, options, shared files);
+# when one changes, the node rebuilds everything.
+WHOLE = "@"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _digest_json(value) -> str:
+    return _digest(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+class Fingerprints:
+    """sha256 of files, reusing the last build's digest while (size, mtime) is unchanged."""
+
+    def __init__(self, known: dict[str, list]) -> None:
+        self._known = known
+        self.seen: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def file(self, path: Path) -> str | None:
+        rel = _rel(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        sig = [st.st_size, st.st_mtime_ns]
+        with self._lock:
+            known = self.seen.get(rel) or self._known.get(rel)
+        if known and known[:2] == sig:
+            digest = known[2]
+        else:
+            digest = _digest(path.read_bytes())
+        with self._lock:
+            self.seen[rel] = [*sig, digest]
+        return digest
+
+
+@dataclass(frozen=True)
+class Node:
+    """
+    A build step. inputs() gives key -> fingerprint once the dependencies are
+    done, outputs() key -> the files written for that key, and run() gets the
+    keys to rebuild (None for all). reuse() loads what later nodes need when
+    the step is up to date and run() is skipped.
+    """
+
+    name: str
+    deps: tuple[str, ...]
+    inputs: Callable[["Build"], dict[str, str | None]]
+    outputs: Callable[["Build"], dict[str, list[Path]]]
+    run: Callable[["Build", set[str] | None], None]
+    reuse: Callable[["Build"], None] | None = None
+    remote: bool = False  # inputs are not local (Drive): always run
+
+
+class Build:
+    def __init__(self, args: argparse.Namespace, import_args: argparse.Namespace | None) -> None:
+        self.args = args
+        self.import_args = import_args
+        self.report = OutputReport()
+        self.previous = {} if args.force else load_build_state()
+        self.fingerprints = Fingerprints(self.previous.get("files", {}))
+        self.state: dict[str, dict] = {}
+        self.inputs: dict[str, dict[str, str | None]] = {}
+        self.rows: list[dict] = []
+        self.from_workbook = args.xlsx.exists()
+        self.media: dict[str, dict] = {}
+        self.doc_import: DocImport | None = None
+        self.ran: list[str] = []
+        self._print_lock = threading.Lock()
+
+    def log(self, node: str, message: str) -> None:
+        with self._print_lock:
+            print(f"[{node}] {message}", flush=True)
+
+    def tool(self, name: str) -> str | None:
+        return self.fingerprints.file(TOOLS_DIR / name)
+
+    def staged_digest(self, path: Path) -> str | None:
+        """Fingerprint of a file as this build leaves it (staged, else live)."""
+        try:
+            return _digest(self.report.read_bytes(path))
+        except FileNotFoundError:
+            return None
+
+    # -- graph ------------------------------------------------------------------
+
+    def run_nodes(self, nodes: list[Node]) -> None:
+        """Run `nodes`, each once all of its dependencies among them are done."""
+        names = {n.name for n in nodes}
+        done: set[str] = set()
+        pending = list(nodes)
+        running: dict[Future, Node] = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.args.jobs)) as ex:
+            while pending or running:
+                for node in [n for n in pending if all(d in done or d not in names for d in n.deps)]:
+                    pending.remove(node)
+                    running[ex.submit(self._run_node, node)] = node
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    future.result()  # re-raise the node's error; the rest finish, nothing new starts
+                    done.add(node.name)
+
+    def _run_node(self, node: Node) -> None:
+        with metrics().stage(f"node.{node.name}"):
+            inputs = node.inputs(self)
+            self.inputs[node.name] = inputs
+            dirty = self._dirty(node, inputs)
+            if dirty is not None and not dirty and not node.remote:
+                self.log(node.name, "up to date")
+                if node.reuse is not None:
+                    node.reuse(self)
+                return
+            self.ran.append(node.name)
+            node.run(self, dirty)
+
+    def _dirty(self, node: Node, inputs: dict[str, str | None]) -> set[str] | None:
+        """Keys whose inputs or written files changed since the last build; None means everything."""
+        prev = self.previous.get("nodes", {}).get(node.name)
+        if prev is None:
+            return None
+        before = prev.get("inputs", {})
+        changed = {k for k in inputs.keys() | before.keys() if inputs.get(k) != before.get(k)}
+        written = prev.get("outputs", {})
+        current: set[str] = set()
+        for key, paths in node.outputs(self).items():
+            current.update(_rel(p) for p in paths)
+            if any(written.get(_rel(p)) != self.fingerprints.file(p) for p in paths):
+                changed.add(key)
+        if any(rel not in current and not (ROOT / rel).exists() for rel in written):
+            return None  # a file it wrote is gone, e.g. dist/ was deleted
+        if any(k.startswith(WHOLE) for k in changed):
+            return None
+        return changed
+
+    def record(self, nodes: list[Node]) -> None:
+        """Remember the inputs and (now live) outputs of `nodes` for the next build."""
+        for node in nodes:
+            if node.name not in self.inputs:
+                continue
+            written = {_rel(p): self.fingerprints.file(p) for paths in node.outputs(self).values() for p in paths}
+            self.state[node.name] = {"inputs": self.inputs[node.name], "outputs": written}
+
+    def save(self) -> None:
+        nodes = {**self.previous.get("nodes", {}), **self.state}
+        BUILD_STATE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = BUILD_STATE.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": 1, "nodes": nodes, "files": self.fingerprints.seen}, indent=1, sort_keys=True)
+            + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp, BUILD_STATE)
+
+
+def load_build_state() -> dict:
+    """{"nodes": {name: {"inputs": {...}, "outputs": {...}}}, "files": {path: [size, mtime_ns, sha256]}}"""
+    try:
+        data = json.loads(BUILD_STATE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) and data.get("version") == 1 else {}
+
+
+# -- nodes ----------------------------------------------------------------------
+
+
+def _page(slug: str) -> Path:
+    return CAREERS_DIR / f"{slug}.html"
+
+
+def workbook_node() -> Node:
+    # The node's output is WORKBOOK_ROWS, a copy of the rows it read, not
+    # careers-data.js: that is the pages node's output, and reading it back
+    # here would carry a hand edit of it into the next build.
+    def inputs(b: Build) -> dict[str, str | None]:
+        return {"@xlsx": b.fingerprints.file(b.args.xlsx), "@tool": b.tool("sync_from_xlsx.py")}
+
+    def outputs(b: Build) -> dict[str, list[Path]]:
+        return {"@": [WORKBOOK_ROWS]} if b.from_workbook else {}
+
+    def run(b: Build, dirty: set[str] | None) -> None:
+        if not b.from_workbook:
+            reuse(b)
+            return
+        with metrics().stage("read_workbook"):
+            b.rows = read_careers(b.args.xlsx)
+        WORKBOOK_ROWS.parent.mkdir(parents=True, exist_ok=True)
+        tmp = WORKBOOK_ROWS.with_suffix(".tmp")
+        tmp.write_text(json.dumps(b.rows, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, WORKBOOK_ROWS)
+        b.log("workbook", f"read {len(b.rows)} careers")
+
+    def reuse(b: Build) -> None:
+        if b.from_workbook:
+            b.rows = json.loads(WORKBOOK_ROWS.read_text(encoding="utf-8"))
+        else:
+            b.log("workbook", f"no {b.args.xlsx.name}; using the careers in {CAREERS_DATA_JS.name}")
+            b.rows = read_window_json(CAREERS_DATA_JS, "SHT_CAREERS")
+
+    return Node("workbook", (), inputs, outputs, run, reuse=reuse)
+
+
+def pages_node() -> Node:
+    def inputs(b: Build) -> dict[str, str | None]:
+        fields: dict[str, str | None] = {"@tool": b.tool("sync_from_xlsx.py"), "@workbook": str(b.from_workbook)}
+        return {**fields, **{c["slug"]: _digest_json(c) for c in b.rows}}
+
+    def outputs(b: Build) -> dict[str, list[Path]]:
+        return {"@": [CAREERS_DATA_JS], **{c["slug"]: [_page(c["slug"])] for c in b.rows}}
+
+    def run(b: Build, dirty: set[str] | None) -> None:
+        if not b.from_workbook:
+            # Like sync_from_xlsx.py, which needs the workbook: the pages stay as they are.
+            b.log("pages", "no workbook; keeping the career pages as they are")
+            return
+        write_careers(b.report, b.rows, dirty)
+        count = len(b.rows) if dirty is None else len(dirty & {c["slug"] for c in b.rows})
+        b.log("pages", f"rendered {count} of {len(b.rows)} career pages")
+
+    return Node("pages", ("workbook",), inputs, outputs, run)
+
+
+def docs_node() -> Node:
+    def run(b: Build, dirty: set[str] | None) -> None:
+        args = b.import_args
+        optimizer = None
+        if not args.no_optimize and image_variants.available():
+            optimizer = ImageOptimizer(args.image_workers, avif=args.avif)
+        http = configure_http(timeout=args.timeout, retries=args.retries, rate=args.rate)
+        try:
+            with FetchPool(args.workers, args.per_host) as pool:
+                result = import_docs(args, pool, optimizer, b.report, careers_from_data(b.rows))
+        finally:
+            if optimizer is not None:
+                optimizer.close()
+            http.close()
+        b.doc_import = result
+        b.log(
+            "docs",
+            f"{result.matched} of {result.found} Docs match a career: "
+            f"{len(result.updated)} pages updated, {len(result.unchanged)} unchanged",
+        )
+        for title in result.unmatched:
+            b.log("docs", f"no career matches Doc {title!r}")
+
+    return Node("docs", ("pages",), lambda b: {"@tool": b.tool("import_drive_docs.py")}, lambda b: {}, run, remote=True)
+
+
+def _hero_path(entry: dict) -> Path | None:
+    src = str(entry.get("heroImageLargeSrc") or entry.get("heroImageSrc") or "")
+    return ROOT / src[2:] if src.startswith("./") else None
+
+
+def media_node(deps: tuple[str, ...]) -> Node:
+    def inputs(b: Build) -> dict[str, str | None]:
+        if b.doc_import is not None:
+            b.media = dict(b.doc_import.media)
+        else:
+            # Offline: keep the heroes of the last import for careers still in the sheet.
+            slugs = {c["slug"] for c in b.rows}
+            b.media = {slug: entry for slug, entry in read_doc_media().items() if slug in slugs}
+        fields: dict[str, str | None] = {"@tool": b.tool("image_meta.py")}
+        for slug, entry in b.media.items():
+            path = _hero_path(entry)
+            fields[slug] = _digest_json([entry, b.fingerprints.file(path) if path else None])
+        return fields
+
+    def run(b: Build, dirty: set[str] | None) -> None:
+        b.media = {slug: sized_hero(e) if dirty is None or slug in dirty else e for slug, e in b.media.items()}
+        b.report.write_text(DOC_MEDIA_JS, render_doc_media(b.media))
+        b.log("media", f"{len(b.media)} hero images")
+
+    return Node("media", deps, inputs, lambda b: {"@": [DOC_MEDIA_JS]}, run)
+
+
+def qr_node(base_url: str, fmt: str) -> Node:
+    def inputs(b: Build) -> dict[str, str | None]:
+        fields: dict[str, str | None] = {"@tool": b.tool("build_qr_codes.py"), "@format": fmt}
+        for c in b.rows:
+            fields[c["slug"]] = _digest(f"{base_url}/careers/{c['slug']}.html".encode("utf-8"))
+        return fields
+
+    def outputs(b: Build) -> dict[str, list[Path]]:
+        qr_dir = QR_MANIFEST_JS.parent
+        return {"@": [QR_MANIFEST_JS], **{c["slug"]: [qr_dir / f"{c['slug']}.{fmt}"] for c in b.rows}}
+
+    def run(b: Build, dirty: set[str] | None) -> None:
+        files = build_qr_codes.write_qr_codes(b.report, b.rows, base_url, fmt, only=dirty)
+        count = len(files) if dirty is None else len(dirty & {c["slug"] for c in b.rows})
+        b.log("qr", f"rendered {count} of {len(files)} QR codes for {base_url}")
+
+    return Node("qr", ("pages",), inputs, outputs, run)
+
+
+def site_data_node(deps: tuple[str, ...]) -> Node:
+    def inputs(b: Build) -> dict[str, str | None]:
+        fields: dict[str, str | None] = {"@tool": b.tool("site_data.py"), "@qr": b.staged_digest(QR_MANIFEST_JS)}
+        for c in b.rows:
+            slug = c["slug"]
+            fields[slug] = _digest_json([c, b.media.get(slug), b.staged_digest(_page(slug))])
+        return fields
+
+    def outputs(b: Build) -> dict[str, list[Path]]:
+        shared = [CAREERS_INDEX_JS, SEARCH_INDEX_JS, INDEX_HTML, QR_SHEET_HTML]
+        return {"@": shared, **{c["slug"]: [SHARDS_DIR / f"{c['slug']}.js"] for c in b.rows}}
+
+    def run(b: Build, dirty: set[str] | None) -> None:
+        write_site_data(b.report, b.rows, b.media, shards=dirty)
+        count = len(b.rows) if dirty is None else len(dirty & {c["slug"] for c in b.rows})
+        b.log("site-data", f"refreshed the index, search and grids; {count} career shards")
+
+    return Node("site-data", deps, inputs, outputs, run)
+
+
+def dist_node() -> Node:
+    def inputs(b: Build) -> dict[str, str | None]:
+        options = f"compress={not b.args.no_compress},sw={not b.args.no_sw}"
+        fields: dict[str, str | None] = {"@tool": b.tool("build_assets.py"), "@options": options}
+        for rel in site_files(ROOT):
+            fields[rel] = b.fingerprints.file(ROOT / rel)
+        return fields
+
+    def outputs(b: Build) -> dict[str, list[Path]]:
+        return {"@": sorted(p for p in DIST_DIR.rglob("*") if p.is_file()) if DIST_DIR.is_dir() else []}
+
+    def run(b: Build, dirty: set[str] | None) -> None:
+        # Fingerprinted names cascade (a changed shard renames, so every page
+        # that loads it changes), so dist/ is always rebuilt as a whole.
+        dist = write_dist(DIST_DIR, compress=not b.args.no_compress, sw=not b.args.no_sw)
+        b.log("dist", f"{_rel(DIST_DIR)}/: {dist.summary()}")
+        for paths, more in (
+            (b.report.created, dist.created),
+            (b.report.updated, dist.updated),
+            (b.report.removed, dist.removed),
+        ):
+            paths.extend(more)
+
+    return Node("dist", ("site-data",), inputs, outputs, run)
+
+
+def qr_base_url(args: argparse.Namespace) -> str:
+    """--base-url, else $SHT_BASE_URL, else the one the current QR codes were built for."""
+    base = args.base_url or os.environ.get("SHT_BASE_URL", "")
+    if not base and QR_MANIFEST_JS.exists():
+        base = str(read_window_json(QR_MANIFEST_JS, "SHT_QR").get("baseUrl") or "")
+    return build_qr_codes.normalize_base_url(base) if build_qr_codes is not None else ""
+
+
+def site_nodes(args: argparse.Namespace) -> list[Node]:
+    nodes = [workbook_node(), pages_node()]
+    media_deps: tuple[str, ...] = ("pages",)
+    if not args.offline:
+        nodes.append(docs_node())
+        media_deps = ("docs",)
+    nodes.append(media_node(media_deps))
+    site_deps: tuple[str, ...] = ("pages", "media")
+    base_url = qr_base_url(args)
+    if build_qr_codes is None:
+        print("segno not installed; leaving assets/qr/ as it is (pip install segno).")
+    elif not base_url.startswith(("http://", "https://")):
+        print("No QR base URL (pass --base-url or set SHT_BASE_URL); leaving assets/qr/ as it is.")
+    else:
+        nodes.append(qr_node(base_url, args.qr_format))
+        site_deps += ("qr",)
+    nodes.append(site_data_node(site_deps))
+    return nodes
+
+
+# -- main -----------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Build the site, rebuilding only what changed since the last build.")
+    ap.add_argument("--xlsx", type=Path, default=XLSX, help="career map workbook (default: design/SheTech_Career_Map.xlsx)")
+    ap.add_argument("--offline", action="store_true", help="skip the Drive import; keep the panels and heroes already imported")
+    ap.add_argument("--force", action="store_true", help="ignore the recorded state (and the import manifest); rebuild everything")
+    ap.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="build steps run at once")
+    ap.add_argument("--base-url", default="", help="public site URL for the QR codes (default: $SHT_BASE_URL, else the last one)")
+    ap.add_argument("--qr-format", choices=["svg", "png"], default="svg")
+    ap.add_argument("--folder-url", default=import_drive_docs.DRIVE_FOLDER_URL, help="public Drive folder URL")
+    ap.add_argument("--docs-url", default=import_drive_docs.DOCS_BASE_URL, help="Google Docs base URL used for exports")
+    ap.add_argument("--export", choices=sorted(import_drive_docs.EXPORT_FETCHERS), default="html", help="Doc export format")
+    ap.add_argument("--workers", type=int, default=import_drive_docs.DEFAULT_WORKERS, help="network worker threads")
+    ap.add_argument("--per-host", type=int, default=import_drive_docs.DEFAULT_PER_HOST, help="max concurrent requests per host")
+    ap.add_argument("--no-optimize", action="store_true", help="serve original images (skip WebP/AVIF variants)")
+    ap.add_argument("--avif", action="store_true", help="also emit AVIF variants (if Pillow supports it)")
+    ap.add_argument("--no-slim", action="store_true", help="keep the cleaned Doc markup as is (skip slim_html.py)")
+    ap.add_argument("--no-dist", action="store_true", help="stop after the site; do not build dist/")
+    ap.add_argument("--no-compress", action="store_true", help="skip the .gz/.br siblings in dist/")
+    ap.add_argument("--no-sw", action="store_true", help="do not generate dist/sw.js")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    ap.add_argument("--metrics-json", type=Path, help="write stage/career timings and counters as JSON")
+    args = ap.parse_args(argv)
+
+    import_args = None
+    if not args.offline:
+        # The same settings as running import_drive_docs.py with these flags.
+        flags = ["--folder-url", args.folder_url, "--docs-url", args.docs_url, "--export", args.export]
+        flags += ["--workers", str(args.workers), "--per-host", str(args.per_host)]
+        flags += ["--force"] * args.force + ["--no-optimize"] * args.no_optimize
+        flags += ["--avif"] * args.avif + ["--no-slim"] * args.no_slim
+        import_args = import_drive_docs.parse_args(flags)
+
+    run = build_metrics.begin("build")
+    try:
+        with output_lock():
+            return _run_build(Build(args, import_args))
+    except WorkbookError as e:
+        print(e, file=sys.stderr)
+        return 2
+    except MinifyError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        print(run.summary())
+        if args.metrics_json:
+            run.write_json(args.metrics_json)
+
+
+def _run_build(b: Build) -> int:
+    nodes = site_nodes(b.args)
+    b.run_nodes(nodes)
+    with metrics().stage("commit"):
+        b.report.commit()
+    if b.doc_import is not None:
+        removed = finish_import(b.doc_import)
+        if removed:
+            b.log("docs", f"removed {len(removed)} unreferenced image files")
+        b.report.record_dir_changes(b.doc_import.images_before, ASSETS_DIR)
+    b.record(nodes)
+    b.save()
+
+    if not b.args.no_dist:
+        dist = [dist_node()]
+        b.run_nodes(dist)
+        b.record(dist)
+        b.save()
+
+    print(f"Ran {', '.join(b.ran) or 'nothing'}; output files: {b.report.summary()}")
+    if b.args.changes:
+        b.report.write_changes(b.args.changes)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
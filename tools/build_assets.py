@@ -0,0 +1,610 @@
+"""
+Build a deployable copy of the site in dist/ with minified, fingerprinted assets.
+
+Pages load styles.css, script.js and the generated data scripts unminified and
+under fixed names, so every visit has to revalidate them. This tool, run after
+sync_from_xlsx.py / import_drive_docs.py (and build_qr_codes.py), writes dist/:
+
+- styles.css and script.js minified (comments and layout whitespace dropped;
+  line breaks in JavaScript are kept where automatic semicolon insertion could
+  depend on them)
+- the window.SHT_* = <json>; data scripts (careers-index.js, data/careers/*.js,
+  search-index.js, assets/qr/qr-codes.js, ...) re-serialized compactly
+- every CSS/JS file renamed to <name>.<content hash>.<ext>, with the <script
+  src> / <link href> references in the HTML pages, and the asset paths quoted
+  in script.js (search-index.js, assets/qr/qr-codes.js), rewritten to match,
+  so everything but the HTML can be served with a long cache lifetime
+- HTML, images and other files copied as they are
+- .gz (and .br, if the brotli module is installed) next to every text file
+  that compresses, for servers that serve precompressed files (nginx
+  gzip_static / brotli_static, Caddy precompressed)
+
+- sw.js, a service worker (registered by script.js) that precaches the pages,
+  the CSS/JS/data, the shared assets they reference (up to PRECACHE_MAX_BYTES
+  each) and the optimized hero images in doc-media.js. Pages (navigations and
+  *.html) are fetched from the network first and served from the cache only
+  when offline, so a rebuilt page shows up on the next visit; the fingerprinted
+  assets are answered cache first. Other same-origin files are cached as they
+  are first fetched.
+  Its cache version is a hash of every precached file, so any content change
+  installs a fresh cache and drops the old one; sw.js itself keeps its name
+
+minify_js() tells a regular expression from a division by the token before the
+slash, which is a guess. When node is installed, every minified script (and
+sw.js) is parsed with `node --check` and the build fails with MinifyError if
+the original parses but the minified copy does not; without node the check is
+skipped.
+
+Every build lists the files it wrote in dist/.build-assets.json; files the
+previous build listed that this one no longer writes (old hashes) are removed.
+Nothing else in the output directory is touched, and an output directory that
+contains the site, or lies inside one of its deployed trees, is refused. Output
+goes through OutputReport, so unchanged files are not rewritten and the new
+build is swapped in at the end.
+
+Run:
+  python tools/build_assets.py [--out dist] [--no-compress] [--no-sw] [--changes changes.json]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path, PurePosixPath
+import argparse
+import gzip
+import hashlib
+import json
+import posixpath
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from site_data import read_doc_media
+from site_output import OutputReport, output_lock, parse_window_json
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DIST_DIR = ROOT / "dist"
+
+# What is deployed: the pages and scripts at the top level plus these trees.
+SITE_DIRS = ("assets", "careers", "data")
+SITE_ROOT_SUFFIXES = (".html", ".js", ".css")
+
+HASH_CHARS = 10
+COMPRESS_SUFFIXES = frozenset({".html", ".css", ".js", ".json", ".svg", ".txt", ".xml"})
+COMPRESS_MIN_BYTES = 256
+
+_WINDOW_DATA = re.compile(r"^\s*window\.([A-Za-z_$][\w$]*)\s*=")
+
+SW_NAME = "sw.js"
+# Shared assets bigger than this (e.g. the landing cover photo) are cached on
+# first use instead of being downloaded by every visitor's first page view.
+PRECACHE_MAX_BYTES = 1024 * 1024
+DOC_IMAGES_DIR = "assets/doc-images/"
+
+# Written into the output directory: what the last build wrote there, so the
+# next one removes only its own stale files.
+DIST_MANIFEST = ".build-assets.json"
+DIST_MANIFEST_VERSION = 1
+
+
+def site_files(root: Path = ROOT) -> list[str]:
+    """Site-relative POSIX paths of every deployable file."""
+    files = [p.name for p in sorted(root.iterdir()) if p.is_file() and p.suffix in SITE_ROOT_SUFFIXES]
+    for d in SITE_DIRS:
+        base = root / d
+        if base.is_dir():
+            files.extend(
+                p.relative_to(root).as_posix()
+                for p in sorted(base.rglob("*"))
+                if p.is_file() and not any(part.startswith(".") for part in p.relative_to(root).parts)
+            )
+    return files
+
+
+# -- minifiers -----------------------------------------------------------------
+
+_CSS_PARTS = re.compile(r"""/\*.*?\*/|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|[^"'/]+|/""", re.S)
+
+
+def _minify_css_code(seg: str) -> str:
+    seg = re.sub(r"\s+", " ", seg)
+    seg = re.sub(r" ?([{};,>]) ?", r"\1", seg)
+    return seg.replace(": ", ":").replace(" !", "!").replace(";}", "}")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and insignificant whitespace; strings are left alone."""
+    for _ in range(2):  # the second pass tidies whitespace that surrounded comments
+        out = []
+        for m in _CSS_PARTS.finditer(css):
+            part = m.group(0)
+            if part.startswith("/*"):
+                continue
+            out.append(part if part[0] in "\"'" else _minify_css_code(part))
+        css = "".join(out)
+    return css.strip() + "\n"
+
+
+_JS_IDENT = re.compile(r"[\w$\\\u0080-\uffff]")
+_JS_WORD = re.compile(r"[\w$\\\u0080-\uffff]+")
+_JS_SPACE = " \t\r\n\f\v\u00a0\ufeff"
+# After these, a "/" starts a regular expression rather than a division.
+_REGEX_AFTER_CHARS = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_AFTER_WORDS = frozenset(
+    "return typeof case do else in of new delete void throw instanceof yield await".split()
+)
+# A line break can be dropped after / before these without changing where
+# automatic semicolon insertion applies.
+_NEWLINE_SAFE_AFTER = set("{([,;:=?&|!<>*%~^")
+_NEWLINE_SAFE_BEFORE = set(")]},;:.?=")
+
+
+class MinifyError(Exception):
+    pass
+
+
+def minify_js(src: str) -> str:
+    """
+    Conservative JavaScript minifier: removes comments and indentation and
+    collapses whitespace, never renames or reorders anything. Strings, template
+    literals (including nested ${...}) and regular expression literals are
+    copied verbatim.
+    """
+    out: list[str] = []
+    last = ""  # last character written
+    last_word = ""  # last identifier/keyword written, for regex detection
+    ws = 0  # pending whitespace: 0 none, 1 space, 2 newline
+    templates: list[int] = []  # brace depth of each open ${...}
+    i, n = 0, len(src)
+
+    def emit(tok: str, word: str = "") -> None:
+        nonlocal last, last_word, ws
+        if ws and last:
+            first = tok[0]
+            ident = bool(_JS_IDENT.match(last)) and bool(_JS_IDENT.match(first))
+            clash = (last == first and last in "+-") or (last == "/" and first in "/*") or (
+                last.isdigit() and first == "."
+            )
+            if ws == 2 and not (last in _NEWLINE_SAFE_AFTER or first in _NEWLINE_SAFE_BEFORE):
+                out.append("\n")
+            elif ident or clash:
+                out.append(" ")
+        out.append(tok)
+        last = tok[-1]
+        last_word = word
+        ws = 0
+
+    def scan_template(j: int) -> int:
+        """From just after ` (or a closing } of ${...}) to the end of the literal or the next ${."""
+        while j < n:
+            c = src[j]
+            if c == "\\":
+                j += 2
+            elif c == "`":
+                return j + 1
+            elif c == "$" and src.startswith("${", j):
+                templates.append(0)
+                return j + 2
+            else:
+                j += 1
+        return n
+
+    while i < n:
+        c = src[i]
+        if c in _JS_SPACE:
+            j = i
+            while j < n and src[j] in _JS_SPACE:
+                j += 1
+            ws = max(ws, 2 if "\n" in src[i:j] or "\r" in src[i:j] else 1)
+            i = j
+        elif src.startswith("//", i):
+            j = src.find("\n", i)
+            i = n if j < 0 else j
+        elif src.startswith("/*", i):
+            j = src.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            ws = max(ws, 2 if "\n" in src[i:j] else 1)
+            i = j
+        elif c in "\"'":
+            j = i + 1
+            while j < n and src[j] != c:
+                j += 2 if src[j] == "\\" else 1
+            emit(src[i : j + 1])
+            i = j + 1
+        elif c == "`":
+            j = scan_template(i + 1)
+            emit(src[i:j])
+            i = j
+        elif c == "}" and templates and templates[-1] == 0:
+            templates.pop()
+            j = scan_template(i + 1)
+            emit(src[i:j])
+            i = j
+        elif c == "/" and (last in _REGEX_AFTER_CHARS or last == "" or last_word in _REGEX_AFTER_WORDS):
+            j, in_class = i + 1, False
+            while j < n:
+                ch = src[j]
+                if ch == "\\":
+                    j += 2
+                    continue
+                if ch == "[":
+                    in_class = True
+                elif ch == "]":
+                    in_class = False
+                elif ch == "/" and not in_class:
+                    break
+                elif ch == "\n":
+                    break
+                j += 1
+            j += 1
+            while j < n and (src[j].isalnum() or src[j] == "_"):
+                j += 1  # flags
+            emit(src[i:j])
+            i = j
+        elif _JS_IDENT.match(c):
+            m = _JS_WORD.match(src, i)
+            word = m.group(0)
+            emit(word, word)
+            i = m.end()
+        else:
+            if templates:
+                if c == "{":
+                    templates[-1] += 1
+                elif c == "}":
+                    templates[-1] -= 1
+            emit(c)
+            i += 1
+    return "".join(out) + "\n"
+
+
+def js_syntax_error(src: str) -> str | None:
+    """`node --check`'s complaint about `src`, or None if it parses (or node is not installed)."""
+    node = shutil.which("node")
+    if node is None:
+        return None
+    with tempfile.TemporaryDirectory(prefix="sht-js-check-") as tmp:
+        path = Path(tmp) / "check.js"
+        path.write_text(src, encoding="utf-8")
+        proc = subprocess.run([node, "--check", str(path)], capture_output=True, text=True)
+    if proc.returncode == 0:
+        return None
+    # node prints the offending line, a caret and the SyntaxError, then its own stack.
+    lines = [ln for ln in proc.stderr.replace(str(path), "<minified>").splitlines() if not ln.startswith("    at ")]
+    return "\n".join(lines).strip().split("\n\nNode.js")[0] or f"node --check exited with {proc.returncode}"
+
+
+def checked_minify_js(src: str, label: str) -> str:
+    """minify_js(), raising MinifyError if the output no longer parses (see js_syntax_error())."""
+    out = minify_js(src)
+    error = js_syntax_error(out)
+    # A script that was already broken is not the minifier's fault; it is shipped as minified.
+    if error is not None and js_syntax_error(src) is None:
+        raise MinifyError(f"minifying {label} produced invalid JavaScript:\n{error}")
+    return out
+
+
+def minify_data_js(src: str) -> str | None:
+    """Compact form of a `window.NAME = <json>;` data script; None if it is not one."""
+    m = _WINDOW_DATA.match(src)
+    if not m:
+        return None
+    try:
+        data = parse_window_json(src, m.group(1))
+    except ValueError:
+        return None
+    return f"window.{m.group(1)}=" + json.dumps(data, ensure_ascii=False, separators=(",", ":")) + ";\n"
+
+
+# -- fingerprinting -------------------------------------------------------------
+
+
+def fingerprinted(rel: str, data: bytes) -> str:
+    p = PurePosixPath(rel)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_CHARS]
+    return str(p.with_name(f"{p.stem}.{digest}{p.suffix}"))
+
+
+def rewrite_js_refs(src: str, renamed: dict[str, str]) -> str:
+    """Replace quoted site-relative asset paths ("search-index.js") with their hashed names."""
+    for old, new in renamed.items():
+        src = re.sub(rf"(?<=[\"']){re.escape(old)}(?=[\"'])", new, src)
+    return src
+
+
+_HTML_REF = re.compile(r"""\b(src|href)=(["'])([^"'#?]+)([^"']*)\2""", re.IGNORECASE)
+
+
+def rewrite_html_refs(page: str, page_rel: str, renamed: dict[str, str]) -> str:
+    """Point src/href attributes that name a fingerprinted file at its new name."""
+    base = posixpath.dirname(page_rel)
+
+    def sub(m: re.Match) -> str:
+        value = m.group(3)
+        if re.match(r"^[a-z][a-z0-9+.-]*:|^/", value, re.I):
+            return m.group(0)  # absolute URLs are not ours
+        target = posixpath.normpath(posixpath.join(base, value))
+        new = renamed.get(target)
+        if new is None:
+            return m.group(0)
+        value = value[: value.rfind("/") + 1] + posixpath.basename(new)
+        return f"{m.group(1)}={m.group(2)}{value}{m.group(4)}{m.group(2)}"
+
+    return _HTML_REF.sub(sub, page)
+
+
+def compressed_variants(rel: str, data: bytes) -> dict[str, bytes]:
+    if PurePosixPath(rel).suffix not in COMPRESS_SUFFIXES or len(data) < COMPRESS_MIN_BYTES:
+        return {}
+    out = {}
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        out[rel + ".gz"] = gz
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            out[rel + ".br"] = br
+    return out
+
+
+# -- service worker ---------------------------------------------------------------
+
+SW_TEMPLATE = """/* Generated by tools/build_assets.py; do not edit. */
+const VERSION = __VERSION__;
+const PRECACHE = __PRECACHE__;
+const PRECACHE_NAME = `sht-precache-${VERSION}`;
+const RUNTIME_NAME = `sht-runtime-${VERSION}`;
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches
+      .open(PRECACHE_NAME)
+      .then((cache) => cache.addAll(PRECACHE.map((url) => new Request(url, { cache: "reload" }))))
+      .then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  // Caches from earlier versions describe content that has since changed.
+  event.waitUntil(
+    caches
+      .keys()
+      .then((names) =>
+        Promise.all(
+          names
+            .filter((name) => name.startsWith("sht-") && name !== PRECACHE_NAME && name !== RUNTIME_NAME)
+            .map((name) => caches.delete(name))
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+async function cacheFirst(request) {
+  const cached = await caches.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok && response.type === "basic") {
+    const copy = response.clone();
+    caches.open(RUNTIME_NAME).then((cache) => cache.put(request, copy));
+  }
+  return response;
+}
+
+async function networkFirst(request) {
+  // Pages keep their names between builds, so a cached copy may be stale; it is only the offline fallback.
+  try {
+    const response = await fetch(request);
+    if (response.ok && response.type === "basic") {
+      const copy = response.clone();
+      caches.open(RUNTIME_NAME).then((cache) => cache.put(request, copy));
+    }
+    return response;
+  } catch (err) {
+    // Pages are opened with query strings (e.g. from QR codes); the cached copy is the same page.
+    const cached = await caches.match(request, { ignoreSearch: true });
+    if (cached) return cached;
+    throw err;
+  }
+}
+
+function isPage(request, url) {
+  return request.mode === "navigate" || url.pathname.endsWith("/") || url.pathname.endsWith(".html");
+}
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  const url = new URL(request.url);
+  if (request.method !== "GET" || url.origin !== self.location.origin) return;
+  event.respondWith(isPage(request, url) ? networkFirst(request) : cacheFirst(request));
+});
+"""
+
+
+def precache_list(outputs: dict[str, bytes], root: Path = ROOT) -> list[str]:
+    """
+    dist-relative URLs for the service worker to precache: every page, every
+    CSS/JS file, shared assets the pages, CSS or scripts mention, and the
+    optimized (variant) hero images named in doc-media.js.
+    """
+    text = b"\n".join(data for rel, data in outputs.items() if rel.endswith((".html", ".css", ".js")))
+    urls = []
+    for rel, data in outputs.items():
+        if rel.endswith((".html", ".css", ".js")):
+            urls.append(rel)
+        elif (
+            rel.startswith("assets/")
+            and not rel.startswith(DOC_IMAGES_DIR)
+            and len(data) <= PRECACHE_MAX_BYTES
+            and posixpath.basename(rel).encode("utf-8") in text
+        ):
+            urls.append(rel)
+    for entry in read_doc_media(root / "doc-media.js").values():
+        # Only heroes with variants (heroImageLargeSrc is set with them); originals can be megabytes.
+        if not entry.get("heroImageLargeSrc"):
+            continue
+        for key in ("heroImageLargeSrc", "heroImageSrc"):
+            rel = posixpath.normpath(str(entry.get(key) or ""))
+            if rel.startswith(DOC_IMAGES_DIR) and rel in outputs and len(outputs[rel]) <= PRECACHE_MAX_BYTES:
+                urls.append(rel)
+    # "./" is how the landing page is usually opened.
+    if "index.html" in outputs:
+        urls.append("./")
+    return sorted(set(urls))
+
+
+def service_worker(outputs: dict[str, bytes], root: Path = ROOT) -> tuple[bytes, list[str]]:
+    """sw.js for this build, and the URLs it precaches."""
+    urls = precache_list(outputs, root)
+    version = hashlib.sha256()
+    for url in urls:
+        data = outputs.get("index.html" if url == "./" else url, b"")
+        version.update(f"{url}\0{hashlib.sha256(data).hexdigest()}\n".encode("utf-8"))
+    src = SW_TEMPLATE.replace("__VERSION__", json.dumps(version.hexdigest()[:HASH_CHARS])).replace(
+        "__PRECACHE__", json.dumps(urls, separators=(",", ":"))
+    )
+    return checked_minify_js(src, SW_NAME).encode("utf-8"), urls
+
+
+# -- build ------------------------------------------------------------------------
+
+
+def build(root: Path = ROOT) -> tuple[dict[str, bytes], dict[str, str], tuple[int, int]]:
+    """
+    Returns (dist-relative path -> bytes, original -> fingerprinted name,
+    (CSS/JS bytes before, after minification)).
+    """
+    files = site_files(root)
+    outputs: dict[str, bytes] = {}
+    renamed: dict[str, str] = {}
+    before = after = 0
+
+    def add_asset(rel: str, text: str, original: bytes) -> None:
+        nonlocal before, after
+        data = text.encode("utf-8")
+        before += len(original)
+        after += len(data)
+        name = fingerprinted(rel, data)
+        renamed[rel] = name
+        outputs[name] = data
+
+    # Leaf assets first: their hashed names are baked into script.js and pages.
+    code: list[tuple[str, str, bytes]] = []
+    for rel in files:
+        if rel.endswith(".css"):
+            raw = (root / rel).read_bytes()
+            add_asset(rel, minify_css(raw.decode("utf-8")), raw)
+        elif rel.endswith(".js"):
+            raw = (root / rel).read_bytes()
+            text = raw.decode("utf-8")
+            data_js = minify_data_js(text)
+            if data_js is not None:
+                add_asset(rel, data_js, raw)
+            else:
+                code.append((rel, text, raw))
+    leaf_names = dict(renamed)
+    for rel, text, raw in code:
+        add_asset(rel, checked_minify_js(rewrite_js_refs(text, leaf_names), rel), raw)
+
+    for rel in files:
+        if rel in renamed:
+            continue
+        raw = (root / rel).read_bytes()
+        if rel.endswith(".html"):
+            raw = rewrite_html_refs(raw.decode("utf-8"), rel, renamed).encode("utf-8")
+        outputs[rel] = raw
+    return outputs, renamed, (before, after)
+
+
+def check_out_dir(out_dir: Path, root: Path = ROOT) -> None:
+    """Refuse an output directory that would overwrite the site or be deployed with it."""
+    out_dir, root = out_dir.resolve(), root.resolve()
+    if root.is_relative_to(out_dir):
+        raise ValueError(f"{out_dir} contains the site; choose an empty or dedicated output directory")
+    for d in SITE_DIRS:
+        if out_dir.is_relative_to(root / d):
+            raise ValueError(f"{out_dir} is inside the deployed {d}/ tree; choose another output directory")
+
+
+def read_dist_manifest(out_dir: Path) -> list[str]:
+    """Site-relative paths the previous build wrote to `out_dir` ([] if none recorded)."""
+    try:
+        data = json.loads((out_dir / DIST_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict) or data.get("version") != DIST_MANIFEST_VERSION:
+        return []
+    files = data.get("files")
+    return [f for f in files if isinstance(f, str)] if isinstance(files, list) else []
+
+
+def write_dist(out_dir: Path = DIST_DIR, *, compress: bool = True, sw: bool = True, root: Path = ROOT) -> OutputReport:
+    """build() the site into `out_dir` (plus sw.js and compressed siblings), remove stale files and commit.
+
+    Only files listed in the previous build's DIST_MANIFEST are ever removed.
+    Raises ValueError for an output directory check_out_dir() refuses.
+    """
+    check_out_dir(out_dir, root)
+    outputs, renamed, (before, after) = build(root)
+    precached: list[str] = []
+    if sw:
+        outputs[SW_NAME], precached = service_worker(outputs, root)
+    if compress:
+        for rel, data in list(outputs.items()):
+            outputs.update(compressed_variants(rel, data))
+
+    report = OutputReport()
+    for rel, data in sorted(outputs.items()):
+        report.write_bytes(out_dir / rel, data)
+    manifest = {"version": DIST_MANIFEST_VERSION, "files": sorted(outputs)}
+    report.write_text(out_dir / DIST_MANIFEST, json.dumps(manifest, indent=1) + "\n")
+    base = out_dir.resolve()
+    for rel in sorted(set(read_dist_manifest(out_dir)) - outputs.keys()):
+        p = out_dir / rel
+        # A hand-edited manifest must not reach outside the output directory.
+        if p.resolve().is_relative_to(base) and p.is_file():
+            report.remove(p)
+    report.commit()
+
+    print(f"Minified {len(renamed)} CSS/JS files: {before / 1024:.0f} KB -> {after / 1024:.0f} KB.")
+    if precached:
+        size = sum(len(outputs.get("index.html" if u == "./" else u, b"")) for u in precached)
+        print(f"{SW_NAME} precaches {len(precached)} files ({size / 1024:.0f} KB before compression).")
+    if compress and brotli is None:
+        print("brotli not installed; wrote .gz only (pip install brotli for .br).")
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Write a minified, fingerprinted, precompressed copy of the site to dist/.")
+    ap.add_argument("--out", type=Path, default=DIST_DIR, help="output directory (default: dist/)")
+    ap.add_argument("--no-compress", action="store_true", help="skip the .gz/.br siblings")
+    ap.add_argument("--no-sw", action="store_true", help="do not generate the service worker (sw.js)")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    args = ap.parse_args(argv)
+
+    out_dir = args.out.resolve()
+    try:
+        check_out_dir(out_dir)
+    except ValueError as e:
+        ap.error(str(e))
+    with output_lock():
+        try:
+            report = write_dist(out_dir, compress=not args.no_compress, sw=not args.no_sw)
+        except MinifyError as e:
+            print(e, file=sys.stderr)
+            return 1
+    print(f"{out_dir}: {report.summary()}.")
+    if args.changes:
+        report.write_changes(args.changes)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
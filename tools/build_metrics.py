@@ -0,0 +1,154 @@
+"""
+Timing and counters for the site build tools.
+
+Each tool run calls begin() once; code anywhere in the run (including
+FetchPool worker threads) records into the active BuildMetrics through
+active():
+
+    with active().stage("export"):       # per-stage durations
+        ...
+    with active().career(slug):          # per-career durations
+        ...
+    active().count("bytes.downloaded", len(body))   # counters
+
+At the end the tool prints summary() and, with --metrics-json, writes
+to_dict() so runs can be compared over time. Stage totals add up time
+spent in every thread, so with concurrent fetches they can exceed the wall
+time, and clean.image_wait / clean.variants_wait are already included in
+clean.
+
+profiled() wraps a run in cProfile (--profile): it dumps the stats file for
+snakeviz/pstats and prints the hottest functions. cProfile only sees the main
+thread; time spent in pool workers shows up as waiting on futures.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+
+
+@dataclass
+class StageStat:
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class BuildMetrics:
+    def __init__(self, tool: str) -> None:
+        self.tool = tool
+        self.started = time.perf_counter()
+        self.wall: float | None = None
+        self.stages: dict[str, StageStat] = {}
+        self.careers: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._lock:
+                self.stages.setdefault(name, StageStat()).add(elapsed)
+
+    @contextmanager
+    def career(self, slug: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._lock:
+                self.careers[slug] = self.careers.get(slug, 0.0) + elapsed
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def finish(self) -> None:
+        if self.wall is None:
+            self.wall = time.perf_counter() - self.started
+
+    def summary(self, slowest: int = 5) -> str:
+        self.finish()
+        lines = [f"{'stage':<22}{'calls':>7}{'total s':>10}{'mean ms':>10}{'max ms':>10}"]
+        for name, st in sorted(self.stages.items(), key=lambda kv: -kv[1].total):
+            lines.append(
+                f"{name:<22}{st.calls:>7}{st.total:>10.2f}{st.total / st.calls * 1e3:>10.1f}{st.max * 1e3:>10.1f}"
+            )
+        if self.careers:
+            top = sorted(self.careers.items(), key=lambda kv: -kv[1])[:slowest]
+            lines.append("slowest careers: " + ", ".join(f"{slug} {s:.2f}s" for slug, s in top))
+        if self.counters:
+            lines.append("counters: " + ", ".join(f"{k}={v}" for k, v in sorted(self.counters.items())))
+        lines.append(f"wall time: {self.wall:.2f}s")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        self.finish()
+        return {
+            "tool": self.tool,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "wallSeconds": round(self.wall, 4),
+            "stages": {
+                k: {"calls": v.calls, "totalSeconds": round(v.total, 4), "maxSeconds": round(v.max, 4)}
+                for k, v in sorted(self.stages.items())
+            },
+            "careers": {k: round(v, 4) for k, v in sorted(self.careers.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def write_json(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+_active = BuildMetrics("idle")
+
+
+def begin(tool: str) -> BuildMetrics:
+    """Start recording a new run; returns the metrics that active() now hands out."""
+    global _active
+    _active = BuildMetrics(tool)
+    return _active
+
+
+def active() -> BuildMetrics:
+    return _active
+
+
+@contextmanager
+def profiled(path: Path | None, top: int = 25) -> Iterator[None]:
+    """Profile the block when `path` is set: dump stats there and print the top functions."""
+    if path is None:
+        yield
+        return
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        prof.dump_stats(str(path))
+        out = io.StringIO()
+        pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(top)
+        print(out.getvalue().rstrip())
+        print(f"Profile written to {path}")
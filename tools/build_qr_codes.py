@@ -0,0 +1,130 @@
+"""
+Generate QR codes for every career page at build time.
+
+script.js used to point each [data-qr] image at api.qrserver.com, so the
+landing page and qr-sheet.html made one third-party request per career on
+every render. This tool renders the codes locally instead:
+
+- assets/qr/<slug>.svg (or .png with --format png) encoding
+  <base-url>/careers/<slug>.html for every career in careers-data.js
+- assets/qr/qr-codes.js: window.SHT_QR = {baseUrl, files}, mapping each page
+  path to its file; script.js uses the local file when the URL it wants to
+  encode matches, and falls back to the API otherwise (different base URL,
+  a career added since the last build)
+- re-renders the pre-rendered grids in index.html and qr-sheet.html so they
+  show the new codes without JavaScript
+
+Codes for careers no longer in careers-data.js are removed. Files are only
+rewritten when their bytes change, and all changes are swapped in together
+at the end of the run (see site_output.py).
+
+Requires segno (pip install segno).
+
+Run:
+  python tools/build_qr_codes.py --base-url https://example.org/pathways [--format svg|png]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import io
+import json
+import os
+
+import segno
+
+from site_data import prerender_pages, read_doc_media
+from site_output import OutputReport, output_lock, read_window_json
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CAREERS_DATA_JS = ROOT / "careers-data.js"
+QR_DIR = ROOT / "assets" / "qr"
+QR_MANIFEST_JS = QR_DIR / "qr-codes.js"
+
+ERROR_LEVEL = "m"
+BORDER = 4
+PNG_SCALE = 8
+
+
+def normalize_base_url(value: str) -> str:
+    """Same rule as normalizeBaseUrl() in script.js: no trailing slash."""
+    return value.strip().rstrip("/")
+
+
+def render_qr(data: str, fmt: str) -> bytes:
+    qr = segno.make(data, error=ERROR_LEVEL)
+    out = io.BytesIO()
+    if fmt == "svg":
+        # No width/height: the <img> sizes it, the viewBox keeps it crisp.
+        qr.save(out, kind="svg", border=BORDER, xmldecl=False, omitsize=True)
+    else:
+        qr.save(out, kind="png", border=BORDER, scale=PNG_SCALE)
+    return out.getvalue()
+
+
+def render_manifest(base_url: str, files: dict[str, str]) -> str:
+    payload = {"baseUrl": base_url, "files": dict(sorted(files.items()))}
+    return "window.SHT_QR = " + json.dumps(payload, indent=2) + ";\n"
+
+
+def write_qr_codes(
+    report: OutputReport, careers: list[dict], base_url: str, fmt: str, only: set[str] | None = None
+) -> dict[str, str]:
+    """
+    Stage a code per career, qr-codes.js and the removal of codes for careers
+    that are gone. With `only`, codes are rendered just for those slugs; the
+    rest must already be current on disk. Returns page path -> file name.
+    """
+    files: dict[str, str] = {}
+    for c in careers:
+        slug = str(c.get("slug", "")).strip()
+        if not slug:
+            continue
+        page = f"careers/{slug}.html"
+        name = f"{slug}.{fmt}"
+        if only is None or slug in only or not (QR_DIR / name).exists():
+            report.write_bytes(QR_DIR / name, render_qr(f"{base_url}/{page}", fmt))
+        files[page] = name
+
+    keep = set(files.values())
+    for f in sorted(QR_DIR.glob("*.svg")) + sorted(QR_DIR.glob("*.png")):
+        if f.name not in keep:
+            report.remove(f)
+
+    report.write_text(QR_MANIFEST_JS, render_manifest(base_url, files))
+    return files
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Render QR codes for every career page into assets/qr/.")
+    ap.add_argument(
+        "--base-url",
+        default=os.environ.get("SHT_BASE_URL", ""),
+        help="public URL the site is hosted at (default: $SHT_BASE_URL)",
+    )
+    ap.add_argument("--format", choices=["svg", "png"], default="svg")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    args = ap.parse_args(argv)
+
+    base_url = normalize_base_url(args.base_url)
+    if not base_url.startswith(("http://", "https://")):
+        print("Pass --base-url (or set SHT_BASE_URL) to the site's public http(s) URL.")
+        return 2
+
+    with output_lock():
+        careers = read_window_json(CAREERS_DATA_JS, "SHT_CAREERS")
+        report = OutputReport()
+        files = write_qr_codes(report, careers, base_url, args.format)
+        prerender_pages(report, careers, read_doc_media())
+        report.commit()
+
+    print(f"QR codes for {len(files)} careers at {base_url}: {report.summary()}.")
+    if args.changes:
+        report.write_changes(args.changes)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,332 @@
+"""
+Local HTTP stand-in for the public Drive folder and Docs export endpoints.
+
+Serves a fixture directory so import_drive_docs.py can be run (and timed)
+without touching Google:
+
+  <fixtures>/docs/<Doc Title>.html   -> one Doc export per file
+  <fixtures>/docs/<Folder>/...       -> a subfolder (nested to any depth)
+  <fixtures>/images/<name>           -> images referenced by the exports
+
+Routes:
+  /drive/folders/<folderId>          -> folder HTML listing that folder's
+                                        subfolders and docs (any id not
+                                        belonging to a subfolder is the top folder);
+                                        with --page-size, split into pages
+                                        chained by nextPageToken/?pageToken=
+  /document/d/<docId>/export         -> the matching Doc export; with
+                                        ?format=zip, a bundle shaped like
+                                        Google's zipped HTML export (see
+                                        doc_zip_bundle)
+  /images/<name>                     -> files from <fixtures>/images
+  /redirect/<n>/<path>               -> a chain of n 302 redirects ending at /<path>
+
+Connections are kept alive (HTTP/1.1). With --flaky P, that fraction of
+requests is answered 503 or 429 (Retry-After: 0) to exercise client retries;
+fail_next() queues exact failures for tests. With --gzip, bodies are sent
+gzip-encoded to clients that accept it. requests and max_in_flight (the most
+requests served at once) let tests check a client's concurrency limits.
+
+Doc exports may use the placeholder {{BASE}} for image URLs; it is replaced
+with the server's own base URL (e.g. <img src="{{BASE}}/images/a.png">).
+
+Run:
+  python tools/drive_standin.py path/to/fixtures [--port 8765] [--delay 0.05] [--page-size 50] [--flaky 0.1] [--gzip]
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+import argparse
+import base64
+import gzip
+import hashlib
+import html as html_lib
+import io
+import mimetypes
+import random
+import re
+import threading
+import time
+import zipfile
+
+
+def doc_id_for_title(title: str) -> str:
+    """Stable, Drive-shaped (44 char) doc id for a fixture title."""
+    return hashlib.sha256(title.encode("utf-8")).hexdigest()[:44]
+
+
+def folder_id_for_path(rel: str) -> str:
+    return doc_id_for_title("folder:" + rel)
+
+
+def folder_html_for(
+    titles: list[str], folders: list[tuple[str, str]] | None = None, next_page_token: str | None = None
+) -> str:
+    """
+    Folder page in the shape parse_folder_listing() understands: subfolders
+    as (title, folderId) pairs, then docs by title.
+    """
+    entries = []
+    for title, folder_id in folders or []:
+        entries.append(
+            f'["{folder_id}"],null,null,null,"application/vnd.google-apps.folder",'
+            f'null,null,[[["{title}",null,true]]]'
+        )
+    for title in titles:
+        entries.append(
+            f'["{doc_id_for_title(title)}"],null,null,null,"application/vnd.google-apps.document",'
+            f'null,null,[[["{title}",null,true]]]'
+        )
+    data = "[" + ",".join(entries) + "]"
+    if next_page_token:
+        data += f',"nextPageToken":"{next_page_token}"'
+    blob = html_lib.escape(data, quote=True)
+    return f"<!doctype html><html><body><script>window._DRIVE_ivd = '{blob}';</script></body></html>"
+
+
+_BUNDLED_IMAGE = re.compile(r"\{\{BASE\}\}/images/([^\"'?#]+)|data:image/([A-Za-z0-9.+-]+);base64,([A-Za-z0-9+/=]+)")
+
+
+def doc_zip_bundle(title: str, export_html: str, images_dir: Path) -> bytes:
+    """
+    What Docs' export?format=zip returns: <title>.html at the top with every
+    image (remote or pasted) moved into images/ and referenced relatively.
+    """
+    files: dict[str, bytes] = {}
+
+    def bundle(m: re.Match) -> str:
+        if m.group(1):
+            name = m.group(1)
+            path = images_dir / name
+            if not path.is_file():
+                return m.group(0)
+            files.setdefault(name, path.read_bytes())
+        else:
+            ext = {"jpeg": "jpg", "svg+xml": "svg"}.get(m.group(2).lower(), m.group(2).lower())
+            name = f"image{len(files) + 1}.{ext}"
+            files[name] = base64.b64decode(m.group(3))
+        return f"images/{name}"
+
+    page = _BUNDLED_IMAGE.sub(bundle, export_html)
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{title}.html", page)
+        for name, data in files.items():
+            zf.writestr(f"images/{name}", data)
+    return out.getvalue()
+
+
+class DriveStandIn:
+    """Threaded fixture server; usable as a context manager from scripts and benchmarks."""
+
+    def __init__(
+        self,
+        fixtures: Path,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        delay: float = 0.0,
+        page_size: int = 0,
+        flaky: float = 0.0,
+        gzip: bool = False,
+    ) -> None:
+        self.fixtures = Path(fixtures)
+        self.delay = delay
+        self.page_size = page_size
+        self.flaky = flaky
+        self.gzip = gzip
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._stats_lock = threading.Lock()
+        self._scripted: deque[tuple[int, str | None]] = deque()
+        self._rnd = random.Random(0)
+        self._rnd_lock = threading.Lock()
+        self._bundles: dict[Path, tuple[int, bytes]] = {}
+        self._bundles_lock = threading.Lock()
+        docs_dir = self.fixtures / "docs"
+        self.docs = {doc_id_for_title(p.stem): p for p in sorted(docs_dir.rglob("*.html"))}
+        self.folders = {
+            folder_id_for_path(d.relative_to(docs_dir).as_posix()): d for d in sorted(docs_dir.rglob("*")) if d.is_dir()
+        }
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    def bundle(self, doc: Path) -> bytes:
+        """The doc's zip export, built once per fixture modification (like a real export cache)."""
+        mtime = doc.stat().st_mtime_ns
+        with self._bundles_lock:
+            cached = self._bundles.get(doc)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, doc_zip_bundle(doc.stem, doc.read_text(encoding="utf-8"), self.fixtures / "images"))
+            with self._bundles_lock:
+                self._bundles[doc] = cached
+        return cached[1]
+
+    def fail_next(self, *statuses: int, retry_after: str | None = "0") -> None:
+        """Answer the next len(statuses) requests with these statuses (and Retry-After, unless None)."""
+        with self._stats_lock:
+            self._scripted.extend((status, retry_after) for status in statuses)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def folder_url(self) -> str:
+        return f"{self.base_url}/drive/folders/local"
+
+    def folder_page(self, folder_id: str, page_token: str | None) -> str:
+        root = self.fixtures / "docs"
+        folder = self.folders.get(folder_id, root)
+        subfolders = [
+            ("folder", (d.name, folder_id_for_path(d.relative_to(root).as_posix())))
+            for d in sorted(folder.iterdir())
+            if d.is_dir()
+        ]
+        docs = [("doc", p.stem) for p in sorted(folder.glob("*.html"))]
+        entries = subfolders + docs
+        start = int(page_token or 0)
+        end = start + self.page_size if self.page_size else len(entries)
+        page = entries[start:end]
+        return folder_html_for(
+            [e for kind, e in page if kind == "doc"],
+            [e for kind, e in page if kind == "folder"],
+            str(end) if end < len(entries) else None,
+        )
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                with standin._stats_lock:
+                    standin.requests += 1
+                    standin.in_flight += 1
+                    standin.max_in_flight = max(standin.max_in_flight, standin.in_flight)
+                    scripted = standin._scripted.popleft() if standin._scripted else None
+                try:
+                    if standin.delay:
+                        time.sleep(standin.delay)
+                    if scripted is not None:
+                        standin.failures += 1
+                        status, retry_after = scripted
+                        extra = {"Retry-After": retry_after} if retry_after is not None else {}
+                        return self._send(b"scripted failure", "text/plain", status=status, extra=extra)
+                    self._route()
+                finally:
+                    with standin._stats_lock:
+                        standin.in_flight -= 1
+
+            def _route(self) -> None:
+                if standin.flaky:
+                    with standin._rnd_lock:
+                        fail = standin._rnd.random() < standin.flaky
+                        status = standin._rnd.choice((429, 503))
+                    if fail:
+                        standin.failures += 1
+                        return self._send(b"try again", "text/plain", status=status, extra={"Retry-After": "0"})
+                url = urlparse(self.path)
+                parts = [p for p in url.path.split("/") if p]
+                if len(parts) >= 2 and parts[0] == "redirect" and parts[1].isdigit():
+                    hops = int(parts[1])
+                    rest = "/".join(parts[2:]) + (f"?{url.query}" if url.query else "")
+                    location = f"/redirect/{hops - 1}/{rest}" if hops > 1 else f"/{rest}"
+                    return self._send(b"", "text/plain", status=302, extra={"Location": location})
+                if parts[:2] == ["drive", "folders"]:
+                    token = (parse_qs(url.query).get("pageToken") or [None])[0]
+                    folder_id = parts[2] if len(parts) > 2 else ""
+                    self._send(standin.folder_page(folder_id, token).encode("utf-8"), "text/html; charset=utf-8")
+                elif len(parts) == 4 and parts[0] == "document" and parts[3] == "export":
+                    doc = standin.docs.get(parts[2])
+                    if doc is None:
+                        return self._send(b"not found", "text/plain", status=404)
+                    if parse_qs(url.query).get("format") == ["zip"]:
+                        return self._send(standin.bundle(doc), "application/zip")
+                    body = doc.read_text(encoding="utf-8").replace("{{BASE}}", standin.base_url)
+                    self._send(body.encode("utf-8"), "text/html; charset=utf-8")
+                elif len(parts) == 2 and parts[0] == "images":
+                    img = standin.fixtures / "images" / parts[1]
+                    if not img.is_file():
+                        return self._send(b"not found", "text/plain", status=404)
+                    ctype = mimetypes.guess_type(img.name)[0] or "application/octet-stream"
+                    self._send(img.read_bytes(), ctype)
+                else:
+                    self._send(b"not found", "text/plain", status=404)
+
+            def _send(self, body: bytes, ctype: str, status: int = 200, extra: dict[str, str] | None = None) -> None:
+                self.send_response(status)
+                for k, v in (extra or {}).items():
+                    self.send_header(k, v)
+                if standin.gzip and body and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> "DriveStandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "DriveStandIn":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Serve Drive/Docs fixtures locally.")
+    ap.add_argument("fixtures", type=Path, help="directory with docs/ and images/")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--delay", type=float, default=0.0, help="artificial per-request latency (seconds)")
+    ap.add_argument("--page-size", type=int, default=0, help="entries per folder listing page (0: one page)")
+    ap.add_argument("--flaky", type=float, default=0.0, help="fraction of requests answered 429/503")
+    ap.add_argument("--gzip", action="store_true", help="gzip bodies for clients that accept it")
+    args = ap.parse_args()
+
+    standin = DriveStandIn(
+        args.fixtures,
+        host=args.host,
+        port=args.port,
+        delay=args.delay,
+        page_size=args.page_size,
+        flaky=args.flaky,
+        gzip=args.gzip,
+    )
+    print(f"Serving {len(standin.docs)} docs from {args.fixtures}")
+    print(f"  --folder-url {standin.folder_url}")
+    print(f"  --docs-url {standin.base_url}")
+    try:
+        standin._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin._server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,280 @@
+"""
+Shared HTTP client for the import tools.
+
+urllib opened a new connection per request with a flat 60s timeout and no
+retry, so one throttled or flaky request failed a Doc export or dropped an
+image. HttpClient provides:
+
+- keep-alive connections pooled per host (http.client), reused across
+  threads; a pooled connection the server already closed is replaced
+  transparently
+- retries with exponential backoff and full jitter on 429, 5xx and connection
+  errors, honouring Retry-After
+- redirects followed (Docs exports redirect to googleusercontent.com)
+- conditional requests: pass If-None-Match / If-Modified-Since headers and a
+  304 comes back as a Response like any other
+- an optional global rate limit (requests per second across all threads)
+- gzip transfer encoding
+- streaming: get(url, sink=...) writes a 2xx body to the sink in CHUNK_SIZE
+  pieces (gunzipping incrementally) instead of holding it in memory; the sink
+  is reset() before every attempt, so a retry never appends to a partial body
+
+Tools share one client through default_client(); main() calls configure()
+with its CLI options first.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Protocol
+from urllib.parse import urljoin, urlsplit
+import gzip
+import http.client
+import random
+import socket
+import threading
+import time
+import zlib
+
+from build_metrics import active as metrics
+
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 10
+CHUNK_SIZE = 64 * 1024
+
+# Network failures worth retrying. Not OSError as a whole: a sink that cannot
+# write to local disk (ENOSPC, EACCES) fails the same way on every attempt.
+_CONNECTION_ERRORS = (http.client.HTTPException, ConnectionError, TimeoutError, socket.gaierror)
+
+
+@dataclass(frozen=True)
+class Response:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    streamed: int = 0  # bytes written to the sink (body is then empty)
+
+    def header(self, name: str) -> str | None:
+        return self.headers.get(name.lower())
+
+
+class Sink(Protocol):
+    """Where get(..., sink=) streams a response body."""
+
+    def write(self, data: bytes) -> object: ...
+
+    def reset(self) -> None: ...
+
+
+class HttpError(Exception):
+    def __init__(self, url: str, status: int, reason: str = "") -> None:
+        super().__init__(f"HTTP {status} for {url}" + (f" ({reason})" if reason else ""))
+        self.url = url
+        self.status = status
+
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class HttpClient:
+    def __init__(
+        self,
+        *,
+        timeout: float = 30.0,
+        retries: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        rate: float | None = None,
+        max_idle_per_host: int = 8,
+        user_agent: str = USER_AGENT,
+    ) -> None:
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_idle_per_host = max_idle_per_host
+        self.user_agent = user_agent
+        self._limiter = RateLimiter(rate) if rate else None
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+
+    # -- connection pool ---------------------------------------------------
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=self.timeout)
+
+    def _acquire(self, scheme: str, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+        """An idle pooled connection (reused=True) or a new one."""
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+        return self._connect(scheme, netloc), False
+
+    def _release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for conns in pools.values():
+            for conn in conns:
+                conn.close()
+
+    # -- requests ----------------------------------------------------------
+
+    def _send(self, url: str, headers: dict[str, str], sink: Sink | None = None) -> Response:
+        """
+        One request/response on a pooled connection (no retry, no redirects).
+        With a sink, a 2xx body is streamed into it rather than returned.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL: {url}")
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conn, reused = self._acquire(parts.scheme, parts.netloc)
+        while True:
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                gzipped = (resp.getheader("Content-Encoding") or "").lower() == "gzip"
+                if sink is not None and 200 <= resp.status < 300:
+                    body, streamed = b"", _stream(resp, sink, gzipped)
+                else:
+                    body, streamed = resp.read(), 0
+                    if gzipped and body:
+                        body = gzip.decompress(body)
+                break
+            except _CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a new one.
+                conn, reused = self._connect(parts.scheme, parts.netloc), False
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(parts.scheme, parts.netloc, conn)
+        hdrs = {k.lower(): v for k, v in resp.getheaders()}
+        return Response(url=url, status=resp.status, headers=hdrs, body=body, streamed=streamed)
+
+    def _delay(self, attempt: int, resp: Response | None) -> float:
+        retry_after = resp.header("Retry-After") if resp is not None else None
+        if retry_after:
+            try:
+                return min(self.max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after).timestamp()
+                    return min(self.max_backoff, max(0.0, when - time.time()))
+                except (TypeError, ValueError):
+                    pass
+        # Full jitter: uniform in [0, backoff * 2^attempt], capped.
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2**attempt)))
+
+    def get(self, url: str, headers: dict[str, str] | None = None, *, sink: Sink | None = None) -> Response:
+        """
+        GET `url`, following redirects and retrying transient failures. Returns
+        2xx and 304 responses; raises HttpError for other statuses (after
+        retries for 429/5xx) and the last connection error if every attempt fails.
+        With a sink, a 2xx body goes to the sink and Response.body is empty.
+        """
+        request_headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip", **(headers or {})}
+        attempt = 0
+        redirects = 0
+        while True:
+            if self._limiter is not None:
+                self._limiter.wait()
+            metrics().count("http.requests")
+            resp: Response | None = None
+            try:
+                resp = self._send(url, request_headers, sink)
+            except _CONNECTION_ERRORS:
+                if attempt >= self.retries:
+                    raise
+            else:
+                if resp.status in REDIRECT_STATUSES and resp.header("Location"):
+                    redirects += 1
+                    if redirects > MAX_REDIRECTS:
+                        raise HttpError(url, resp.status, "too many redirects")
+                    url = urljoin(url, resp.header("Location"))
+                    continue
+                if resp.status < 300 or resp.status == 304:
+                    if resp.status == 304:
+                        metrics().count("http.not_modified")
+                    metrics().count("bytes.downloaded", len(resp.body) or resp.streamed)
+                    return resp
+                if resp.status not in RETRY_STATUSES or attempt >= self.retries:
+                    raise HttpError(url, resp.status)
+            metrics().count("http.retries")
+            time.sleep(self._delay(attempt, resp))
+            attempt += 1
+
+
+def _stream(resp: http.client.HTTPResponse, sink: Sink, gzipped: bool) -> int:
+    """Copy the body into `sink` chunk by chunk; returns the decoded byte count."""
+    sink.reset()
+    inflate = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+    total = 0
+    while chunk := resp.read(CHUNK_SIZE):
+        if inflate is not None:
+            chunk = inflate.decompress(chunk)
+        if chunk:
+            sink.write(chunk)
+            total += len(chunk)
+    if inflate is not None:
+        tail = inflate.flush()
+        if tail:
+            sink.write(tail)
+            total += len(tail)
+    return total
+
+
+_default: HttpClient | None = None
+_default_lock = threading.Lock()
+
+
+def configure(**options) -> HttpClient:
+    """Replace the shared client (closing the old one) with one built from `options`."""
+    global _default
+    with _default_lock:
+        old, _default = _default, HttpClient(**options)
+    if old is not None:
+        old.close()
+    return _default
+
+
+def default_client() -> HttpClient:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = HttpClient()
+        return _default
@@ -0,0 +1,237 @@
+"""
+Intrinsic sizes and loading placeholders for imported Doc images.
+
+An <img> without width/height takes no space until its bytes arrive, so a
+career page reflowed as each Doc image loaded. For every image the importer
+injects, image_info() reads:
+
+- width and height: from the file header (PNG, GIF, JPEG, WebP) with the
+  standard library, so this works without Pillow; with Pillow, JPEG EXIF
+  rotation is applied the way browsers display it
+- color: the average colour as #rrggbb (Pillow only), painted behind the
+  image while it loads
+- placeholder: a ~16px WebP as a data: URI (Pillow only, on request) for the
+  career-page hero, which the browser scales up into a blur
+
+Images with real transparency get neither colour nor placeholder, since the
+backdrop would show through them once loaded.
+
+import_drive_docs.py writes width/height and the colour onto the panel <img>
+tags (annotate_img()), and heroImageWidth / heroImageHeight /
+heroImagePlaceholder into doc-media.js and the career shards, where script.js
+applies them to the hero. Add them to the pages and doc-media.js already in
+the repo:
+  python tools/image_meta.py
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import argparse
+import base64
+import io
+import struct
+
+from bs4 import BeautifulSoup, Tag
+
+from site_data import DOC_MEDIA_JS, ROOT, read_doc_media, render_doc_media, write_site_data
+from site_output import (
+    CAREERS_DIR,
+    HTML_PARSER,
+    OutputReport,
+    doc_sections_inner_html,
+    output_lock,
+    read_window_json,
+    replace_doc_sections_inner,
+)
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; sizes still come from the headers.
+    Image = None
+    ImageOps = None
+
+
+ASSETS_DIR = ROOT / "assets" / "doc-images"
+CAREERS_DATA_JS = ROOT / "careers-data.js"
+PLACEHOLDER_PX = 16
+PLACEHOLDER_QUALITY = 40
+# How much of a file header to read; JPEGs can carry large EXIF/ICC blocks before SOF.
+HEADER_BYTES = 512 * 1024
+# Page-relative prefix of imported images in careers/*.html.
+PAGE_PREFIX = "../assets/doc-images/"
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    width: int
+    height: int
+    color: str | None = None  # "#rrggbb", None without Pillow or for transparent images
+    placeholder: str | None = None  # data:image/webp;base64,... when requested
+
+    def hero_fields(self) -> dict[str, str | int]:
+        """The doc-media.js fields for a hero image."""
+        fields: dict[str, str | int] = {"heroImageWidth": self.width, "heroImageHeight": self.height}
+        if self.placeholder:
+            fields["heroImagePlaceholder"] = self.placeholder
+        return fields
+
+
+def _jpeg_size(head: bytes) -> tuple[int, int] | None:
+    i = 2
+    while i + 9 < len(head):
+        if head[i] != 0xFF:
+            return None
+        marker = head[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:  # no length field
+            i += 2
+            continue
+        (length,) = struct.unpack(">H", head[i + 2 : i + 4])
+        # SOF0..SOF15, except DHT (C4), JPG (C8) and DAC (CC).
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            h, w = struct.unpack(">HH", head[i + 5 : i + 9])
+            return (w, h)
+        i += 2 + length
+    return None
+
+
+def header_size(head: bytes) -> tuple[int, int] | None:
+    """(width, height) from the first bytes of a PNG, GIF, JPEG or WebP file."""
+    if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+        return struct.unpack(">II", head[16:24])
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", head[6:10])
+    if head.startswith(b"\xff\xd8"):
+        return _jpeg_size(head)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        chunk = head[12:16]
+        if chunk == b"VP8 " and len(head) >= 30:
+            w, h = struct.unpack("<HH", head[26:30])
+            return (w & 0x3FFF, h & 0x3FFF)
+        if chunk == b"VP8L" and len(head) >= 25:
+            bits = int.from_bytes(head[21:25], "little")
+            return ((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+        if chunk == b"VP8X" and len(head) >= 30:
+            return (int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1)
+    return None
+
+
+def _is_opaque(im) -> bool:
+    if im.mode in ("RGBA", "LA"):
+        return im.getchannel("A").getextrema()[0] == 255
+    return not (im.mode == "P" and "transparency" in im.info)
+
+
+def info_from_image(im, width: int, height: int, *, placeholder: bool = False) -> ImageInfo:
+    """ImageInfo for an opened Pillow image (any size; a small one is fastest)."""
+    if not _is_opaque(im):
+        return ImageInfo(width, height)
+    rgb = im.convert("RGB")
+    r, g, b = rgb.resize((1, 1), Image.BOX).getpixel((0, 0))
+    uri = None
+    if placeholder:
+        tiny = rgb.copy()
+        tiny.thumbnail((PLACEHOLDER_PX, PLACEHOLDER_PX), Image.BOX)
+        buf = io.BytesIO()
+        tiny.save(buf, "WEBP", quality=PLACEHOLDER_QUALITY)
+        uri = "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+    return ImageInfo(width, height, f"#{r:02x}{g:02x}{b:02x}", uri)
+
+
+def image_info(path: Path, *, placeholder: bool = False) -> ImageInfo | None:
+    """Size (and, with Pillow, colour/placeholder) of an image file; None if unreadable or not a raster."""
+    if Image is not None:
+        try:
+            with Image.open(path) as im:
+                width, height = im.size
+                # Browsers apply EXIF orientation; 5-8 are the ones that swap the sides.
+                if im.getexif().get(0x0112) in (5, 6, 7, 8):
+                    width, height = height, width
+                # JPEGs decode at a fraction of the size when only a thumbnail is needed.
+                im.draft("RGB", (PLACEHOLDER_PX * 8, PLACEHOLDER_PX * 8))
+                return info_from_image(ImageOps.exif_transpose(im), width, height, placeholder=placeholder)
+        except Exception:
+            pass
+    try:
+        with open(path, "rb") as f:
+            size = header_size(f.read(HEADER_BYTES))
+    except OSError:
+        return None
+    return ImageInfo(*size) if size else None
+
+
+def sized_hero(hero: dict[str, str | int]) -> dict[str, str | int]:
+    """A doc-media.js hero recorded without sizes, with them added from the image on disk."""
+    src = str(hero.get("heroImageLargeSrc") or hero.get("heroImageSrc") or "")
+    if "heroImageWidth" in hero or not src.startswith("./"):
+        return hero
+    info = image_info(ROOT / src[2:], placeholder=True)
+    return {**hero, **info.hero_fields()} if info is not None else hero
+
+
+def annotate_img(img: Tag, info: ImageInfo | None) -> None:
+    """Set width/height (and the loading colour) on an <img>, keeping any already there."""
+    if info is None:
+        return
+    img.attrs.setdefault("width", str(info.width))
+    img.attrs.setdefault("height", str(info.height))
+    if info.color:
+        img.attrs.setdefault("style", f"background-color:{info.color}")
+
+
+def _local_image(src: str, base: Path) -> Path | None:
+    if not src.startswith(PAGE_PREFIX):
+        return None
+    path = (base / src[len(PAGE_PREFIX) :]).resolve()
+    return path if path.is_relative_to(base) and path.is_file() else None
+
+
+def annotate_panels_html(inner_html: str) -> str:
+    """annotate_img() every local image in a page's Doc panels that has no size yet."""
+    root = BeautifulSoup(f"<div>{inner_html}</div>", HTML_PARSER).div
+    if root is None:
+        return inner_html
+    changed = False
+    for img in root.find_all("img"):
+        if img.get("width") and img.get("height"):
+            continue
+        path = _local_image(img.get("src") or "", ASSETS_DIR.resolve())
+        if path is not None:
+            annotate_img(img, image_info(path))
+            changed = True
+    return root.decode_contents() if changed else inner_html
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Add image sizes and placeholders to the imported Doc content.")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    args = ap.parse_args(argv)
+
+    if Image is None:
+        print("Pillow not installed; writing sizes only (pip install pillow for colours and placeholders).")
+    with output_lock():
+        report = OutputReport()
+        for path in sorted(CAREERS_DIR.glob("*.html")):
+            page = path.read_text(encoding="utf-8")
+            inner = doc_sections_inner_html(page)
+            if inner:
+                report.write_text(path, replace_doc_sections_inner(page, annotate_panels_html(inner)))
+
+        media = {slug: sized_hero(entry) for slug, entry in read_doc_media().items()}
+        if media:
+            report.write_text(DOC_MEDIA_JS, render_doc_media(media))
+        write_site_data(report, read_window_json(CAREERS_DATA_JS, "SHT_CAREERS"), media)
+        report.commit()
+
+    print(f"Output files: {report.summary()}")
+    if args.changes:
+        report.write_changes(args.changes)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
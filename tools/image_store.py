@@ -0,0 +1,378 @@
+"""
+Content-addressed store for images pulled out of Google Docs.
+
+Files are named after the SHA-256 of their bytes (assets/doc-images/<hash>.<ext>),
+so the same logo used by ten careers is stored once and a reordered doc maps
+back onto files it already has. .build-cache/image-store.json remembers which
+source URL produced which file, letting known URLs skip the network entirely.
+
+After an import, collect_garbage() removes files (and their variants) that no
+page or doc-media.js references any more.
+
+Nothing is held in memory whole: downloads stream through a StoreWriter (temp
+file in the store directory, hashed as it is written, renamed into place), and
+DataUriSpooler sits between the HTTP client and a Doc export, decoding each
+inline data:image base64 blob into the store as it arrives and leaving a short
+sht-spooled:<filename> reference in the HTML instead of the blob.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from urllib.parse import urlparse
+import binascii
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+
+from build_metrics import active as metrics
+from http_client import default_client
+
+
+ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = ROOT / "assets" / "doc-images"
+STORE_MANIFEST = ROOT / ".build-cache" / "image-store.json"
+
+HASH_CHARS = 20
+# data: URIs already in memory are still decoded in slices of this many groups.
+CHUNK_CHARS = 16 * 1024
+SPOOLED_PREFIX = "sht-spooled:"
+
+_MAGIC = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+_REF_PAT = re.compile(r"doc-images/((?:variants/)?[A-Za-z0-9._-]+)")
+
+
+def sniff_ext(data: bytes, src: str = "") -> str:
+    for magic, ext in _MAGIC:
+        if data.startswith(magic):
+            return ext
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    if data[4:12] in (b"ftypavif", b"ftypavis"):
+        return "avif"
+    if data.lstrip()[:5] in (b"<svg ", b"<?xml"):
+        return "svg"
+    if src.startswith("data:image/"):
+        m = re.match(r"data:image/([a-zA-Z0-9.+-]+)", src)
+        if m:
+            return {"jpeg": "jpg", "svg+xml": "svg"}.get(m.group(1).lower(), m.group(1).lower())
+    ext = Path(urlparse(src).path).suffix.lower().lstrip(".")
+    return ext if re.fullmatch(r"[a-z0-9]{2,5}", ext or "") else "img"
+
+
+class StoreWriter:
+    """
+    Streams one image into the store: bytes go to a temp file next to the
+    store while being hashed, and commit() renames it to <hash>.<ext> (or drops
+    it when the store already has that file). Usable as an HttpClient sink.
+    """
+
+    _HEAD = 32  # enough bytes for sniff_ext()
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._file = None
+        self._tmp: str | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        if self._file is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, self._tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+            self._file = os.fdopen(fd, "wb")
+        else:
+            self._file.seek(0)
+            self._file.truncate()
+        self._hash = hashlib.sha256()
+        self._head = b""
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        if len(self._head) < self._HEAD:
+            self._head += data[: self._HEAD - len(self._head)]
+        self._hash.update(data)
+        self._file.write(data)
+        self.size += len(data)
+
+    def commit(self, src: str = "") -> str:
+        name = f"{self._hash.hexdigest()[:HASH_CHARS]}.{sniff_ext(self._head, src)}"
+        self._file.close()
+        out = self.root / name
+        if out.is_file():
+            os.unlink(self._tmp)
+        else:
+            os.replace(self._tmp, out)
+        self._file = self._tmp = None
+        return name
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            os.unlink(self._tmp)
+            self._file = self._tmp = None
+
+
+class Base64Decoder:
+    """
+    Incremental base64 decoding: feed() any slice of the text, complete 4-char
+    groups are decoded straight into `out`, the rest waits for the next slice.
+    Characters outside the alphabet are skipped, like base64.b64decode().
+    """
+
+    _JUNK = re.compile(rb"[^A-Za-z0-9+/=]")
+
+    def __init__(self, out: StoreWriter) -> None:
+        self.out = out
+        self._carry = b""
+
+    def feed(self, text: bytes) -> None:
+        data = self._carry + self._JUNK.sub(b"", text)
+        cut = len(data) - len(data) % 4
+        if cut:
+            self.out.write(binascii.a2b_base64(data[:cut]))
+        self._carry = data[cut:]
+
+    def close(self) -> None:
+        if self._carry.rstrip(b"="):
+            raise binascii.Error("truncated base64 data")
+
+
+def _download(url: str, out: StoreWriter) -> None:
+    with metrics().stage("image.download"):
+        default_client().get(url, sink=out)
+
+
+class ImageStore:
+    """Thread-safe; save() may be called from FetchPool workers."""
+
+    def __init__(self, root: Path = ASSETS_DIR, manifest_path: Path = STORE_MANIFEST) -> None:
+        self.root = root
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.downloads = 0
+        try:
+            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+            self._by_src: dict[str, str] = dict(data.get("sources", {}))
+        except (OSError, ValueError, AttributeError):
+            self._by_src = {}
+
+    def lookup(self, src: str) -> str | None:
+        """Filename already stored for this source URL, without any I/O beyond a stat."""
+        if src.startswith(SPOOLED_PREFIX):
+            name = src[len(SPOOLED_PREFIX) :]
+            return name if name and (self.root / name).is_file() else None
+        with self._lock:
+            name = self._by_src.get(src)
+        if name and (self.root / name).is_file():
+            with self._lock:
+                self.hits += 1
+            return name
+        return None
+
+    def save(self, src: str) -> str | None:
+        """Store the image behind `src` (http(s) URL or data: URI); returns its filename or None."""
+        if not src.startswith("data:"):
+            known = self.lookup(src)
+            if known:
+                return known
+        if not src.startswith(("data:image/", "http://", "https://")):
+            return None
+        out = self.writer()
+        try:
+            if src.startswith("data:image/"):
+                decoder = Base64Decoder(out)
+                payload = src.split(",", 1)[1] if "," in src else ""
+                for i in range(0, len(payload), 4 * CHUNK_CHARS):
+                    decoder.feed(payload[i : i + 4 * CHUNK_CHARS].encode("ascii", "ignore"))
+                decoder.close()
+            else:
+                _download(src, out)
+                with self._lock:
+                    self.downloads += 1
+        except Exception as e:
+            out.discard()
+            metrics().count("images.failed")
+            print(f"Image skipped ({e.__class__.__name__}: {e}): {src[:120]}", file=sys.stderr)
+            return None
+        if not out.size:
+            out.discard()
+            return None
+        name = out.commit(src)
+        if not src.startswith("data:"):
+            with self._lock:
+                self._by_src[src] = name
+        return name
+
+    def writer(self) -> StoreWriter:
+        """A StoreWriter for streaming one image in; commit() it for the filename."""
+        return StoreWriter(self.root)
+
+    def put_bytes(self, data: bytes, src: str = "") -> str:
+        out = self.writer()
+        out.write(data)
+        return out.commit(src)
+
+    def save_manifest(self) -> None:
+        with self._lock:
+            live = {k: v for k, v in self._by_src.items() if (self.root / v).is_file()}
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(
+            json.dumps({"version": 1, "sources": live}, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+    def collect_garbage(self, referencing_files: list[Path]) -> list[Path]:
+        """
+        Delete stored images and variants not referenced from `referencing_files`
+        (career pages, doc-media.js). Originals are kept while any of their
+        variants is still referenced. Returns the removed paths.
+        """
+        refs: set[str] = set()
+        for f in referencing_files:
+            try:
+                refs.update(_REF_PAT.findall(f.read_text(encoding="utf-8")))
+            except OSError:
+                continue
+        variant_stems = {
+            Path(r).name.rsplit("-", 1)[0] for r in refs if r.startswith("variants/")
+        }
+
+        removed: list[Path] = []
+        for p in sorted(self.root.iterdir()) if self.root.is_dir() else []:
+            if p.is_file() and p.name not in refs and p.stem not in variant_stems:
+                p.unlink()
+                removed.append(p)
+        variants = self.root / "variants"
+        for p in sorted(variants.iterdir()) if variants.is_dir() else []:
+            if p.is_file() and f"variants/{p.name}" not in refs:
+                p.unlink()
+                removed.append(p)
+        return removed
+
+
+class DataUriSpooler:
+    """
+    HttpClient sink for a Doc export. Hashes the raw export (sha256()), and
+    decodes every data:image/...;base64, blob into `store` as it streams past,
+    so html() holds only the markup with each blob replaced by
+    sht-spooled:<filename> (an empty src if the blob was not valid base64).
+    ImageStore.lookup() resolves those references without any I/O.
+    """
+
+    _MARKER = b"data:image/"
+    _HEADER = re.compile(rb"data:image/([A-Za-z0-9.+-]{1,40});base64,")
+    _HEADER_MAX = len(_MARKER) + 48
+    _BLOB_END = re.compile(rb"[^A-Za-z0-9+/=]")
+
+    def __init__(self, store: ImageStore) -> None:
+        self.store = store
+        self._writer: StoreWriter | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        self._discard()
+        self._hash = hashlib.sha256()
+        self._parts: list[bytes] = []
+        self._pending = b""
+        self._decoder: Base64Decoder | None = None
+        self._mime = ""
+        self._slot = -1
+        self.images = 0
+
+    def write(self, data: bytes) -> None:
+        self._hash.update(data)
+        buf = self._pending + data
+        self._pending = b""
+        while buf:
+            if self._decoder is not None:
+                end = self._BLOB_END.search(buf)
+                self._feed(buf if end is None else buf[: end.start()])
+                if end is None:
+                    return
+                self._finish_blob()
+                buf = buf[end.start() :]
+                continue
+            at = buf.find(self._MARKER)
+            if at < 0:
+                # Keep a tail that could be the start of a marker split across chunks.
+                keep = len(self._MARKER) - 1
+                self._parts.append(buf[:-keep])
+                self._pending = buf[-keep:]
+                return
+            self._parts.append(buf[:at])
+            header = self._HEADER.match(buf, at)
+            if header is None:
+                if len(buf) - at < self._HEADER_MAX:
+                    self._pending = buf[at:]  # header may be incomplete; wait for more
+                    return
+                # Not base64 (e.g. a URL-encoded SVG): leave it in the markup.
+                self._parts.append(self._MARKER)
+                buf = buf[at + len(self._MARKER) :]
+                continue
+            self._start_blob(header.group(1).decode("ascii").lower())
+            buf = buf[header.end() :]
+
+    def _start_blob(self, mime: str) -> None:
+        self._writer = self.store.writer()
+        self._decoder = Base64Decoder(self._writer)
+        self._mime = mime
+        self._slot = len(self._parts)
+        self._parts.append(b"")
+
+    def _feed(self, text: bytes) -> None:
+        if self._writer is None:
+            return  # already failed; skip the rest of the blob
+        try:
+            self._decoder.feed(text)
+        except binascii.Error:
+            self._fail()
+
+    def _finish_blob(self) -> None:
+        ref = b""
+        if self._writer is not None:
+            try:
+                self._decoder.close()
+            except binascii.Error:
+                self._fail()
+        if self._writer is not None and self._writer.size:
+            name = self._writer.commit(f"data:image/{self._mime}")
+            self._writer = None
+            ref = (SPOOLED_PREFIX + name).encode("ascii")
+            self.images += 1
+        self._discard()
+        self._parts[self._slot] = ref
+        self._decoder = None
+
+    def _fail(self) -> None:
+        self._discard()
+        metrics().count("images.failed")
+        print(f"Inline image skipped (invalid base64): data:image/{self._mime}", file=sys.stderr)
+
+    def _discard(self) -> None:
+        if self._writer is not None:
+            self._writer.discard()
+            self._writer = None
+
+    def close(self) -> None:
+        if self._decoder is not None:
+            self._finish_blob()
+        self._parts.append(self._pending)
+        self._pending = b""
+
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def html(self) -> bytes:
+        """The export with blobs replaced; call close() first."""
+        return b"".join(self._parts)
@@ -0,0 +1,305 @@
+"""
+Responsive variants for images imported from Google Docs.
+
+For every original in assets/doc-images/ this writes, under
+assets/doc-images/variants/:
+- <stem>-<w>w.webp       for each width in WIDTHS not larger than the original
+- <stem>-<w>w.avif       the same widths, when requested and Pillow supports AVIF
+- <stem>-<w>w.jpg/.png   a recompressed fallback at the largest width
+
+import_drive_docs.py uses ImageOptimizer to run this in a process pool and
+rewrites the injected <img> tags as <picture> elements. The image's loading
+colour and hero placeholder (see image_meta.py) are taken from the smallest
+variant while the image is decoded anyway. Pillow is optional:
+without it the importer keeps serving the originals.
+
+To add variants to the site already in the repo, run the CLI: it builds them
+for every original the Doc panels in careers/*.html and doc-media.js point at,
+rewrites those <img> tags as <picture> elements, moves the heroes in
+doc-media.js (and the career shards) onto the thumbnail and large variants,
+and commits it all together (see site_output.py):
+  python tools/image_variants.py [--avif] [--workers N]
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+import argparse
+import os
+
+from bs4 import BeautifulSoup
+
+from image_meta import PAGE_PREFIX, ImageInfo, annotate_img, info_from_image
+from site_data import DOC_MEDIA_JS, read_doc_media, render_doc_media, write_site_data
+from site_output import (
+    CAREERS_DIR,
+    HTML_PARSER,
+    OutputReport,
+    doc_sections_inner_html,
+    output_lock,
+    read_window_json,
+    replace_doc_sections_inner,
+)
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # Pillow is optional; callers check available().
+    Image = None
+    ImageOps = None
+    features = None
+
+
+ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = ROOT / "assets" / "doc-images"
+VARIANTS_DIR = ASSETS_DIR / "variants"
+CAREERS_DATA_JS = ROOT / "careers-data.js"
+# doc-media.js paths are relative to the site root.
+HERO_PREFIX = "./assets/doc-images/"
+
+# Doc panels are at most ~800 CSS px wide; 1600 covers 2x screens.
+WIDTHS = (480, 960, 1600)
+THUMB_WIDTH = 480
+WEBP_QUALITY = 78
+AVIF_QUALITY = 55
+JPEG_QUALITY = 80
+SIZES = "(max-width: 980px) calc(100vw - 40px), 760px"
+
+
+@dataclass(frozen=True)
+class ImageVariants:
+    """Variant files for one original; paths are relative to assets/doc-images/."""
+
+    source: str
+    width: int
+    height: int
+    fallback: str
+    webp: tuple[tuple[str, int], ...]
+    avif: tuple[tuple[str, int], ...] = ()
+    color: str | None = None
+    placeholder: str | None = None
+
+    @property
+    def info(self) -> ImageInfo:
+        return ImageInfo(self.width, self.height, self.color, self.placeholder)
+
+    @property
+    def thumb(self) -> str:
+        fits = [p for p, w in self.webp if w <= THUMB_WIDTH]
+        return fits[-1] if fits else self.webp[0][0]
+
+    @property
+    def large(self) -> str:
+        # Closest to the 960px career hero without going over.
+        fits = [p for p, w in self.webp if w <= 960]
+        return fits[-1] if fits else self.webp[0][0]
+
+
+def available() -> bool:
+    return Image is not None
+
+
+def avif_available() -> bool:
+    if features is None:
+        return False
+    try:
+        return bool(features.check("avif"))
+    except (ValueError, KeyError):
+        return False
+
+
+def _is_fresh(out: Path, src: Path) -> bool:
+    return out.exists() and out.stat().st_size > 0 and out.stat().st_mtime >= src.stat().st_mtime
+
+
+def _save(im, out: Path, fmt: str, **params) -> None:
+    tmp = out.with_name(out.name + ".tmp")
+    im.save(tmp, fmt, **params)
+    os.replace(tmp, out)
+
+
+def make_variants(src: Path, out_dir: Path = VARIANTS_DIR, *, avif: bool = False) -> ImageVariants | None:
+    """
+    Create (or reuse up-to-date) variants for one image. Returns None for files
+    Pillow cannot read and for animations, which are left as-is.
+    Runs in worker processes, so it only takes and returns picklable values.
+    `out_dir` must sit directly inside assets/doc-images/.
+    """
+    if Image is None:
+        return None
+    try:
+        im = Image.open(src)
+        im.load()
+    except Exception:
+        return None
+    if getattr(im, "is_animated", False):
+        return None
+    # Browsers display JPEGs rotated by their EXIF orientation; saving drops the tag, so rotate the pixels.
+    im = ImageOps.exif_transpose(im)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    has_alpha = im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info)
+    im = im.convert("RGBA" if has_alpha else "RGB")
+    width, height = im.size
+
+    widths = [w for w in WIDTHS if w < width] + [min(width, WIDTHS[-1])]
+    widths = sorted(set(widths))
+    webp: list[tuple[str, int]] = []
+    avifs: list[tuple[str, int]] = []
+    resized = {}
+    for w in widths:
+        h = max(1, round(height * w / width))
+        resized[w] = im if w == width else im.resize((w, h), Image.LANCZOS)
+
+        out = out_dir / f"{src.stem}-{w}w.webp"
+        if not _is_fresh(out, src):
+            _save(resized[w], out, "WEBP", quality=WEBP_QUALITY, method=6)
+        webp.append((f"{out_dir.name}/{out.name}", w))
+
+        if avif:
+            out = out_dir / f"{src.stem}-{w}w.avif"
+            if not _is_fresh(out, src):
+                _save(resized[w], out, "AVIF", quality=AVIF_QUALITY)
+            avifs.append((f"{out_dir.name}/{out.name}", w))
+
+    top = widths[-1]
+    ext = "png" if has_alpha else "jpg"
+    out = out_dir / f"{src.stem}-{top}w.{ext}"
+    if not _is_fresh(out, src):
+        if has_alpha:
+            _save(resized[top], out, "PNG", optimize=True)
+        else:
+            _save(resized[top], out, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+
+    meta = info_from_image(resized[widths[0]], width, height, placeholder=True)
+    return ImageVariants(
+        source=src.name,
+        width=width,
+        height=height,
+        fallback=f"{out_dir.name}/{out.name}",
+        webp=tuple(webp),
+        avif=tuple(avifs),
+        color=meta.color,
+        placeholder=meta.placeholder,
+    )
+
+
+class ImageOptimizer:
+    """Process pool wrapper so image encoding scales with cores."""
+
+    def __init__(self, workers: int | None = None, *, avif: bool = False) -> None:
+        self.avif = avif and avif_available()
+        self._executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+    def submit(self, src: Path) -> Future:
+        return self._executor.submit(make_variants, src, VARIANTS_DIR, avif=self.avif)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ImageOptimizer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _srcset(prefix: str, items: tuple[tuple[str, int], ...]) -> str:
+    return ", ".join(f"{prefix}{path} {w}w" for path, w in items)
+
+
+def picture_for(soup, img, variants: ImageVariants, prefix: str) -> None:
+    """
+    Replace an <img> with <picture> (AVIF/WebP <source>s + recompressed fallback).
+    `prefix` is the path from the page to assets/doc-images/ (e.g. "../assets/doc-images/").
+    """
+    picture = soup.new_tag("picture")
+    for mime, items in (("image/avif", variants.avif), ("image/webp", variants.webp)):
+        if not items:
+            continue
+        source = soup.new_tag("source")
+        source["type"] = mime
+        source["srcset"] = _srcset(prefix, items)
+        source["sizes"] = SIZES
+        picture.append(source)
+    img.replace_with(picture)
+    img["src"] = f"{prefix}{variants.fallback}"
+    picture.append(img)
+
+
+def _original(src: str, prefix: str) -> Path | None:
+    """The original in assets/doc-images/ that `src` (with the given page prefix) points at, if any."""
+    if not src.startswith(prefix) or "/" in src[len(prefix) :]:
+        return None
+    path = ASSETS_DIR / src[len(prefix) :]
+    return path if path.is_file() else None
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Add WebP/AVIF variants to the imported Doc images already in the site.")
+    ap.add_argument("--avif", action="store_true", help="also write AVIF variants (if Pillow supports it)")
+    ap.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    args = ap.parse_args(argv)
+
+    if not available():
+        print("Pillow is not installed (pip install pillow); nothing to do.")
+        return 2
+
+    with output_lock():
+        pages = []
+        wanted: set[Path] = set()
+        for path in sorted(CAREERS_DIR.glob("*.html")):
+            page = path.read_text(encoding="utf-8")
+            inner = doc_sections_inner_html(page)
+            if not inner:
+                continue
+            soup = BeautifulSoup(f"<div>{inner}</div>", HTML_PARSER)
+            imgs = []
+            for img in soup.div.find_all("img"):
+                original = _original(img.get("src") or "", PAGE_PREFIX)
+                if original is not None and img.find_parent("picture") is None:
+                    imgs.append((img, original))
+                    wanted.add(original)
+            if imgs:
+                pages.append((path, page, soup, imgs))
+        media = read_doc_media()
+        heroes = []
+        for entry in media.values():
+            original = _original(str(entry.get("heroImageSrc") or ""), HERO_PREFIX)
+            if original is not None and not entry.get("heroImageLargeSrc"):
+                heroes.append((entry, original))
+                wanted.add(original)
+
+        with ImageOptimizer(args.workers, avif=args.avif) as opt:
+            futures = {p: opt.submit(p) for p in sorted(wanted)}
+            variants = {p: f.result() for p, f in futures.items()}
+
+        report = OutputReport()
+        for path, page, soup, imgs in pages:
+            for img, original in imgs:
+                v = variants[original]
+                if v is not None:
+                    picture_for(soup, img, v, PAGE_PREFIX)
+                    annotate_img(img, v.info)
+            report.write_text(path, replace_doc_sections_inner(page, soup.div.decode_contents()))
+        for entry, original in heroes:
+            v = variants[original]
+            if v is not None:
+                entry.update(heroImageSrc=HERO_PREFIX + v.thumb, heroImageLargeSrc=HERO_PREFIX + v.large, **v.info.hero_fields())
+        if media:
+            report.write_text(DOC_MEDIA_JS, render_doc_media(media))
+        write_site_data(report, read_window_json(CAREERS_DATA_JS, "SHT_CAREERS"), media)
+        report.commit()
+
+    done = [v for v in variants.values() if v is not None]
+    print(f"Optimized {len(done)} of {len(wanted)} referenced images into {VARIANTS_DIR}")
+    print(f"Output files: {report.summary()}")
+    if args.changes:
+        report.write_changes(args.changes)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
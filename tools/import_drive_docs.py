@@ -2,26 +2,83 @@
 Import public Google Docs from a shared Drive folder into local career pages.
 
 How it works:
-- Scrapes the public Drive folder HTML for (docTitle, docId) pairs.
+- Scrapes the public Drive folder HTML for (docTitle, docId) pairs, following
+  subfolders and paged listings.
 - Loads careers from careers-data.js and matches by exact title.
 - Exports each Google Doc as HTML and extracts/cleans the body content.
+  Exports and images are streamed: inline base64 images are decoded into the
+  image store as the export arrives, so neither is ever held in memory whole.
+  With --export zip, each Doc is fetched as Docs' zipped HTML bundle instead:
+  one request per career, with the images read straight out of the archive
+  (see fetch_zip_export) rather than downloaded one by one.
+- Slims the cleaned markup (see slim_html.py): Google's bare <span>s, spacer
+  paragraphs, empty table rows/columns and extra whitespace are dropped.
 - Injects the cleaned HTML into careers/<slug>.html inside a "Career details" section.
+- Writes doc-media.js and refreshes careers-index.js / data/careers/<slug>.js
+  (see site_data.py) with each doc's hero image.
+
+Doc exports and image downloads run on a bounded thread pool (see FetchPool);
+pages are still processed and written in careers-data.js order, so output is
+identical to a serial run.
+
+Runs are incremental: .build-cache/import-manifest.json remembers each doc's
+ETag/Last-Modified, export hash, the hash of the panels written into its page
+and the options it was imported with (image variants, AVIF, importer version).
+Docs whose export, page panels and options are unchanged are skipped without
+parsing or writing anything; pass --force to re-import everything.
+
+All site output of a run is staged and swapped in at the end (see
+site_output.py): a run that fails halfway, e.g. on a network error, leaves the
+site as it was, and re-running it skips whatever the manifest says is live.
 
 This is safe to re-run. Only careers with matching docs are updated.
+
+Run:
+  python tools/import_drive_docs.py [--workers 8] [--per-host 4] [--force]
+
+Against a local stand-in (see tools/drive_standin.py):
+  python tools/import_drive_docs.py --folder-url http://127.0.0.1:8765/drive/folders/local \
+      --docs-url http://127.0.0.1:8765
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+import argparse
+import hashlib
 import html as html_lib
 import json
+import posixpath
 import re
+import shutil
 import sys
-import urllib.request
-from bs4 import BeautifulSoup
-import base64
-from urllib.parse import urlparse
+import tempfile
+import threading
+import zipfile
+from bs4 import BeautifulSoup, NavigableString, Tag
+from urllib.parse import parse_qsl, unquote, urlencode, urlparse, urlunparse
+
+import build_metrics
+import image_variants
+from build_metrics import active as metrics
+from http_client import configure as configure_http, default_client
+from image_meta import annotate_img, image_info, sized_hero
+from image_store import SPOOLED_PREFIX, DataUriSpooler, ImageStore
+from site_data import render_doc_media, write_site_data
+from slim_html import slim_checked
+from site_output import (
+    HTML_PARSER,
+    OutputReport,
+    doc_sections_inner_html,
+    output_lock,
+    read_window_json,
+    replace_doc_sections_inner,
+    write_cached_panels,
+)
+from image_variants import ImageOptimizer
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -29,9 +86,20 @@ CAREERS_DIR = ROOT / "careers"
 DATA_JS = ROOT / "careers-data.js"
 ASSETS_DIR = ROOT / "assets" / "doc-images"
 DOC_MEDIA_JS = ROOT / "doc-media.js"
+CACHE_DIR = ROOT / ".build-cache"
+IMPORT_MANIFEST = CACHE_DIR / "import-manifest.json"
+IMPORT_MANIFEST_VERSION = 2
+# Bump when a change to the importer changes the pages it writes, so every Doc is re-imported once.
+IMPORTER_VERSION = 1
 
 
 DRIVE_FOLDER_URL = "https://drive.google.com/drive/folders/1qEclhK1GyA88y9GfJQKiPc-YqqxTVXkh?usp=sharing"
+DOCS_BASE_URL = "https://docs.google.com"
+
+# Network concurrency: total worker threads, and how many of them may talk to
+# the same host at once (Docs export and googleusercontent image hosts).
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
 
 
 @dataclass(frozen=True)
@@ -46,26 +114,202 @@ class Career:
     resources: list[str]
 
 
-def read_text(url: str) -> str:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        },
+@dataclass(frozen=True)
+class FetchResult:
+    status: int
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    sha256: str | None = None  # of the bytes as served, when body was rewritten while streaming
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", "ignore")
+
+    def digest(self) -> str:
+        return self.sha256 or _sha256(self.body)
+
+
+def fetch(url: str, headers: dict[str, str] | None = None, *, sink=None) -> FetchResult:
+    """
+    GET a URL through the shared HttpClient (keep-alive, retries, redirects);
+    a 304 answer to a conditional request comes back as status 304 with an
+    empty body. With a sink, a 2xx body is streamed there and body is empty.
+    Raises HttpError for failures that survive the retries.
+    """
+    with metrics().stage("http.fetch"):
+        resp = default_client().get(url, headers, sink=sink)
+    return FetchResult(
+        status=resp.status,
+        body=resp.body,
+        etag=resp.header("ETag"),
+        last_modified=resp.header("Last-Modified"),
     )
-    with urllib.request.urlopen(req, timeout=60) as resp:
-        return resp.read().decode("utf-8", "ignore")
+
+
+def read_text(url: str) -> str:
+    return fetch(url).text()
+
+
+def fetch_export(url: str, headers: dict[str, str] | None, store: ImageStore) -> FetchResult:
+    """
+    fetch() for a Doc export: inline base64 images are decoded into `store`
+    while the export streams in (see DataUriSpooler), so the body holds only
+    the markup. digest() is still the hash of the export as served.
+    """
+    spool = DataUriSpooler(store)
+    resp = fetch(url, headers, sink=spool)
+    if resp.status == 304:
+        return resp
+    spool.close()
+    return replace(resp, body=spool.html(), sha256=spool.sha256())
+
+
+# Bundles up to this size stay in memory; bigger ones spill to a temp file.
+ZIP_SPOOL_MAX = 8 * 1024 * 1024
+_BUNDLE_SRC = re.compile(rb"""(\bsrc=)(["'])([^"'<>]*)\2""", re.I)
+
+
+class _ZipSink:
+    """HttpClient sink collecting a zipped export for zipfile to read."""
+
+    def __init__(self) -> None:
+        self.file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX)
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+
+    def reset(self) -> None:
+        self.file.seek(0)
+        self.file.truncate()
+
+
+def read_doc_bundle(archive: zipfile.ZipFile, store: ImageStore) -> tuple[bytes, str]:
+    """
+    The page markup of a zipped Doc export, and a digest of the bundle.
+
+    Docs puts <title>.html at the top of the archive and every image, pasted
+    or linked, under images/. Each image member is streamed into `store` and
+    its relative src rewritten to sht-spooled:<filename>, exactly what
+    DataUriSpooler produces for inline images, so the cleaner never goes back
+    to the network for them. The digest covers member names, CRCs and sizes
+    but not the timestamps, which Docs sets to the export time.
+    """
+    members = [m for m in archive.infolist() if not m.is_dir()]
+    pages = [m for m in members if m.filename.lower().endswith((".html", ".htm")) and "/" not in m.filename]
+    if not pages:
+        raise zipfile.BadZipFile("no HTML page at the top of the bundle")
+    digest = hashlib.sha256()
+    for m in sorted(members, key=lambda m: m.filename):
+        digest.update(f"{m.filename}\0{m.CRC:08x}\0{m.file_size}\n".encode("utf-8"))
+
+    images: dict[str, str] = {}
+    for m in members:
+        if m in pages:
+            continue
+        out = store.writer()
+        try:
+            with archive.open(m) as src:
+                shutil.copyfileobj(src, out)
+        except BaseException:
+            out.discard()
+            raise
+        if out.size:
+            images[m.filename] = SPOOLED_PREFIX + out.commit(m.filename)
+        else:
+            out.discard()
+    metrics().count("images.bundled", len(images))
+
+    def local(m: re.Match) -> bytes:
+        ref = html_lib.unescape(m.group(3).decode("utf-8", "ignore"))
+        name = posixpath.normpath(unquote(ref.split("#", 1)[0].split("?", 1)[0]))
+        spooled = images.get(name)
+        return m.group(0) if spooled is None else m.group(1) + m.group(2) + spooled.encode("ascii") + m.group(2)
+
+    page = _BUNDLE_SRC.sub(local, archive.read(pages[0]))
+    # Bundles normally hold no data: URIs, but decode any the same way as fetch_export().
+    spool = DataUriSpooler(store)
+    spool.write(page)
+    spool.close()
+    return spool.html(), digest.hexdigest()
+
+
+def fetch_zip_export(url: str, headers: dict[str, str] | None, store: ImageStore) -> FetchResult:
+    """
+    fetch_export() for export?format=zip: one request returns the page and all
+    of its images (see read_doc_bundle). The body is the page markup and
+    digest() the bundle digest.
+    """
+    sink = _ZipSink()
+    with sink.file:
+        resp = fetch(url, headers, sink=sink)
+        if resp.status == 304:
+            return resp
+        with metrics().stage("export.unzip"), zipfile.ZipFile(sink.file) as archive:
+            body, digest = read_doc_bundle(archive, store)
+    return replace(resp, body=body, sha256=digest)
+
+
+class FetchPool:
+    """
+    Bounded thread pool for network calls with a per-host concurrency cap.
+
+    Work is queued per host and only handed to the executor when that host has
+    a free slot, so a backlog of Doc exports never starves image downloads from
+    other hosts (and vice versa). Callers keep their own ordering by holding on
+    to the returned futures.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, per_host: int = DEFAULT_PER_HOST) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="fetch")
+        self._per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._active: dict[str, int] = defaultdict(int)
+        self._pending: dict[str, deque] = defaultdict(deque)
+
+    def submit(self, url: str, fn, *args) -> Future:
+        fut: Future = Future()
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            self._pending[host].append((fut, fn, args))
+            self._dispatch(host)
+        return fut
+
+    def _dispatch(self, host: str) -> None:
+        # Caller holds self._lock.
+        queue = self._pending[host]
+        while queue and self._active[host] < self._per_host:
+            fut, fn, args = queue.popleft()
+            self._active[host] += 1
+            self._executor.submit(self._run, host, fut, fn, args)
+
+    def _run(self, host: str, fut: Future, fn, args) -> None:
+        try:
+            if fut.set_running_or_notify_cancel():
+                try:
+                    fut.set_result(fn(*args))
+                except BaseException as exc:
+                    fut.set_exception(exc)
+        finally:
+            with self._lock:
+                self._active[host] -= 1
+                self._dispatch(host)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "FetchPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def parse_careers_data() -> list[Career]:
-    raw = DATA_JS.read_text(encoding="utf-8")
-    # Be tolerant of leading whitespace/BOM
-    raw = raw.lstrip("\ufeff \t\r\n")
-    raw = re.sub(r"^window\.SHT_CAREERS\s*=\s*", "", raw).strip()
-    if raw.endswith(";"):
-        raw = raw[:-1]
-    data = json.loads(raw)
+    return careers_from_data(read_window_json(DATA_JS, "SHT_CAREERS"))
+
+
+def careers_from_data(data: list[dict]) -> list[Career]:
+    """Careers from careers-data.js entries (or the rows sync_from_xlsx.py reads)."""
     out: list[Career] = []
     for c in data:
         out.append(
@@ -83,104 +327,167 @@ def parse_careers_data() -> list[Career]:
     return out
 
 
-def extract_doc_ids_from_folder(folder_html: str) -> dict[str, str]:
+# One scanner for the whole folder page. The listing is embedded as a JS string,
+# so quotes may appear raw, HTML-escaped or JS-escaped; titles are unescaped one
+# at a time instead of unescaping the whole page.
+_Q = r'(?:"|&quot;|&#34;|&#x22;|\\x22|\\u0022|\\")'
+_FOLDER_SCAN = re.compile(
+    rf"{_Q}(?P<id>[A-Za-z0-9_-]{{20,}}){_Q}\],null,null,null,"
+    rf"{_Q}application/vnd\.google-apps\.(?P<kind>document|folder){_Q}"
+    rf"|\[\[\[{_Q}(?P<title>[^\n]{{1,500}}?){_Q},null,true\]\]\]"
+    rf"|{_Q}nextPageToken{_Q}:\s*{_Q}(?P<token>[A-Za-z0-9_.~+/=-]+){_Q}"
+)
+_JS_ESCAPE = re.compile(r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|.)")
+
+
+def _unescape_listing_text(s: str) -> str:
+    def js(m: re.Match) -> str:
+        e = m.group(1)
+        return chr(int(e[1:], 16)) if e[0] in "xu" and len(e) > 1 else e
+
+    return html_lib.unescape(_JS_ESCAPE.sub(js, s))
+
+
+@dataclass
+class FolderListing:
+    docs: dict[str, str]
+    folders: dict[str, str]
+    next_page_token: str | None = None
+
+
+def parse_folder_listing(folder_html: str) -> FolderListing:
     """
-    Extract (title -> docId) from the public Drive folder HTML.
-    This relies on embedded data structures that include:
-      "<docId>"],null,null,null,"application/vnd.google-apps.document", ... [[["<Title>",null,true]]]
+    Single pass over a public Drive folder page. Each entry looks like
+      "<id>"],null,null,null,"application/vnd.google-apps.<document|folder>", ... [[["<Title>",null,true]]]
+    and is paired with the first title after it (never one past the next
+    entry). Returns docs and subfolders (title -> id, first occurrence wins)
+    and the page token when the listing continues on another page.
     """
-    text = html_lib.unescape(folder_html)
-    found: dict[str, str] = {}
+    docs: dict[str, str] = {}
+    folders: dict[str, str] = {}
+    token: str | None = None
+    pending: tuple[str, str] | None = None
+    for m in _FOLDER_SCAN.finditer(folder_html):
+        if m.group("id"):
+            pending = (m.group("kind"), m.group("id"))
+        elif m.group("title") is not None:
+            if pending is None:
+                continue
+            kind, item_id = pending
+            pending = None
+            title = _unescape_listing_text(m.group("title")).strip()
+            found = docs if kind == "document" else folders
+            if title and title not in found:
+                found[title] = item_id
+        else:
+            token = _unescape_listing_text(m.group("token"))
+    return FolderListing(docs, folders, token)
 
-    # Find docId anchors
-    id_pat = re.compile(
-        r'"(?P<id>[A-Za-z0-9_-]{20,})"],null,null,null,"application/vnd\.google-apps\.document"',
-        re.MULTILINE,
-    )
-    # Title marker appears near the doc entry
-    title_pat = re.compile(r'\[\[\["(?P<title>[^"]+)",null,true\]\]\]', re.MULTILINE)
 
-    for m in id_pat.finditer(text):
-        doc_id = m.group("id").strip()
-        if not doc_id:
-            continue
-        chunk = text[m.end() : m.end() + 3000]
-        tm = title_pat.search(chunk)
-        if not tm:
-            continue
-        title = tm.group("title").strip()
-        if title and title not in found:
-            found[title] = doc_id
+def extract_doc_ids_from_folder(folder_html: str) -> dict[str, str]:
+    """Extract (title -> docId) from one public Drive folder page."""
+    return parse_folder_listing(folder_html).docs
+
 
-    return found
+def _folder_page_url(folder_url: str, folder_id: str | None = None, page_token: str | None = None) -> str:
+    parts = urlparse(folder_url)
+    path = parts.path
+    if folder_id is not None:
+        path = re.sub(r"/folders/[^/]+", f"/folders/{folder_id}", path)
+    query = parse_qsl(parts.query)
+    if folder_id is not None:
+        query = [(k, v) for k, v in query if k != "resourcekey"]
+    query = [(k, v) for k, v in query if k != "pageToken"]
+    if page_token:
+        query.append(("pageToken", page_token))
+    return urlunparse(parts._replace(path=path, query=urlencode(query)))
 
 
-def export_doc_html(doc_id: str) -> str:
+def list_drive_folder(folder_url: str, pool: FetchPool | None = None, *, max_pages: int = 1000) -> dict[str, str]:
+    """
+    Every Doc (title -> docId) in a public Drive folder, its subfolders
+    (breadth-first; subfolders of one level fetched concurrently when a pool is
+    given) and all pages of each listing. The first doc seen with a title wins,
+    so docs in the top folder take precedence over same-named docs below it.
+    """
+    docs: dict[str, str] = {}
+    seen_folders: set[str] = set()
+    level = [folder_url]
+    pages = 0
+    while level:
+        if pool is not None:
+            futures = [pool.submit(u, read_text, u) for u in level]
+            bodies = [f.result() for f in futures]
+        else:
+            bodies = [read_text(u) for u in level]
+        next_level: list[str] = []
+        for url, html in zip(level, bodies):
+            seen_tokens: set[str] = set()
+            while True:
+                pages += 1
+                listing = parse_folder_listing(html)
+                for title, doc_id in listing.docs.items():
+                    docs.setdefault(title, doc_id)
+                for folder_id in listing.folders.values():
+                    if folder_id not in seen_folders:
+                        seen_folders.add(folder_id)
+                        next_level.append(_folder_page_url(folder_url, folder_id))
+                token = listing.next_page_token
+                if not token or token in seen_tokens or pages >= max_pages:
+                    break
+                seen_tokens.add(token)
+                html = read_text(_folder_page_url(url, page_token=token))
+        level = next_level
+    metrics().count("folder.pages", pages)
+    return docs
+
+
+EXPORT_FETCHERS = {"html": fetch_export, "zip": fetch_zip_export}
+
+
+def export_doc_url(doc_id: str, docs_base_url: str = DOCS_BASE_URL, fmt: str = "html") -> str:
     # Public export URL
-    url = f"https://docs.google.com/document/d/{doc_id}/export?format=html"
-    return read_text(url)
+    return f"{docs_base_url.rstrip('/')}/document/d/{doc_id}/export?format={fmt}"
 
 
-def _save_image_from_src(img_src: str, out_path: Path) -> bool:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    if out_path.exists() and out_path.stat().st_size > 0:
-        return True
+def export_doc_html(doc_id: str, docs_base_url: str = DOCS_BASE_URL) -> str:
+    return read_text(export_doc_url(doc_id, docs_base_url))
 
-    if img_src.startswith("data:image/"):
-        # data:image/jpeg;base64,...
-        try:
-            header, b64 = img_src.split(",", 1)
-            data = base64.b64decode(b64)
-            out_path.write_bytes(data)
-            return True
-        except Exception:
-            return False
-
-    # http(s) image
-    try:
-        req = urllib.request.Request(
-            img_src,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            },
-        )
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            out_path.write_bytes(resp.read())
-        return True
-    except Exception:
-        return False
 
+def parse_html(markup: str) -> BeautifulSoup:
+    """Parse with lxml when it is installed (several times faster), else html.parser."""
+    return BeautifulSoup(markup, HTML_PARSER)
 
-def _ext_from_src(img_src: str) -> str:
-    if img_src.startswith("data:image/"):
-        m = re.match(r"data:image/([a-zA-Z0-9.+-]+);base64", img_src)
-        if m:
-            t = m.group(1).lower()
-            if "jpeg" in t or t == "jpg":
-                return "jpg"
-            if "png" in t:
-                return "png"
-            if "webp" in t:
-                return "webp"
-        return "img"
-    try:
-        path = urlparse(img_src).path
-        ext = Path(path).suffix.lower().lstrip(".")
-        return ext or "img"
-    except Exception:
-        return "img"
+
+def _has_content(el: Tag) -> bool:
+    return any(not isinstance(c, NavigableString) or c.strip() for c in el.contents)
 
 
-def clean_google_doc_html(exported_html: str, *, slug: str) -> tuple[str, str | None]:
+def clean_google_doc(
+    soup: BeautifulSoup,
+    *,
+    slug: str,
+    store: ImageStore | None = None,
+    pool: FetchPool | None = None,
+    optimizer: ImageOptimizer | None = None,
+) -> tuple[Tag | None, dict[str, str | int] | None]:
     """
-    Returns (cleaned_inner_html, hero_image_src_for_landing_or_none).
-    Also downloads images locally and rewrites <img src> to ../assets/doc-images/<file>.
+    Clean a parsed Doc export in place and return (content_element, hero_media_or_none).
+    content_element is the Doc's main container (or <body>); None if there is no body.
+
+    Images are stored in the content-addressed ImageStore and <img src> is
+    rewritten to ../assets/doc-images/<hash>.<ext>. Images whose source URL is
+    already in the store are reused without touching the network; with a pool,
+    the rest are fetched concurrently. Filenames depend only on image bytes, so
+    the result does not depend on completion order.
+    With an optimizer, each image becomes a <picture> with WebP/AVIF variants and
+    the hero points at the small thumbnail variant.
+    hero_media holds the doc-media.js fields: heroImageSrc (landing card) and,
+    when variants exist, heroImageLargeSrc (career page hero).
     """
-    soup = BeautifulSoup(exported_html, "html.parser")
     body = soup.body
     if body is None:
-        return ("", None)
+        return (None, None)
 
     # Remove scripts/styles and other noise
     for el in body.find_all(["script", "style", "noscript"]):
@@ -196,24 +503,30 @@ def clean_google_doc_html(exported_html: str, *, slug: str) -> tuple[str, str |
         main = body
 
     # Download images locally + rewrite src
-    hero_root_src: str | None = None
-    img_idx = 0
+    if store is None:
+        store = ImageStore()
+    jobs = []
     for img in main.find_all("img"):
         src = img.get("src") or ""
         if not src:
             continue
-        img_idx += 1
-        ext = _ext_from_src(src)
-        filename = f"{slug}-{img_idx}.{ext}"
-        out_path = ASSETS_DIR / filename
-        ok = _save_image_from_src(src, out_path)
-        if not ok:
+        known = None if src.startswith("data:") else store.lookup(src)
+        if known is None and pool is not None and not src.startswith("data:"):
+            pending = pool.submit(src, store.save, src)
+        else:
+            pending = known or store.save(src)
+        jobs.append((img, pending))
+
+    saved = []
+    for img, pending in jobs:
+        with metrics().stage("clean.image_wait"):
+            filename = pending.result() if isinstance(pending, Future) else pending
+        if not filename:
             continue
-        # landing-page path (root-relative)
-        if hero_root_src is None:
-            hero_root_src = f"./assets/doc-images/{filename}"
         # career-page path (one directory deeper)
         img["src"] = f"../assets/doc-images/{filename}"
+        variants = optimizer.submit(ASSETS_DIR / filename) if optimizer is not None else None
+        saved.append((img, filename, variants))
 
     # Strip excessive attributes and normalize images
     for tag in main.find_all(True):
@@ -225,39 +538,83 @@ def clean_google_doc_html(exported_html: str, *, slug: str) -> tuple[str, str |
             tag.attrs.setdefault("loading", "lazy")
             tag.attrs.setdefault("decoding", "async")
 
+    # Swap in responsive variants (after attribute stripping, which would drop srcset)
+    hero: dict[str, str | int] | None = None
+    for img, filename, pending in saved:
+        with metrics().stage("clean.variants_wait"):
+            variants = pending.result() if pending is not None else None
+        if variants is not None:
+            image_variants.picture_for(soup, img, variants, "../assets/doc-images/")
+            info = variants.info
+        else:
+            # Only the hero needs a placeholder image; the rest get a colour.
+            with metrics().stage("clean.image_info"):
+                info = image_info(ASSETS_DIR / filename, placeholder=hero is None)
+        annotate_img(img, info)
+        if hero is None:
+            # landing-page paths (root-relative)
+            if variants is not None:
+                hero = {
+                    "heroImageSrc": f"./assets/doc-images/{variants.thumb}",
+                    "heroImageLargeSrc": f"./assets/doc-images/{variants.large}",
+                }
+            else:
+                hero = {"heroImageSrc": f"./assets/doc-images/{filename}"}
+            if info is not None:
+                hero.update(info.hero_fields())
+
     # Drop empty paragraphs
     for p in main.find_all("p"):
         if not p.get_text(strip=True) and not p.find("img"):
             p.decompose()
 
+    return (main, hero)
+
+
+def clean_google_doc_html(
+    exported_html: str,
+    *,
+    slug: str,
+    store: ImageStore | None = None,
+    pool: FetchPool | None = None,
+    optimizer: ImageOptimizer | None = None,
+) -> tuple[str, dict[str, str | int] | None]:
+    """
+    String form of clean_google_doc(): returns (cleaned_inner_html, hero_media_or_none).
+    """
+    main, hero = clean_google_doc(parse_html(exported_html), slug=slug, store=store, pool=pool, optimizer=optimizer)
+    if main is None:
+        return ("", None)
     # Return inner HTML (not including <body>)
-        return ("".join(str(x) for x in main.contents).strip(), hero_root_src)
+    return (main.decode_contents().strip(), hero)
 
 
-def inject_into_career_page(existing: str, title: str, details_html: str) -> str:
+def inject_details(page: BeautifulSoup, content: Tag) -> bool:
     """
-    Replace (or insert) a section with id="careerDetails" inside the main content area.
+    Replace (or insert) a section with id="careerDetails" inside the page's main
+    content area, moving `content`'s children into it. Returns False if the page
+    has no <main>.
     """
-    soup = BeautifulSoup(existing, "html.parser")
-    main = soup.find("main")
+    main = page.find("main")
     if main is None:
-        return existing
+        return False
 
-    container = soup.new_tag("section")
+    container = page.new_tag("section")
     container["class"] = "panel"
     container["id"] = "careerDetails"
 
-    h2 = soup.new_tag("h2")
+    h2 = page.new_tag("h2")
     h2.string = "Career Details"
     container.append(h2)
 
-    wrap = soup.new_tag("div")
+    wrap = page.new_tag("div")
     wrap["class"] = "gdoc"
-    wrap.append(BeautifulSoup(details_html, "html.parser"))
+    for child in list(content.contents):
+        wrap.append(child.extract())
     container.append(wrap)
 
     # Remove any existing details section
-    old = soup.find(id="careerDetails")
+    old = page.find(id="careerDetails")
     if old is not None:
         old.replace_with(container)
     else:
@@ -270,7 +627,77 @@ def inject_into_career_page(existing: str, title: str, details_html: str) -> str
 
     # Ensure the title exists somewhere for correctness (not required, but helpful)
     # We do not modify the header wording here to avoid overriding user edits.
-    return str(soup)
+    return True
+
+
+def inject_into_career_page(existing: str, title: str, details_html: str) -> str:
+    """
+    String form of inject_details().
+    """
+    page = parse_html(existing)
+    if not inject_details(page, parse_html(f"<div>{details_html}</div>").div):
+        return existing
+    return str(page)
+
+
+def _sha256(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_import_manifest() -> dict[str, dict]:
+    """docId -> {slug, title, etag, lastModified, exportSha256, panelsSha256, options, hero}"""
+    try:
+        data = json.loads(IMPORT_MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != IMPORT_MANIFEST_VERSION:
+        return {}  # another layout: re-import everything once
+    docs = data.get("docs")
+    return docs if isinstance(docs, dict) else {}
+
+
+def save_import_manifest(docs: dict[str, dict]) -> None:
+    IMPORT_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    IMPORT_MANIFEST.write_text(
+        json.dumps({"version": IMPORT_MANIFEST_VERSION, "docs": docs}, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+def _conditional_headers(prev: dict | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if prev:
+        if prev.get("etag"):
+            headers["If-None-Match"] = prev["etag"]
+        if prev.get("lastModified"):
+            headers["If-Modified-Since"] = prev["lastModified"]
+    return headers
+
+
+def import_options(optimizer: ImageOptimizer | None, slim: bool) -> str:
+    """The settings that shape an imported page, recorded per Doc in the manifest."""
+    avif = optimizer is not None and optimizer.avif
+    return f"v{IMPORTER_VERSION};optimize={optimizer is not None};avif={avif};slim={slim}"
+
+
+def _is_unchanged(prev: dict | None, resp: FetchResult, page_html: str, options: str) -> bool:
+    """
+    True if the Doc export and the panels currently in the page both match the
+    manifest, and the page was imported with the same options.
+    """
+    if not prev or prev.get("options") != options:
+        return False
+    if resp.status != 304 and resp.digest() != prev.get("exportSha256"):
+        return False
+    panels = doc_sections_inner_html(page_html)
+    return panels is not None and _sha256(panels) == prev.get("panelsSha256")
+
+
+def _media_entry(hero: dict[str, str | int], doc_id: str, title: str) -> dict[str, str | int]:
+    # Fixed key order so doc-media.js is byte-stable across fresh and skipped imports.
+    return {**{k: hero[k] for k in sorted(hero)}, "docId": doc_id, "title": title}
 
 
 def _norm_heading(s: str) -> str:
@@ -290,37 +717,46 @@ SECTION_ORDER = [
     "you belong here",
 ]
 
+SECTION_TITLES = {
+    "pathway snapshot": "Pathway Snapshot",
+    "women who lead the way": "Women Who Lead the Way",
+    "day in the life": "Day in the Life",
+    "mini-activity: try this!": "Mini-Activity: Try This!",
+    "careers & resources": "Careers & Resources",
+    "you belong here": "You Belong Here",
+}
+
+SECTION_TABLE_CLASSES = {
+    "day in the life": ["sht-table", "sht-table-day"],
+    "pathway snapshot": ["sht-table", "sht-table-pathway"],
+}
+
+_SECTION_TARGETS = {k: k for k in SECTION_ORDER}
+# allow minor variants
+_SECTION_TARGETS.update(
+    {
+        "mini activity try this": "mini-activity: try this!",
+        "mini activity try this!": "mini-activity: try this!",
+        "mini activity": "mini-activity: try this!",
+        "mini activity try this ": "mini-activity: try this!",
+        "mini activity try this  ": "mini-activity: try this!",
+        "careers and resources": "careers & resources",
+        "careers resources": "careers & resources",
+        "opportunities resources": "careers & resources",
+        "opportunities and resources": "careers & resources",
+        "opportunities & resources": "careers & resources",
+    }
+)
 
-def split_doc_into_sections(cleaned_inner_html: str) -> dict[str, str]:
+
+def split_doc_sections(root: Tag) -> dict[str, list[Tag]]:
     """
-    Split cleaned Google Doc HTML into sections keyed by canonical heading.
+    Group the element children of a cleaned Doc by canonical section heading.
     We look for headings matching:
       Women Who Lead the Way, Day in the Life, Mini-Activity, Opportunities, You Belong Here
+    Nodes stay in the tree; build_doc_panels() moves them.
     """
-    soup = BeautifulSoup(f"<div>{cleaned_inner_html}</div>", "html.parser")
-    root = soup.div
-    if root is None:
-        return {}
-
-    targets = {k: k for k in SECTION_ORDER}
-    # allow minor variants
-    targets.update(
-        {
-            "mini activity try this": "mini-activity: try this!",
-            "mini activity try this!": "mini-activity: try this!",
-            "mini activity": "mini-activity: try this!",
-            "mini activity try this ": "mini-activity: try this!",
-            "mini activity try this  ": "mini-activity: try this!",
-            "mini activity try this": "mini-activity: try this!",
-            "careers and resources": "careers & resources",
-            "careers resources": "careers & resources",
-            "opportunities resources": "careers & resources",
-            "opportunities and resources": "careers & resources",
-            "opportunities & resources": "careers & resources",
-        }
-    )
-
-    sections: dict[str, list[str]] = {}
+    sections: dict[str, list[Tag]] = {}
     current_key: str | None = None
 
     for node in list(root.children):
@@ -330,162 +766,384 @@ def split_doc_into_sections(cleaned_inner_html: str) -> dict[str, str]:
         if node.name == "h2":
             text = node.get_text(" ", strip=True)
             norm = _norm_heading(text)
-            if norm in targets:
-                current_key = targets[norm]
+            if norm in _SECTION_TARGETS:
+                current_key = _SECTION_TARGETS[norm]
                 sections.setdefault(current_key, [])
                 continue
         if current_key:
-            sections[current_key].append(str(node))
+            sections[current_key].append(node)
 
-    # join
-    out: dict[str, str] = {}
-    for k in SECTION_ORDER:
-        if k in sections:
-            out[k] = "".join(sections[k]).strip()
-    return out
+    return {k: sections[k] for k in SECTION_ORDER if k in sections}
 
 
-def build_doc_panels_html(section_map: dict[str, str]) -> str:
+def split_doc_into_sections(cleaned_inner_html: str) -> dict[str, str]:
     """
-    Create panel HTML blocks in the desired order.
-    Also applies special table styling for 'Day in the Life'.
+    String form of split_doc_sections(): canonical heading -> section inner HTML.
     """
-    if not section_map:
-        return ""
+    root = parse_html(f"<div>{cleaned_inner_html}</div>").div
+    if root is None:
+        return {}
+    return {k: "".join(str(n) for n in nodes).strip() for k, nodes in split_doc_sections(root).items()}
 
-    out = []
-    title_case = {
-        "pathway snapshot": "Pathway Snapshot",
-        "women who lead the way": "Women Who Lead the Way",
-        "day in the life": "Day in the Life",
-        "mini-activity: try this!": "Mini-Activity: Try This!",
-        "careers & resources": "Careers & Resources",
-        "you belong here": "You Belong Here",
-    }
 
+def build_doc_panels(soup: BeautifulSoup, sections: dict[str, list[Tag]]) -> list[Tag]:
+    """
+    Create panel <section>s in the desired order, moving each section's nodes in.
+    Also applies special table styling for 'Day in the Life' and 'Pathway Snapshot'.
+    """
+    out: list[Tag] = []
     for key in SECTION_ORDER:
-        inner = section_map.get(key, "").strip()
-        if not inner:
+        nodes = sections.get(key) or []
+        if not nodes:
             continue
-        soup = BeautifulSoup(f"<div>{inner}</div>", "html.parser")
-        if key == "day in the life":
-            for table in soup.find_all("table"):
-                existing = table.get("class") or []
-                table["class"] = list(dict.fromkeys(existing + ["sht-table", "sht-table-day"]))
-        if key == "pathway snapshot":
-            for table in soup.find_all("table"):
+        panel = soup.new_tag("section")
+        panel["class"] = ["panel", "doc-panel"]
+        panel["data-doc-section"] = key.replace(" ", "-")
+        h2 = soup.new_tag("h2")
+        h2.string = SECTION_TITLES[key]
+        panel.append(h2)
+        wrap = soup.new_tag("div")
+        wrap["class"] = "gdoc"
+        for node in nodes:
+            wrap.append(node.extract())
+        extra = SECTION_TABLE_CLASSES.get(key)
+        if extra:
+            for table in wrap.find_all("table"):
                 existing = table.get("class") or []
-                table["class"] = list(dict.fromkeys(existing + ["sht-table", "sht-table-pathway"]))
-        panel = f'<section class="panel doc-panel" data-doc-section="{key.replace(" ","-")}"><h2>{title_case[key]}</h2><div class="gdoc">{str(soup.div)[5:-6] if soup.div else inner}</div></section>'
+                table["class"] = list(dict.fromkeys(existing + extra))
+        panel.append(wrap)
         out.append(panel)
-    return "\n".join(out)
+    return out
 
 
-def main() -> int:
+def build_doc_panels_html(section_map: dict[str, str]) -> str:
+    """
+    String form of build_doc_panels().
+    """
+    if not section_map:
+        return ""
+    soup = parse_html("<div></div>")
+    sections: dict[str, list[Tag]] = {}
+    for key, inner in section_map.items():
+        root = parse_html(f"<div>{inner.strip()}</div>").div
+        sections[key] = [n for n in root.children if getattr(n, "name", None)] if root else []
+    return "\n".join(str(p) for p in build_doc_panels(soup, sections))
+
+
+def render_career_page(
+    existing: str,
+    exported_html: str,
+    *,
+    slug: str,
+    store: ImageStore | None = None,
+    pool: FetchPool | None = None,
+    optimizer: ImageOptimizer | None = None,
+    slim: bool = True,
+) -> tuple[str | None, dict[str, str | int] | None, int]:
+    """
+    Import one Doc into one career page with a single parse of the export:
+    cleaning, section splitting, table classing and slimming all work on that
+    tree. The panels are spliced into the page's <div id="docSections"> as
+    text, so the rest of the page (as written by sync_from_xlsx.py) is left
+    byte-for-byte alone and never needs parsing. Returns
+    (new_page_html_or_None_if_doc_is_empty, hero_media, bytes_slimmed).
+    """
+    with metrics().stage("parse"):
+        doc = parse_html(exported_html)
+    with metrics().stage("clean"):
+        main, hero = clean_google_doc(doc, slug=slug, store=store, pool=pool, optimizer=optimizer)
+    if main is None or not _has_content(main):
+        return (None, hero, 0)
+
+    # Split only for a page with a <div id="docSections"> to put the panels in:
+    # build_doc_panels() moves the section bodies out of `main`, and the
+    # fallback below injects the whole of `main`.
+    panels: list[Tag] = []
+    if doc_sections_inner_html(existing) is not None:
+        with metrics().stage("split"):
+            panels = build_doc_panels(doc, split_doc_sections(main))
+    slimmed = 0
+    if slim:
+        # Per panel, like slim_html.py on existing pages, so both give the same markup.
+        with metrics().stage("slim"):
+            for el in panels or [main]:
+                slimmed += slim_checked(el, f"the Doc for {slug}")
+        metrics().count("slim.bytes_saved", slimmed)
+    if panels:
+        return (replace_doc_sections_inner(existing, "\n".join(str(p) for p in panels)), hero, slimmed)
+
+    page = parse_html(existing)
+    if not inject_details(page, main):
+        # fallback to a single panel; pages without <main> are left alone
+        return (existing, hero, 0)
+    return (str(page), hero, slimmed)
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Import Google Docs from the Drive folder into career pages.")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="network worker threads")
+    ap.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="max concurrent requests per host")
+    ap.add_argument("--timeout", type=float, default=30.0, help="per-request socket timeout (seconds)")
+    ap.add_argument("--retries", type=int, default=4, help="retries for 429/5xx/connection errors")
+    ap.add_argument("--rate", type=float, default=None, help="max requests per second across all workers")
+    ap.add_argument("--folder-url", default=DRIVE_FOLDER_URL, help="public Drive folder URL")
+    ap.add_argument("--docs-url", default=DOCS_BASE_URL, help="Google Docs base URL used for exports")
+    ap.add_argument(
+        "--export",
+        choices=sorted(EXPORT_FETCHERS),
+        default="html",
+        help="html: export page plus a request per linked image; zip: one bundle per Doc",
+    )
+    ap.add_argument("--force", action="store_true", help="ignore the import manifest and re-import every doc")
+    ap.add_argument("--no-optimize", action="store_true", help="serve original images (skip WebP/AVIF variants)")
+    ap.add_argument("--avif", action="store_true", help="also emit AVIF variants (if Pillow supports it)")
+    ap.add_argument("--image-workers", type=int, default=None, help="image worker processes (default: CPU count)")
+    ap.add_argument("--no-gc", action="store_true", help="keep images no page references any more")
+    ap.add_argument("--no-slim", action="store_true", help="keep the cleaned Doc markup as is (skip slim_html.py)")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    ap.add_argument("--metrics-json", type=Path, help="write stage/career timings and counters as JSON")
+    ap.add_argument("--profile", type=Path, help="cProfile the run (main thread), dump stats here, print hot spots")
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     if not DATA_JS.exists():
         print(f"Missing {DATA_JS}", file=sys.stderr)
         return 2
 
-    careers = parse_careers_data()
-    folder_html = read_text(DRIVE_FOLDER_URL)
-    title_to_id = extract_doc_ids_from_folder(folder_html)
-
-    # Some Docs may have slightly different titles than the Excel careers.
-    # Add lightweight aliasing here so "file title matches career" can tolerate minor variations.
-    explicit_aliases: dict[str, str] = {
-        "Graphic Designer": "Graphics Designer",
-        # Current XLSX uses "Tech Choreographer"
-        "Choreographer with Tech": "Tech Choreographer",
-    }
+    optimizer = None
+    if not args.no_optimize:
+        if image_variants.available():
+            optimizer = ImageOptimizer(args.image_workers, avif=args.avif)
+        else:
+            print("Pillow not installed; keeping original images (pip install pillow to optimize).")
+    run = build_metrics.begin("import_drive_docs")
+    http = configure_http(timeout=args.timeout, retries=args.retries, rate=args.rate)
+    try:
+        with build_metrics.profiled(args.profile), output_lock(), FetchPool(args.workers, args.per_host) as pool:
+            return _run_import(args, pool, optimizer)
+    finally:
+        if optimizer is not None:
+            optimizer.close()
+        http.close()
+        print(run.summary())
+        if args.metrics_json:
+            run.write_json(args.metrics_json)
+
+
+# Some Docs have slightly different titles than the Excel careers.
+TITLE_ALIASES: dict[str, str] = {
+    "Graphic Designer": "Graphics Designer",
+    # Current XLSX uses "Tech Choreographer"
+    "Choreographer with Tech": "Tech Choreographer",
+}
+
+
+def _norm_title(s: str) -> str:
+    s = s.strip().lower()
+    s = re.sub(r"&", "and", s)
+    s = re.sub(r"[^a-z0-9]+", " ", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    # normalize plurals for designer(s)
+    s = s.replace("graphics designer", "graphic designer")
+    return s
 
-    def norm(s: str) -> str:
-        s = s.strip().lower()
-        s = re.sub(r"&", "and", s)
-        s = re.sub(r"[^a-z0-9]+", " ", s)
-        s = re.sub(r"\s+", " ", s).strip()
-        # normalize plurals for designer(s)
-        s = s.replace("graphics designer", "graphic designer")
-        return s
 
-    # Build a docId lookup by career title (with alias/normalization)
+def match_docs(careers: list[Career], title_to_id: dict[str, str]) -> tuple[dict[str, str], list[str]]:
+    """
+    Career title -> docId for the Docs whose title matches a career (with
+    TITLE_ALIASES and lightweight normalization), and the Doc titles that
+    match no career (usually a naming mismatch).
+    """
     doc_id_for_career: dict[str, str] = {}
-    career_by_norm: dict[str, str] = {norm(c.title): c.title for c in careers}
-
+    career_by_norm: dict[str, str] = {_norm_title(c.title): c.title for c in careers}
     for doc_title, doc_id in title_to_id.items():
-        mapped = explicit_aliases.get(doc_title, doc_title)
-        n = norm(mapped)
-        target = career_by_norm.get(n)
+        target = career_by_norm.get(_norm_title(TITLE_ALIASES.get(doc_title, doc_title)))
         if target and target not in doc_id_for_career:
             doc_id_for_career[target] = doc_id
 
-    matched = 0
-    updated = 0
-    unmatched_docs: list[str] = []
-    media: dict[str, dict[str, str]] = {}
-
+    career_titles = {c.title for c in careers}
+    unmatched: list[str] = []
+    for t in sorted(title_to_id.keys()):
+        mapped = TITLE_ALIASES.get(t, t)
+        if mapped not in career_titles and _norm_title(mapped) not in career_by_norm:
+            unmatched.append(t)
+    return doc_id_for_career, unmatched
+
+
+@dataclass
+class DocImport:
+    """What import_docs() staged, for the caller to report and finish_import() to record."""
+
+    found: int
+    matched: int
+    unmatched: list[str]
+    media: dict[str, dict[str, str | int]]
+    manifest: dict[str, dict]
+    store: ImageStore
+    images_before: dict[Path, tuple[int, int]]
+    updated: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    slimmed: dict[str, int] = field(default_factory=dict)
+
+
+def import_docs(
+    args: argparse.Namespace,
+    pool: FetchPool,
+    optimizer: ImageOptimizer | None,
+    report: OutputReport,
+    careers: list[Career],
+) -> DocImport:
+    """
+    Import the matching Doc of every career whose page exists (as staged in
+    `report`) into that page, staging the pages in `report`. doc-media.js,
+    the site data and the commit are left to the caller.
+    """
+    with metrics().stage("folder"):
+        title_to_id = list_drive_folder(args.folder_url, pool)
+    doc_id_for_career, unmatched = match_docs(careers, title_to_id)
+
+    result = DocImport(
+        found=len(title_to_id),
+        matched=0,
+        unmatched=unmatched,
+        media={},
+        manifest={},
+        store=ImageStore(),
+        images_before=OutputReport.snapshot(ASSETS_DIR),
+    )
+    manifest = {} if args.force else load_import_manifest()
+    store = result.store
+    fetch_doc = EXPORT_FETCHERS[args.export]
+    options = import_options(optimizer, slim=not args.no_slim)
+
+    # Queue every export up front; the pool caps how many hit Docs at once.
+    # Pages are then processed in career order as their exports arrive, and
+    # each page's image downloads overlap with the remaining exports.
+    jobs: list[tuple[Career, str, dict | None, Future]] = []
     for c in careers:
         doc_id = doc_id_for_career.get(c.title)
         if not doc_id:
             continue
-        matched += 1
+        result.matched += 1
 
-        page_path = CAREERS_DIR / f"{c.slug}.html"
-        if not page_path.exists():
+        if not report.exists(CAREERS_DIR / f"{c.slug}.html"):
             continue
 
-        exported = export_doc_html(doc_id)
-        cleaned, hero_src = clean_google_doc_html(exported, slug=c.slug)
-        if not cleaned:
-            continue
-
-        section_map = split_doc_into_sections(cleaned)
-        panels_html = build_doc_panels_html(section_map)
-
-        existing = page_path.read_text(encoding="utf-8")
-        # Prefer injecting into the dedicated container if present
-        soup = BeautifulSoup(existing, "html.parser")
-        doc_sections = soup.find(id="docSections")
-        if doc_sections is not None:
-            doc_sections.clear()
-            if panels_html:
-                doc_sections.append(BeautifulSoup(panels_html, "html.parser"))
-            else:
-                # fallback to a single panel
-                new_html_str = inject_into_career_page(existing, c.title, cleaned)
-                soup = BeautifulSoup(new_html_str, "html.parser")
-        else:
-            # fallback to old behavior
-            new_html_str = inject_into_career_page(existing, c.title, cleaned)
-            soup = BeautifulSoup(new_html_str, "html.parser")
-
-        new_html = str(soup)
-        page_path.write_text(new_html, encoding="utf-8")
-        updated += 1
-        if hero_src:
-            media[c.slug] = {"heroImageSrc": hero_src, "docId": doc_id, "title": c.title}
+        prev = manifest.get(doc_id)
+        if prev and prev.get("slug") != c.slug:
+            prev = None
+        url = export_doc_url(doc_id, args.docs_url, args.export)
+        jobs.append((c, doc_id, prev, pool.submit(url, fetch_doc, url, _conditional_headers(prev), store)))
+
+    for c, doc_id, prev, export_future in jobs:
+        with metrics().career(c.slug):
+            page_path = CAREERS_DIR / f"{c.slug}.html"
+            with metrics().stage("export.wait"):
+                resp = export_future.result()
+            existing = report.read_text(page_path)
+            if _is_unchanged(prev, resp, existing, options):
+                metrics().count("docs.unchanged")
+                result.unchanged.append(page_path)
+                write_cached_panels(c.slug, doc_sections_inner_html(existing) or "")
+                result.manifest[doc_id] = {
+                    **prev,
+                    "etag": resp.etag or prev.get("etag"),
+                    "lastModified": resp.last_modified or prev.get("lastModified"),
+                }
+                if prev.get("hero"):
+                    hero = sized_hero(prev["hero"])
+                    result.manifest[doc_id]["hero"] = hero
+                    result.media[c.slug] = _media_entry(hero, doc_id, c.title)
+                continue
+            if resp.status == 304:
+                # The Doc is unchanged but the page lost its panels or was imported
+                # with other options; fetch the body.
+                resp = fetch_doc(export_doc_url(doc_id, args.docs_url, args.export), None, store)
 
-    # Report docs that didn't match any career title (usually naming mismatch)
-    career_titles = {c.title for c in careers}
-    for t in sorted(title_to_id.keys()):
-        mapped = explicit_aliases.get(t, t)
-        if mapped not in career_titles and norm(mapped) not in career_by_norm:
-            unmatched_docs.append(t)
-
-    print(f"Docs found in Drive folder: {len(title_to_id)}")
-    print(f"Careers matched by title: {matched}")
-    print(f"Career pages updated: {updated}")
-    if unmatched_docs:
+            new_html, hero, saved = render_career_page(
+                existing, resp.text(), slug=c.slug, store=store, pool=pool, optimizer=optimizer, slim=not args.no_slim
+            )
+            if new_html is None:
+                continue
+            if saved:
+                result.slimmed[c.slug] = saved
+
+            with metrics().stage("write"):
+                status = report.write_text(page_path, new_html)
+            (result.unchanged if status == "unchanged" else result.updated).append(page_path)
+            if hero:
+                result.media[c.slug] = _media_entry(hero, doc_id, c.title)
+            written_panels = doc_sections_inner_html(new_html)
+            if written_panels is not None:
+                write_cached_panels(c.slug, written_panels)
+            result.manifest[doc_id] = {
+                "slug": c.slug,
+                "title": c.title,
+                "etag": resp.etag,
+                "lastModified": resp.last_modified,
+                "exportSha256": resp.digest(),
+                "panelsSha256": _sha256(written_panels) if written_panels is not None else None,
+                "options": options,
+                "hero": hero,
+            }
+    return result
+
+
+def finish_import(result: DocImport, *, gc: bool = True) -> list[Path]:
+    """
+    After the pages are committed: save the import manifest and the image
+    store's, and (with `gc`) delete images no page or doc-media.js references.
+    Returns the removed image files.
+    """
+    # The manifest and GC only describe what is live, so they follow the commit.
+    save_import_manifest(result.manifest)
+    metrics().count("images.store_hits", result.store.hits)
+    metrics().count("images.downloaded", result.store.downloads)
+    removed: list[Path] = []
+    if gc:
+        with metrics().stage("gc"):
+            removed = result.store.collect_garbage(sorted(CAREERS_DIR.glob("*.html")) + [DOC_MEDIA_JS])
+    result.store.save_manifest()
+    return removed
+
+
+def _run_import(args: argparse.Namespace, pool: FetchPool, optimizer: ImageOptimizer | None) -> int:
+    report = OutputReport()
+    result = import_docs(args, pool, optimizer, report, parse_careers_data())
+
+    print(f"Docs found in Drive folder: {result.found}")
+    print(f"Careers matched by title: {result.matched}")
+    print(f"Career pages updated: {len(result.updated)}")
+    print(f"Career pages unchanged: {len(result.unchanged)}")
+    if result.slimmed:
+        print(f"Doc markup slimmed by {sum(result.slimmed.values()):,} bytes:")
+        for slug, saved in result.slimmed.items():
+            print(f" - {slug}: {saved:,}")
+    if result.unmatched:
         print("Docs with no matching career title:")
-        for t in unmatched_docs:
+        for t in result.unmatched:
             print(f" - {t}")
 
     # Write doc-media.js for landing-page cards
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-    DOC_MEDIA_JS.write_text(
-        "window.SHT_DOC_MEDIA = " + json.dumps(media, indent=2) + ";\n",
-        encoding="utf-8",
-    )
-    print(f"Wrote doc media map: {DOC_MEDIA_JS} ({len(media)} careers)")
+    report.write_text(DOC_MEDIA_JS, render_doc_media(result.media))
+    print(f"Wrote doc media map: {DOC_MEDIA_JS} ({len(result.media)} careers)")
+    with metrics().stage("site_data"):
+        write_site_data(report, read_window_json(DATA_JS, "SHT_CAREERS"), result.media)
+    # Pages, doc-media.js and site data go live together.
+    with metrics().stage("commit"):
+        report.commit()
+
+    removed = finish_import(result, gc=not args.no_gc)
+    print(f"Images reused from store: {result.store.hits}; downloaded: {result.store.downloads}")
+    if removed:
+        print(f"Removed {len(removed)} unreferenced image files")
+    report.record_dir_changes(result.images_before, ASSETS_DIR)
+    print(f"Output files: {report.summary()}")
+    if args.changes:
+        report.write_changes(args.changes)
     return 0
 
 
@@ -0,0 +1,297 @@
+"""
+Per-page data files for the site, written by both build tools.
+
+careers-data.js and doc-media.js hold everything about every career, and used
+to be loaded by every page. Pages now load only what they render:
+
+- careers-index.js: window.SHT_CAREERS_INDEX, one compact entry per career
+  (slug, title, category, description, thumb) for the landing page and QR sheet
+- data/careers/<slug>.js: window.SHT_CAREER, that career's full record plus its
+  doc media, loaded by careers/<slug>.html only
+
+They are plain scripts (not JSON fetched at runtime) so the site keeps working
+when opened from file://. The landing-page card grid and the QR sheet are also
+pre-rendered into index.html and qr-sheet.html (same markup script.js used to
+build at runtime), so both pages paint without waiting on JavaScript; script.js
+only wires the QR images, links and filters.
+
+search-index.js (window.SHT_SEARCH) is a sorted term list with postings per
+term, built from each career's title, description, category and Doc panel
+text; the landing-page filter loads it on first use and prefix-matches query
+words with a binary search.
+
+careers-data.js and doc-media.js are still written as the tools' source data.
+sync_from_xlsx.py calls write_site_data() with the
+new careers and the current doc-media.js; import_drive_docs.py calls it with
+careers-data.js and the media it just built, so whichever ran last, the
+shards reflect both.
+"""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import quote
+import json
+import re
+import unicodedata
+
+from site_output import OutputReport, current_doc_panels, parse_window_json, read_window_json, replace_div_inner
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CAREERS_INDEX_JS = ROOT / "careers-index.js"
+SHARDS_DIR = ROOT / "data" / "careers"
+DOC_MEDIA_JS = ROOT / "doc-media.js"
+INDEX_HTML = ROOT / "index.html"
+QR_SHEET_HTML = ROOT / "qr-sheet.html"
+QR_MANIFEST_JS = ROOT / "assets" / "qr" / "qr-codes.js"
+SEARCH_INDEX_JS = ROOT / "search-index.js"
+
+# Too common in the Docs to narrow a search; queries still prefix-match titles.
+# Must match SEARCH_STOPWORDS in script.js, which drops them from queries.
+STOPWORDS = frozenset(
+    "an and are as at be by can do for from has have how in is it its of on or that the this to you your with".split()
+)
+
+
+def read_doc_media(path: Path = DOC_MEDIA_JS) -> dict[str, dict]:
+    try:
+        data = read_window_json(path, "SHT_DOC_MEDIA")
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def render_doc_media(media: dict[str, dict]) -> str:
+    # hero* fields sorted, then docId/title: byte-stable across fresh and skipped imports.
+    entries = {
+        slug: {**{k: e[k] for k in sorted(e) if k.startswith("hero")}, **{k: v for k, v in e.items() if not k.startswith("hero")}}
+        for slug, e in media.items()
+    }
+    return "window.SHT_DOC_MEDIA = " + json.dumps(entries, indent=2) + ";\n"
+
+
+def index_entry(career: dict, media: dict | None) -> dict:
+    entry = {
+        "slug": career["slug"],
+        "title": career["title"],
+        "category": career.get("category") or "technology",
+        "description": career.get("description") or "",
+    }
+    thumb = (media or {}).get("heroImageSrc")
+    if thumb:
+        entry["thumb"] = thumb
+    else:
+        # Only needed for the placeholder photo when the Doc has no image.
+        entry["imageQuery"] = career.get("imageQuery") or ""
+    return entry
+
+
+def render_index(careers: list[dict], media: dict[str, dict]) -> str:
+    entries = [index_entry(c, media.get(c["slug"])) for c in careers]
+    # One entry per line: small, and diffs stay readable.
+    body = ",\n".join("  " + json.dumps(e, ensure_ascii=False, separators=(",", ":")) for e in entries)
+    return "window.SHT_CAREERS_INDEX = [\n" + body + "\n];\n"
+
+
+def render_shard(career: dict, media: dict | None) -> str:
+    record = dict(career)
+    if media:
+        record["media"] = {k: v for k, v in sorted(media.items()) if k.startswith("hero")}
+    return "window.SHT_CAREER = " + json.dumps(record, indent=2, ensure_ascii=False) + ";\n"
+
+
+def write_site_data(
+    report: OutputReport, careers: list[dict], media: dict[str, dict], shards: set[str] | None = None
+) -> None:
+    """
+    Write careers-index.js and one shard per career (removing shards of careers
+    that are gone), and pre-render index.html / qr-sheet.html. `shards` limits
+    the shards written to those careers, when the caller knows the rest are
+    current (sync_from_xlsx.py --watch).
+    """
+    report.write_text(CAREERS_INDEX_JS, render_index(careers, media))
+    slugs = set()
+    for c in careers:
+        slugs.add(c["slug"])
+        if shards is None or c["slug"] in shards:
+            report.write_text(SHARDS_DIR / f"{c['slug']}.js", render_shard(c, media.get(c["slug"])))
+    for f in sorted(SHARDS_DIR.glob("*.js")):
+        if f.stem not in slugs:
+            report.remove(f)
+    prerender_pages(report, careers, media)
+    report.write_text(SEARCH_INDEX_JS, render_search_index(careers, report))
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def html_text(markup: str) -> str:
+    parser = _TextExtractor()
+    parser.feed(markup)
+    parser.close()
+    return " ".join(parser.parts)
+
+
+def search_tokens(text: str) -> list[str]:
+    """Lowercase ASCII words; must match searchTokens() in script.js."""
+    text = "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def render_search_index(careers: list[dict], report: OutputReport | None = None) -> str:
+    postings: dict[str, set[int]] = {}
+    for i, c in enumerate(careers):
+        # The panels are what import_drive_docs.py's split_doc_into_sections() produced.
+        text = " ".join(
+            [c["title"], c.get("description") or "", c.get("category") or "", html_text(current_doc_panels(c["slug"], report))]
+        )
+        for t in set(search_tokens(text)):
+            if len(t) > 1 and t not in STOPWORDS:
+                postings.setdefault(t, set()).add(i)
+    terms = sorted(postings)
+    payload = {
+        "slugs": [c["slug"] for c in careers],
+        "terms": terms,
+        "postings": [sorted(postings[t]) for t in terms],
+    }
+    return "window.SHT_SEARCH = " + json.dumps(payload, separators=(",", ":")) + ";\n"
+
+
+def choose_article(title: str) -> str:
+    t = (title or "").strip()
+    if not t:
+        return "a"
+    first = (re.match(r"^[A-Za-z0-9]+", t) or [""])[0]
+    upper = first.upper()
+    if upper in {"UX", "UI", "EU"}:
+        return "a"
+    vowel_sound_letters = set("AEFHILMNORSX")
+    is_acronym = bool(re.match(r"^[A-Z0-9]{2,4}$", first))
+    if is_acronym:
+        return "an" if upper[:1] in vowel_sound_letters else "a"
+    return "an" if re.match(r"^[AEIOU]", first, re.I) else "a"
+
+
+def escape_html(s: str) -> str:
+    """Same output as escapeHtml() in script.js."""
+    return (
+        str(s)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#039;")
+    )
+
+
+def _title_sort_key(title: str) -> list:
+    # Approximates localeCompare(..., {numeric: true, sensitivity: "base"}).
+    return [(0, int(p), "") if p.isdigit() else (1, 0, p) for p in re.split(r"(\d+)", title.casefold()) if p]
+
+
+def _placeholder_photo(query: str) -> str:
+    q = (query or "").strip()
+    return "https://source.unsplash.com/1200x800/?" + (quote(q, safe=",/?:@&=+$#;-_.!~*'()") if q else "woman,stem")
+
+
+def _qr_files(report: OutputReport) -> dict[str, str]:
+    try:
+        manifest = parse_window_json(report.read_text(QR_MANIFEST_JS), "SHT_QR")
+    except (OSError, ValueError):
+        return {}
+    files = manifest.get("files") if isinstance(manifest, dict) else None
+    return files if isinstance(files, dict) else {}
+
+
+def _qr_src_attr(slug: str, qr_files: dict[str, str]) -> str:
+    # Build-time QR (tools/build_qr_codes.py) shows before/without JavaScript;
+    # script.js swaps in the right code for the active base URL.
+    name = qr_files.get(f"careers/{slug}.html")
+    return f' src="./assets/qr/{escape_html(name)}" data-qr-src="./assets/qr/{escape_html(name)}"' if name else ""
+
+
+def render_card(entry: dict, qr_files: dict[str, str]) -> str:
+    title = entry["title"]
+    slug = entry["slug"]
+    href = f"./careers/{quote(slug, safe='')}.html"
+    qr_path = f"./careers/{slug}.html"
+    desc = (entry.get("description") or "").strip() or f"Learn what a {title} does and explore the pathway to get there."
+    img_src = entry.get("thumb") or _placeholder_photo(entry.get("imageQuery") or "woman,stem")
+    return f"""
+<article class="poster-card" data-career data-slug="{escape_html(slug)}" data-category="{escape_html(entry.get("category") or "technology")}" data-title="{escape_html(title)}">
+  <div class="poster-head">
+    <div class="poster-head-small">Launch Your Future as {choose_article(title)}</div>
+    <h3 class="poster-head-title">{escape_html(title)}</h3>
+  </div>
+
+  <div class="poster-photo">
+    <img class="poster-photo-img" src="{escape_html(img_src)}" alt="{escape_html(f"Photo representing a woman in the {title} career")}" loading="lazy" decoding="async" />
+  </div>
+
+  <p class="poster-desc">{escape_html(desc)}</p>
+
+  <div class="poster-bottom">
+    <div class="poster-qr">
+      <img alt="QR code for {escape_html(title)} pathway" width="180" height="180" data-qr data-path="{escape_html(qr_path)}"{_qr_src_attr(slug, qr_files)} />
+    </div>
+    <div class="poster-scan">
+      <div class="poster-actions">
+        <a class="poster-open" href="{href}">Open pathway</a>
+        <button class="poster-copy" type="button" data-copy-link data-path="{escape_html(qr_path)}">Copy link</button>
+      </div>
+    </div>
+    <img class="poster-logo" src="./assets/shetech_logo_fuchsia.png" alt="SheTech" loading="lazy" />
+  </div>
+</article>"""
+
+
+def render_qr_sheet_item(entry: dict, qr_files: dict[str, str]) -> str:
+    title = entry["title"]
+    slug = entry["slug"]
+    return f"""
+<div class="qr-sheet-item">
+  <div class="qr-sheet-title">{escape_html(title)}</div>
+  <img class="qr-sheet-qr" alt="QR code for {escape_html(title)} pathway" width="220" height="220" data-qr data-path="./careers/{escape_html(slug)}.html"{_qr_src_attr(slug, qr_files)} />
+  <a class="qr-sheet-open no-print" href="./careers/{quote(slug, safe='')}.html">Open</a>
+</div>"""
+
+
+def _prerender(report: OutputReport, path: Path, element_id: str, attr: str, items: list[str]) -> None:
+    try:
+        page = report.read_text(path)
+    except FileNotFoundError:
+        return
+    inner = "\n".join(items) + "\n          " if items else "\n          "
+    spliced = replace_div_inner(page, element_id, inner)
+    if spliced is None:
+        return
+    # "prerendered" tells script.js not to rebuild the grid at runtime.
+    spliced = spliced.replace(f'{attr}="true"', f'{attr}="prerendered"', 1)
+    report.write_text(path, spliced)
+
+
+def prerender_pages(report: OutputReport, careers: list[dict], media: dict[str, dict]) -> None:
+    """Render the landing-page card grid and the QR sheet into their HTML files."""
+    entries = [index_entry(c, media.get(c["slug"])) for c in careers]
+    qr_files = _qr_files(report)
+    cards = sorted(entries, key=lambda e: _title_sort_key(e["title"]))
+    _prerender(report, INDEX_HTML, "careerGrid", "data-render-careers", [render_card(e, qr_files) for e in cards])
+    _prerender(report, QR_SHEET_HTML, "qrSheetGrid", "data-render-qr-sheet", [render_qr_sheet_item(e, qr_files) for e in entries])
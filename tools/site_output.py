@@ -0,0 +1,395 @@
+"""
+Shared output helpers for the site build tools.
+
+OutputReport writes generated files only when their bytes change, so
+unchanged pages keep their mtimes (and CDN/browser caches), and records what
+happened to each file. The deploy step can read the --changes JSON to upload
+just the diff.
+
+Writes and removals are staged, not applied: new content goes to files under
+.build-cache/staging/<run>/, and the live site only changes in commit(), which
+fsyncs them, writes (and fsyncs) a journal listing every rename and deletion,
+then applies it. The journal names files relative to the repo root, so it can
+still be replayed after the checkout is moved or mounted elsewhere. A run that fails or is killed before commit() leaves the site
+exactly as it was; one killed during commit() is rolled forward from its
+journal by the next run. Each file is swapped in with os.replace(), so a web
+server reading the tree never sees a partially written file. Code that reads
+back what the same run wrote (prerendering, the search index) goes through
+report.read_text() to see the staged content.
+
+Tools hold output_lock() for the whole run, so two builds never interleave
+their writes; it also recovers interrupted commits before anything is read.
+
+The docSections helpers let both tools hand the Google Doc panels to each
+other: import_drive_docs.py fills <div id="docSections"> (and caches the
+panels under .build-cache/panels/), sync_from_xlsx.py carries them forward
+when it regenerates a page from the spreadsheet.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: runs are not serialised, staging still applies
+    fcntl = None
+
+# The BeautifulSoup parser every tool uses: lxml when it is installed (several
+# times faster), else the standard library's. Tools share it so they all read
+# and serialize pages the same way.
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CAREERS_DIR = ROOT / "careers"
+PANELS_CACHE_DIR = ROOT / ".build-cache" / "panels"
+STAGING_DIR = ROOT / ".build-cache" / "staging"
+OUTPUT_LOCK = ROOT / ".build-cache" / "output.lock"
+JOURNAL = "journal.json"
+
+_DIV_TAG = re.compile(r"<(/?)div\b[^>]*>", re.IGNORECASE)
+
+
+def read_window_json(path: Path, name: str):
+    """Parse a generated `window.<name> = <json>;` script (careers-data.js, doc-media.js, ...)."""
+    return parse_window_json(path.read_text(encoding="utf-8"), name)
+
+
+def parse_window_json(script: str, name: str):
+    raw = script.lstrip("\ufeff \t\r\n")
+    raw = re.sub(rf"^window\.{re.escape(name)}\s*=\s*", "", raw).strip()
+    if raw.endswith(";"):
+        raw = raw[:-1]
+    return json.loads(raw)
+
+
+def _element_open(element_id: str) -> re.Pattern[str]:
+    return re.compile(rf'<div\b[^>]*\bid="{re.escape(element_id)}"[^>]*>', re.IGNORECASE)
+
+
+def _div_inner_span(page_html: str, element_id: str) -> tuple[int, int] | None:
+    m = _element_open(element_id).search(page_html)
+    if m is None:
+        return None
+    depth = 1
+    for t in _DIV_TAG.finditer(page_html, m.end()):
+        depth += -1 if t.group(1) else 1
+        if depth == 0:
+            return (m.end(), t.start())
+    return None
+
+
+def div_inner_html(page_html: str, element_id: str) -> str | None:
+    """Raw inner HTML of <div id="element_id"> without parsing the page; None if absent."""
+    span = _div_inner_span(page_html, element_id)
+    return page_html[span[0] : span[1]] if span else None
+
+
+def replace_div_inner(page_html: str, element_id: str, inner_html: str) -> str | None:
+    """Splice new inner HTML into <div id="element_id">; None if the page has no such div."""
+    span = _div_inner_span(page_html, element_id)
+    if span is None:
+        return None
+    return page_html[: span[0]] + inner_html + page_html[span[1] :]
+
+
+def doc_sections_inner_html(page_html: str) -> str | None:
+    """
+    Return the raw inner HTML of <div id="docSections"> without parsing the page,
+    or None if the page has no such container.
+    """
+    return div_inner_html(page_html, "docSections")
+
+
+def replace_doc_sections_inner(page_html: str, inner_html: str) -> str | None:
+    """Splice new inner HTML into <div id="docSections">; None if the page has no container."""
+    return replace_div_inner(page_html, "docSections", inner_html)
+
+
+def read_cached_panels(slug: str) -> str | None:
+    try:
+        return (PANELS_CACHE_DIR / f"{slug}.html").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def write_cached_panels(slug: str, inner_html: str) -> None:
+    path = PANELS_CACHE_DIR / f"{slug}.html"
+    if read_cached_panels(slug) != inner_html:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(inner_html, encoding="utf-8")
+
+
+def current_doc_panels(slug: str, report: OutputReport | None = None) -> str:
+    """
+    Imported Doc panels for a career: from its current page (as staged in
+    `report`, if given), else the importer's cache.
+    """
+    path = CAREERS_DIR / f"{slug}.html"
+    try:
+        page = report.read_text(path) if report is not None else path.read_text(encoding="utf-8")
+        inner = doc_sections_inner_html(page)
+    except FileNotFoundError:
+        inner = None
+    if inner is None:
+        inner = read_cached_panels(slug)
+    return inner or ""
+
+
+def _fsync_file(path: Path) -> None:
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_dir(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # not supported on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _journal_path(path: Path, root: Path) -> str:
+    """How the journal names a live file: relative to `root` when it is inside it."""
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _apply_journal(run_dir: Path, root: Path = ROOT) -> None:
+    """Apply (or finish applying) a committed run; safe to repeat after a crash."""
+    journal = json.loads((run_dir / JOURNAL).read_text(encoding="utf-8"))
+    dirs: set[str] = set()
+    for name, entry in journal["writes"].items():
+        target = os.path.join(root, entry)  # an absolute entry stays as it is
+        parent = os.path.dirname(target)
+        if parent not in dirs:
+            os.makedirs(parent, exist_ok=True)
+            dirs.add(parent)
+        try:
+            os.replace(os.path.join(run_dir, name), target)
+        except FileNotFoundError:  # renamed before the crash
+            pass
+    for entry in journal["removes"]:
+        target = os.path.join(root, entry)
+        Path(target).unlink(missing_ok=True)
+        dirs.add(os.path.dirname(target))
+    for d in dirs:
+        _fsync_dir(Path(d))
+    (run_dir / JOURNAL).unlink()
+    shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def recover_staged(staging_dir: Path = STAGING_DIR, root: Path = ROOT) -> int:
+    """
+    Roll forward runs that crashed during commit() and discard the staging of
+    runs that never got there. Returns how many runs were rolled forward.
+    """
+    recovered = 0
+    for run_dir in sorted(staging_dir.iterdir()) if staging_dir.is_dir() else []:
+        if (run_dir / JOURNAL).is_file():
+            _apply_journal(run_dir, root)
+            recovered += 1
+        else:
+            shutil.rmtree(run_dir, ignore_errors=True)
+    return recovered
+
+
+@contextmanager
+def output_lock(path: Path = OUTPUT_LOCK) -> Iterator[None]:
+    """Hold the site-output lock for a build run, after recovering interrupted commits."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            if recover_staged():
+                print("Finished applying an interrupted build's output.")
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+@dataclass
+class OutputReport:
+    created: list[Path] = field(default_factory=list)
+    updated: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+    staging_dir: Path = STAGING_DIR
+    root: Path = ROOT
+    _run_dir: Path | None = field(default=None, repr=False)
+    _staged: dict[Path, Path] = field(default_factory=dict, repr=False)
+    _removals: set[Path] = field(default_factory=set, repr=False)
+    _seen: set[Path] = field(default_factory=set, repr=False)
+    # Numbers every staged file, so a path rewritten in this run never reuses another path's staged name.
+    _writes: int = field(default=0, repr=False)
+    # Independent build steps may stage into one report from several threads (tools/build.py).
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def write_text(self, path: Path, text: str) -> str:
+        """Stage `text` unless the file already holds exactly these bytes. Returns the status."""
+        return self.write_bytes(path, text.encode("utf-8"))
+
+    def write_bytes(self, path: Path, data: bytes) -> str:
+        with self._lock:
+            return self._write_bytes(path, data)
+
+    def _write_bytes(self, path: Path, data: bytes) -> str:
+        self._forget(path)
+        try:
+            current = path.read_bytes()
+        except FileNotFoundError:
+            current = None
+        if current == data:
+            self.unchanged.append(path)
+            return "unchanged"
+        self._writes += 1
+        staged = self._stage_dir() / f"{self._writes:06d}-{path.name}"
+        staged.write_bytes(data)  # fsync'd in commit(), all at once
+        self._staged[path] = staged
+        if current is None:
+            self.created.append(path)
+            return "created"
+        self.updated.append(path)
+        return "updated"
+
+    def _stage_dir(self) -> Path:
+        if self._run_dir is None:
+            self.staging_dir.mkdir(parents=True, exist_ok=True)
+            self._run_dir = Path(tempfile.mkdtemp(dir=self.staging_dir, prefix="run-"))
+        return self._run_dir
+
+    def _forget(self, path: Path) -> None:
+        """Drop an earlier write/removal of `path` in this run; the new one replaces it."""
+        if path not in self._seen:
+            self._seen.add(path)
+            return
+        staged = self._staged.pop(path, None)
+        if staged is not None:
+            staged.unlink()
+        self._removals.discard(path)
+        for paths in (self.created, self.updated, self.unchanged, self.removed):
+            if path in paths:
+                paths.remove(path)
+
+    def exists(self, path: Path) -> bool:
+        """Whether the file exists as this run will leave it."""
+        return path not in self._removals and (path in self._staged or path.exists())
+
+    def read_bytes(self, path: Path) -> bytes:
+        """The file as this run will leave it (staged content, else the live file)."""
+        if path in self._removals:
+            raise FileNotFoundError(path)
+        return (self._staged.get(path) or path).read_bytes()
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def commit(self) -> None:
+        """Apply every staged write and removal to the live tree (see module docstring)."""
+        if self._run_dir is None and not self._removals:
+            return
+        run_dir = self._stage_dir()
+        # Staged files must be durable before the journal that renames them is.
+        for staged in self._staged.values():
+            _fsync_file(staged)
+        journal = {
+            "writes": {staged.name: _journal_path(path, self.root) for path, staged in self._staged.items()},
+            "removes": sorted(_journal_path(p, self.root) for p in self._removals),
+        }
+        with open(run_dir / JOURNAL, "w", encoding="utf-8") as f:
+            json.dump(journal, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        # The staged files' and the journal's directory entries, and the run directory's own.
+        _fsync_dir(run_dir)
+        _fsync_dir(self.staging_dir)
+        _apply_journal(run_dir, self.root)
+        self._run_dir = None
+        self._staged.clear()
+        self._removals.clear()
+
+    def discard(self) -> None:
+        """Throw away everything staged; the live tree is left untouched."""
+        if self._run_dir is not None:
+            shutil.rmtree(self._run_dir, ignore_errors=True)
+        self._run_dir = None
+        self._staged.clear()
+        self._removals.clear()
+
+    @staticmethod
+    def snapshot(directory: Path) -> dict[Path, tuple[int, int]]:
+        """(size, mtime_ns) for every file under `directory`, for record_dir_changes()."""
+        if not directory.is_dir():
+            return {}
+        return {p: (st.st_size, st.st_mtime_ns) for p in directory.rglob("*") if p.is_file() for st in [p.stat()]}
+
+    def record_dir_changes(self, before: dict[Path, tuple[int, int]], directory: Path) -> None:
+        """Record files other code created/changed/deleted under `directory` since `before`."""
+        after = self.snapshot(directory)
+        for p, sig in sorted(after.items()):
+            if p not in before:
+                self.created.append(p)
+            elif before[p] != sig:
+                self.updated.append(p)
+        self.removed.extend(p for p in sorted(before) if p not in after)
+
+    def remove(self, path: Path) -> None:
+        with self._lock:
+            self._forget(path)
+            self._removals.add(path)
+            self.removed.append(path)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.updated or self.removed)
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.created)} created, {len(self.updated)} updated, "
+            f"{len(self.unchanged)} unchanged, {len(self.removed)} removed"
+        )
+
+    def to_dict(self) -> dict[str, list[str]]:
+        def rel(paths: list[Path]) -> list[str]:
+            out = []
+            for p in paths:
+                try:
+                    out.append(p.resolve().relative_to(ROOT).as_posix())
+                except ValueError:
+                    out.append(p.as_posix())
+            return sorted(out)
+
+        return {
+            "created": rel(self.created),
+            "updated": rel(self.updated),
+            "unchanged": rel(self.unchanged),
+            "removed": rel(self.removed),
+        }
+
+    def write_changes(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,265 @@
+"""
+Slimming pass for imported Google Doc markup.
+
+clean_google_doc() strips Google's attributes but leaves the structure they
+hung off: every run of text still sits in its own (now bare) <span>, spacer
+paragraphs and padding cells survive, and whitespace comes through as
+exported. slim_doc() normalizes a cleaned tree in place:
+
+- unwraps attribute-less <span>s (all of them, after cleaning)
+- merges the adjacent text runs that leaves behind
+- collapses whitespace runs to one space (not inside <pre>/<textarea>) and
+  drops whitespace-only text between blocks
+- drops empty paragraphs, table rows whose cells are all empty, columns that
+  are empty in every row, and tables left with no rows
+
+Each step only removes markup the browser renders as nothing, and only where
+that cannot join text from either side. visible_text() gives the text a page
+shows, line by line; slim_checked() compares it before and after and raises
+SlimError if slimming changed it, so a bug here fails the build instead of
+altering a page.
+
+import_drive_docs.py runs this on every Doc it imports (--no-slim to skip).
+Slim the Doc panels already in careers/*.html (and refresh search-index.js,
+which is built from their text):
+  python tools/slim_html.py [--check]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import re
+import sys
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from site_data import ROOT, SEARCH_INDEX_JS, render_search_index
+from site_output import (
+    CAREERS_DIR,
+    HTML_PARSER,
+    OutputReport,
+    doc_sections_inner_html,
+    output_lock,
+    read_window_json,
+    replace_doc_sections_inner,
+)
+
+
+CAREERS_DATA_JS = ROOT / "careers-data.js"
+
+BLOCK_TAGS = frozenset(
+    "address article aside blockquote caption dd details div dl dt fieldset figcaption figure footer form "
+    "h1 h2 h3 h4 h5 h6 header hr li main nav ol p pre section table tbody td tfoot th thead tr ul".split()
+)
+PRESERVE_WHITESPACE = frozenset({"pre", "textarea"})
+# Elements that make a paragraph or cell non-empty even without text.
+MEDIA_TAGS = ["img", "picture", "svg", "iframe", "video", "audio", "object", "embed", "input", "hr", "br"]
+_SPAN_MARKUP = len("<span></span>")
+_WHITESPACE = re.compile(r"[ \t\n\r\f]+")
+
+
+class SlimError(Exception):
+    pass
+
+
+def _is_block(node) -> bool:
+    return isinstance(node, Tag) and node.name in BLOCK_TAGS
+
+
+def _is_text(node) -> bool:
+    # Comments, CDATA and doctypes are NavigableString subclasses; leave them alone.
+    return type(node) is NavigableString
+
+
+def _is_empty(el: Tag) -> bool:
+    return not el.get_text(strip=True) and el.find(MEDIA_TAGS) is None
+
+
+def _sibling(node, forward: bool):
+    """The nearest sibling that is not whitespace-only text."""
+    sib = node.next_sibling if forward else node.previous_sibling
+    while sib is not None and _is_text(sib) and not sib.strip(" \t\n\r\f"):
+        sib = sib.next_sibling if forward else sib.previous_sibling
+    return sib
+
+
+def _between_blocks(node) -> bool:
+    """True if removing `node` cannot join text: block or parent edge on both sides."""
+    for forward in (False, True):
+        sib = _sibling(node, forward)
+        if sib is None:
+            if not _is_block(node.parent) and node.parent.name not in ("body", "[document]"):
+                return False
+        elif not _is_block(sib):
+            return False
+    return True
+
+
+def _size(node) -> int:
+    return len(str(node).encode("utf-8"))
+
+
+def _unwrap_spans(root: Tag) -> int:
+    saved = 0
+    for span in root.find_all("span"):
+        if not span.attrs:
+            span.unwrap()
+            saved += _SPAN_MARKUP
+    return saved
+
+
+def _collapse_whitespace(root: Tag) -> int:
+    saved = 0
+    for text in list(root.find_all(string=True)):
+        if not _is_text(text) or any(p.name in PRESERVE_WHITESPACE for p in text.parents):
+            continue
+        if not text.strip(" \t\n\r\f") and _between_blocks(text):
+            saved += len(text)
+            text.extract()
+            continue
+        slim = _WHITESPACE.sub(" ", text)
+        if slim != text:
+            saved += len(text) - len(slim)
+            text.replace_with(slim)
+    return saved
+
+
+def _drop_empty_paragraphs(root: Tag) -> int:
+    saved = 0
+    for p in root.find_all("p"):
+        if _is_empty(p) and _between_blocks(p):
+            saved += _size(p)
+            p.decompose()
+    return saved
+
+
+def _slim_table(table: Tag) -> int:
+    saved = 0
+    rows = [tr for tr in table.find_all("tr") if tr.find_parent("table") is table]
+    grid = []
+    for tr in rows:
+        cells = tr.find_all(["td", "th"], recursive=False)
+        if all(_is_empty(c) for c in cells):
+            saved += _size(tr)
+            tr.decompose()
+        else:
+            grid.append(cells)
+    if not grid:
+        saved += _size(table)
+        table.decompose()
+        return saved
+    # Columns only line up when every row has the same cell count (colspan is stripped by cleaning).
+    width = len(grid[0])
+    if all(len(cells) == width for cells in grid):
+        for col in reversed(range(width)):
+            if all(_is_empty(cells[col]) for cells in grid) and width > 1:
+                for cells in grid:
+                    saved += _size(cells[col])
+                    cells[col].decompose()
+                width -= 1
+    for section in table.find_all(["thead", "tbody", "tfoot"], recursive=False):
+        if section.find("tr") is None:
+            saved += _size(section)
+            section.decompose()
+    return saved
+
+
+def slim_doc(root: Tag) -> int:
+    """Slim a cleaned Doc tree in place; returns the bytes of markup removed."""
+    saved = _unwrap_spans(root)
+    root.smooth()
+    saved += _collapse_whitespace(root)
+    saved += _drop_empty_paragraphs(root)
+    # Innermost tables first, so an emptied nested table empties its cell.
+    for table in reversed(root.find_all("table")):
+        saved += _slim_table(table)
+    root.smooth()
+    saved += _collapse_whitespace(root)
+    return saved
+
+
+def visible_text(root: Tag) -> str:
+    """The text a browser shows for `root`: one line per block, whitespace collapsed."""
+    parts: list[str] = []
+
+    def walk(node: Tag) -> None:
+        for child in node.children:
+            if isinstance(child, Tag):
+                if child.name in ("script", "style", "template"):
+                    continue
+                block = child.name in BLOCK_TAGS or child.name == "br"
+                if block:
+                    parts.append("\n")
+                walk(child)
+                if block:
+                    parts.append("\n")
+            elif _is_text(child):
+                parts.append(_WHITESPACE.sub(" ", child))
+
+    walk(root)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def slim_checked(root: Tag, label: str = "document") -> int:
+    """slim_doc(), raising SlimError if the visible text changed."""
+    before = visible_text(root)
+    saved = slim_doc(root)
+    if visible_text(root) != before:
+        raise SlimError(f"slimming changed the visible text of {label}")
+    return saved
+
+
+def slim_panels_html(inner_html: str, label: str = "document") -> str:
+    """slim_checked() over the Doc panels of a career page (<div id="docSections"> inner HTML)."""
+    root = BeautifulSoup(f"<div>{inner_html}</div>", HTML_PARSER).div
+    if root is None:
+        return inner_html
+    # Slim each panel on its own so the newlines between panels stay as the importer wrote them.
+    for panel in root.find_all("section", recursive=False):
+        slim_checked(panel, label)
+    return root.decode_contents()
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Slim the imported Doc panels in careers/*.html.")
+    ap.add_argument("--check", action="store_true", help="report what would be saved without writing")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    args = ap.parse_args(argv)
+
+    with output_lock():
+        report = OutputReport()
+        before_total = after_total = 0
+        for path in sorted(CAREERS_DIR.glob("*.html")):
+            page = path.read_text(encoding="utf-8")
+            inner = doc_sections_inner_html(page)
+            if not inner or not inner.strip():
+                continue
+            try:
+                slim = replace_doc_sections_inner(page, slim_panels_html(inner, path.name))
+            except SlimError as e:
+                print(e, file=sys.stderr)
+                return 1
+            before, after = len(page.encode("utf-8")), len(slim.encode("utf-8"))
+            before_total += before
+            after_total += after
+            print(f"{path.relative_to(CAREERS_DIR.parent)}: {before:,} -> {after:,} bytes (-{before - after:,})")
+            if not args.check:
+                report.write_text(path, slim)
+        if not args.check:
+            careers = read_window_json(CAREERS_DATA_JS, "SHT_CAREERS")
+            report.write_text(SEARCH_INDEX_JS, render_search_index(careers, report))
+            report.commit()
+
+    saved = before_total - after_total
+    print(f"Doc panels slimmed by {saved:,} bytes ({saved / max(before_total, 1):.0%} of those pages)")
+    if not args.check:
+        print(f"Output files: {report.summary()}")
+        if args.changes:
+            report.write_changes(args.changes)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
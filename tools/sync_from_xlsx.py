@@ -1,25 +1,56 @@
 """
-Sync site data/pages from SheTech_Career_Map.xlsx.
-
-- Reads the Excel sheet into a list of careers
-- Writes careers-data.js (used by landing page)
-- Generates/updates careers/*.html for every career in the sheet
+Sync site data/pages from design/SheTech_Career_Map.xlsx.
+
+- Reads the Excel workbook (every sheet with the expected columns) into a list of careers
+- Writes careers-data.js, plus the careers-index.js the landing page and QR
+  sheet load and the data/careers/<slug>.js shard each career page loads
+  (see site_data.py)
+- Generates/updates careers/*.html for every career in the sheet, carrying
+  forward the Google Doc panels import_drive_docs.py put in <div id="docSections">
+  (from the current page, or from .build-cache/panels/ for pages not on disk),
+  so a spreadsheet edit never needs a Drive re-import
 - Removes careers/*.html that are no longer in the sheet
 
+Files are only rewritten when their content changes; the run reports
+created/updated/unchanged/removed counts, and --changes writes the same
+breakdown as JSON for the deploy step. Everything (including removals) is
+staged and swapped in at the end of the run, so a failed run changes nothing
+(see site_output.py).
+
+The workbook is streamed (openpyxl read-only mode, one pass of iter_rows per
+sheet), so memory stays flat as the career map grows to many sheets/rows.
+
+--watch keeps running and polls the workbook's mtime (and doc-media.js, which
+the importer rewrites). After a change it re-reads the rows, compares them with
+the previous read, and re-renders only the pages and data/careers shards of
+careers that were added or changed, and removes those of careers that are gone.
+careers-data.js, careers-index.js, the pre-rendered grids and the search index
+cover every career, so they are regenerated each time, but they are only
+rewritten if their bytes change.
+
 Run:
-  python tools/sync_from_xlsx.py
+  python tools/sync_from_xlsx.py [--xlsx path/to/workbook.xlsx] [--changes changes.json]
+  python tools/sync_from_xlsx.py --watch [--interval 0.5]
 """
 
 from __future__ import annotations
 
 from pathlib import Path
+import argparse
 import json
 import re
+import time
+import zipfile
 from openpyxl import load_workbook
 
+import build_metrics
+from build_metrics import active as metrics
+from site_data import DOC_MEDIA_JS, choose_article, read_doc_media, write_site_data
+from site_output import OutputReport, current_doc_panels, output_lock
+
 
 ROOT = Path(__file__).resolve().parents[1]
-XLSX = ROOT / "SheTech_Career_Map.xlsx"
+XLSX = ROOT / "design" / "SheTech_Career_Map.xlsx"
 CAREERS_DATA_JS = ROOT / "careers-data.js"
 CAREERS_DIR = ROOT / "careers"
 
@@ -79,27 +110,77 @@ def image_query(title: str, img_desc: str) -> str:
     return ",".join([base] + keywords)
 
 
-def choose_article(title: str) -> str:
-    t = (title or "").strip()
-    if not t:
-        return "a"
-    first = (re.match(r"^[A-Za-z0-9]+", t) or [""])[0]
-    upper = first.upper()
-    if upper in {"UX", "UI", "EU"}:
-        return "a"
-    vowel_sound_letters = set("AEFHILMNORSX")
-    is_acronym = bool(re.match(r"^[A-Z0-9]{2,4}$", first))
-    if is_acronym:
-        return "an" if upper[:1] in vowel_sound_letters else "a"
-    return "an" if re.match(r"^[AEIOU]", first, re.I) else "a"
-
-
 def build_pathway_table_lists(items: list[str]) -> str:
     if not items:
         return "<li class=\"muted\">(Add items)</li>"
     return "".join(f"<li>{i}</li>" for i in items)
 
 
+REQUIRED_COLUMNS = ["Poster Title", "Description"]
+
+
+class WorkbookError(Exception):
+    pass
+
+
+def career_from_row(title: str, desc: str) -> dict:
+    slug = slugify(title)
+    return {
+        "title": title,
+        "slug": slug,
+        "category": infer_category(title),
+        "description": desc,
+        "highSchool": [],
+        "college": [],
+        "career": [],
+        "imageDescription": "",
+        "imageQuery": image_query(title, ""),
+        "resources": [],
+    }
+
+
+def read_careers(xlsx: Path) -> list[dict]:
+    """
+    Stream every sheet that has the required header columns and return careers
+    in sheet/row order. A title that appears again (e.g. in another region's
+    sheet) keeps its first row. Raises WorkbookError if no sheet qualifies.
+    """
+    wb = load_workbook(xlsx, read_only=True, data_only=True)
+    try:
+        items: list[dict] = []
+        seen: set[str] = set()
+        usable = 0
+        missing: list[str] = []
+        for ws in wb.worksheets:
+            rows = ws.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                continue
+            col = {str(x).strip(): i for i, x in enumerate(header) if x is not None and str(x).strip()}
+            missing = [c for c in REQUIRED_COLUMNS if c not in col]
+            if missing:
+                continue
+            usable += 1
+            i_title = col["Poster Title"]
+            i_desc = col["Description"]
+            for row in rows:
+                title = row[i_title] if i_title < len(row) else None
+                if not title or not str(title).strip():
+                    continue
+                title = str(title).strip()
+                desc = row[i_desc] if i_desc < len(row) else None
+                c = career_from_row(title, str(desc or "").strip())
+                if c["slug"] in seen:
+                    continue
+                seen.add(c["slug"])
+                items.append(c)
+        if not usable:
+            raise WorkbookError(f"Missing expected columns: {missing or REQUIRED_COLUMNS}")
+        return items
+    finally:
+        wb.close()
+
+
 PAGE_TMPL = """<!doctype html>
 <html lang="en">
   <head>
@@ -142,7 +223,7 @@ PAGE_TMPL = """<!doctype html>
             </div>
 
             <!-- Google Doc-driven panels injected here -->
-            <div id="docSections"></div>
+            <div id="docSections">{doc_sections}</div>
           </div>
 
           <aside class="side-stack">
@@ -177,85 +258,171 @@ PAGE_TMPL = """<!doctype html>
       </div>
     </footer>
 
-    <script src="../careers-data.js"></script>
-    <script src="../doc-media.js"></script>
+    <script src="../data/careers/{slug}.js"></script>
+    <script src="../assets/qr/qr-codes.js"></script>
     <script src="../script.js"></script>
   </body>
 </html>
 """
 
 
-def main() -> int:
-    if not XLSX.exists():
-        print(f"Missing {XLSX}")
+def render_page(c: dict, doc_sections: str = "") -> str:
+    title = c["title"]
+    article = choose_article(title)
+    meta_desc = c["description"] or f"Launch your future as {article} {title}—explore high school courses, college majors, and career roles."
+    return PAGE_TMPL.format(
+        title=title,
+        slug=c["slug"],
+        article=article,
+        desc=c["description"],
+        meta_desc=meta_desc.replace('"', "&quot;"),
+        img_desc=c["imageDescription"] or title,
+        doc_sections=doc_sections,
+    )
+
+
+def render_careers_data(items: list[dict]) -> str:
+    return "window.SHT_CAREERS = " + json.dumps(items, indent=2) + ";\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Sync careers-data.js and career pages from the workbook.")
+    ap.add_argument("--xlsx", type=Path, default=XLSX, help="career map workbook (default: design/SheTech_Career_Map.xlsx)")
+    ap.add_argument("--changes", type=Path, help="write created/updated/unchanged/removed file lists as JSON")
+    ap.add_argument("--metrics-json", type=Path, help="write stage/career timings and counters as JSON")
+    ap.add_argument("--profile", type=Path, help="cProfile the run, dump stats here and print hot spots")
+    ap.add_argument("--watch", action="store_true", help="keep running; re-sync changed careers when the workbook changes")
+    ap.add_argument("--interval", type=float, default=0.5, help="--watch polling interval (seconds)")
+    args = ap.parse_args(argv)
+
+    if args.watch:
+        return _watch(args)
+
+    run = build_metrics.begin("sync_from_xlsx")
+    try:
+        with build_metrics.profiled(args.profile), output_lock():
+            return _run_sync(args)
+    finally:
+        print(run.summary())
+        if args.metrics_json:
+            run.write_json(args.metrics_json)
+
+
+def _run_sync(args: argparse.Namespace) -> int:
+    if not args.xlsx.exists():
+        print(f"Missing {args.xlsx}")
         return 2
 
     CAREERS_DIR.mkdir(parents=True, exist_ok=True)
 
-    wb = load_workbook(XLSX, data_only=True)
-    ws = wb[wb.sheetnames[0]]
+    try:
+        with metrics().stage("read_workbook"):
+            items = read_careers(args.xlsx)
+    except WorkbookError as e:
+        print(e)
+        return 2
 
-    header = [ws.cell(1, c).value for c in range(1, ws.max_column + 1)]
-    header = [str(x).strip() if x is not None else "" for x in header]
-    col = {name: i + 1 for i, name in enumerate(header) if name}
+    report = sync_careers(items)
+    print(f"Synced {len(items)} careers: {report.summary()}.")
+    if args.changes:
+        report.write_changes(args.changes)
+    return 0
 
-    required = ["Poster Title", "Description"]
-    missing = [c for c in required if c not in col]
-    if missing:
-        print(f"Missing expected columns: {missing}")
-        return 2
 
-    items = []
-    for r in range(2, ws.max_row + 1):
-        title = ws.cell(r, col["Poster Title"]).value
-        if not title or not str(title).strip():
-            continue
-        title = str(title).strip()
-        desc = str(ws.cell(r, col["Description"]).value or "").strip()
-
-        slug = slugify(title)
-        items.append(
-            {
-                "title": title,
-                "slug": slug,
-                "category": infer_category(title),
-                "description": desc,
-                "highSchool": [],
-                "college": [],
-                "career": [],
-                "imageDescription": "",
-                "imageQuery": image_query(title, ""),
-                "resources": [],
-            }
-        )
-
-    CAREERS_DATA_JS.write_text("window.SHT_CAREERS = " + json.dumps(items, indent=2) + ";\n", encoding="utf-8")
+def sync_careers(items: list[dict], previous: dict[str, dict] | None = None, media_changed: bool = True) -> OutputReport:
+    """
+    Write careers-data.js, the site data and a page per career, and remove
+    pages of careers no longer in `items`. With `previous` (slug -> career as
+    last synced), pages and shards are only rendered for careers that differ
+    from it; `media_changed` forces every shard (doc-media.js feeds them).
+    """
+    dirty = None if previous is None else {c["slug"] for c in items if previous.get(c["slug"]) != c}
+    report = OutputReport()
+    write_careers(report, items, dirty)
+    with metrics().stage("site_data"):
+        write_site_data(report, items, read_doc_media(), shards=None if media_changed else dirty)
+    with metrics().stage("commit"):
+        report.commit()
+    return report
+
+
+def write_careers(report: OutputReport, items: list[dict], dirty: set[str] | None = None) -> None:
+    """
+    Stage careers-data.js and the page of every career in `dirty` (all of
+    them if None), and the removal of pages of careers no longer in `items`.
+    """
+    report.write_text(CAREERS_DATA_JS, render_careers_data(items))
 
     # Generate pages
     required_slugs = set()
     for c in items:
-        title = c["title"]
-        slug = c["slug"]
-        required_slugs.add(slug)
-        article = choose_article(title)
-        meta_desc = c["description"] or f"Launch your future as {article} {title}—explore high school courses, college majors, and career roles."
-        html = PAGE_TMPL.format(
-            title=title,
-            slug=slug,
-            article=article,
-            desc=c["description"],
-            meta_desc=meta_desc.replace('"', "&quot;"),
-            img_desc=c["imageDescription"] or title,
-        )
-        (CAREERS_DIR / f"{slug}.html").write_text(html, encoding="utf-8")
+        required_slugs.add(c["slug"])
+        if dirty is not None and c["slug"] not in dirty:
+            continue
+        with metrics().career(c["slug"]):
+            with metrics().stage("render"):
+                page = render_page(c, current_doc_panels(c["slug"], report))
+            with metrics().stage("write"):
+                report.write_text(CAREERS_DIR / f"{c['slug']}.html", page)
 
     # Remove pages no longer present
-    for f in CAREERS_DIR.glob("*.html"):
+    for f in sorted(CAREERS_DIR.glob("*.html")):
         if f.stem not in required_slugs:
-            f.unlink()
-
-    print(f"Synced {len(items)} careers, wrote careers-data.js, and regenerated career pages.")
-    return 0
+            report.remove(f)
+
+
+def _mtime(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _watch(args: argparse.Namespace) -> int:
+    print(f"Watching {args.xlsx} (Ctrl+C to stop)")
+    previous: dict[str, dict] | None = None
+    seen = None
+    media_seen = None
+    try:
+        while True:
+            sig, media_sig = _mtime(args.xlsx), _mtime(DOC_MEDIA_JS)
+            if (sig, media_sig) == (seen, media_seen) or sig is None:
+                time.sleep(args.interval)
+                continue
+            time.sleep(min(args.interval, 0.2))
+            if _mtime(args.xlsx) != sig:
+                continue  # still being saved
+            run = build_metrics.begin("sync_from_xlsx")
+            try:
+                with output_lock():
+                    with metrics().stage("read_workbook"):
+                        items = read_careers(args.xlsx)
+                    report = sync_careers(items, previous, media_changed=media_sig != media_seen)
+            except (WorkbookError, zipfile.BadZipFile, KeyError, OSError) as e:
+                # Excel may still be writing the file, or the sheet is mid-edit.
+                print(f"Skipped {args.xlsx.name}: {e.__class__.__name__}: {e}")
+                seen, media_seen = sig, media_sig
+                continue
+            run.finish()
+            changed = _diff_summary(previous, items)
+            print(f"[{time.strftime('%H:%M:%S')}] {changed} in {run.wall:.2f}s: {report.summary()}.")
+            if args.changes:
+                report.write_changes(args.changes)
+            previous = {c["slug"]: c for c in items}
+            seen, media_seen = sig, media_sig
+    except KeyboardInterrupt:
+        return 0
+
+
+def _diff_summary(previous: dict[str, dict] | None, items: list[dict]) -> str:
+    if previous is None:
+        return f"Synced {len(items)} careers"
+    current = {c["slug"]: c for c in items}
+    added = sum(1 for s in current if s not in previous)
+    removed = sum(1 for s in previous if s not in current)
+    changed = sum(1 for s, c in current.items() if s in previous and previous[s] != c)
+    return f"{added} added, {changed} changed, {removed} removed careers"
 
 
 if __name__ == "__main__":